@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""휴식 요약 렌더링 경로의 지연 시간과 할당량을 비교하는 마이크로벤치마크.
+
+``python -m benchmarks.bench_rendering``으로 실행하면 기존 방식(호출마다 문장
+목록 생성 → 콜론 치환 → 결합)과 컴파일된 시나리오 렌더링을 같은 시드로
+측정해 호출당 평균 지연과 최대 할당 바이트를 출력한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import Callable
+
+from src.chillmcp.routines import ROUTINES
+from src.chillmcp.state import ChillState, RoutineScenario
+
+Renderer = Callable[[RoutineScenario, ChillState], str]
+
+
+def render_legacy(scenario: RoutineScenario, state: ChillState) -> str:
+    """컴파일 이전 방식으로 요약 문자열을 만든다."""
+
+    parts = [scenario.headline]
+    parts.extend(scenario.render_details(state))
+    return " | ".join(part.replace(":", " -") for part in parts if part)
+
+
+def render_compiled(scenario: RoutineScenario, state: ChillState) -> str:
+    """컴파일된 시나리오로 요약 문자열을 만든다."""
+
+    return " | ".join(scenario.render_summary_parts(state))
+
+
+RENDERERS: dict[str, Renderer] = {
+    "legacy": render_legacy,
+    "compiled": render_compiled,
+}
+
+
+def _scenarios() -> list[RoutineScenario]:
+    return [scenario for routine in ROUTINES for scenario in routine.scenarios]
+
+
+def _check_equivalence(seed: int) -> None:
+    """두 경로가 같은 시드에서 동일한 문자열을 만드는지 확인한다."""
+
+    for scenario in _scenarios():
+        legacy_state = ChillState(rng_seed=seed)
+        compiled_state = ChillState(rng_seed=seed)
+        legacy = render_legacy(scenario, legacy_state)
+        compiled = render_compiled(scenario, compiled_state)
+        if legacy != compiled:
+            raise AssertionError(f"렌더링 결과가 다릅니다: {scenario.headline}")
+
+
+def measure(renderer: Renderer, *, number: int, repeat: int, seed: int) -> dict:
+    """렌더러 하나의 호출당 지연과 할당량을 측정한다."""
+
+    scenarios = _scenarios()
+    state = ChillState(rng_seed=seed)
+    for scenario in scenarios:
+        # 컴파일 비용은 첫 호출에서 한 번만 지불하므로 측정에서 제외한다.
+        renderer(scenario, state)
+
+    def run() -> None:
+        for scenario in scenarios:
+            renderer(scenario, state)
+
+    timings = timeit.repeat(run, number=number, repeat=repeat)
+    calls = number * len(scenarios)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    peak_per_call = 0
+    for scenario in scenarios:
+        tracemalloc.reset_peak()
+        renderer(scenario, state)
+        _, peak = tracemalloc.get_traced_memory()
+        peak_per_call = max(peak_per_call, peak - baseline)
+    tracemalloc.stop()
+
+    return {
+        "calls": calls,
+        "best_us_per_call": min(timings) / calls * 1e6,
+        "median_us_per_call": sorted(timings)[len(timings) // 2] / calls * 1e6,
+        "peak_alloc_bytes_per_call": peak_per_call,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ChillMCP 렌더링 벤치마크")
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    _check_equivalence(args.seed)
+    results = {
+        name: measure(renderer, number=args.number, repeat=args.repeat, seed=args.seed)
+        for name, renderer in RENDERERS.items()
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, result in results.items():
+        print(
+            f"{name:>9}: {result['best_us_per_call']:.2f}µs/call (best), "
+            f"{result['median_us_per_call']:.2f}µs/call (median), "
+            f"peak {result['peak_alloc_bytes_per_call']}B/call"
+        )
+    speedup = (
+        results["legacy"]["best_us_per_call"] / results["compiled"]["best_us_per_call"]
+    )
+    print(f"speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
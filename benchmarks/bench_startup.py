@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""서버 기동 비용을 측정하는 벤치마크.
+
+``python -m benchmarks.bench_startup``은 두 가지를 측정한다.
+
+* ``python -X importtime``으로 각 진입점을 임포트할 때 누적 시간이 큰 모듈
+* ``main.py``를 새로 띄운 뒤 ``initialize`` 요청에 응답하기까지의 시간
+
+``--budget-ms``를 주면 time-to-first-response 중앙값이 예산을 넘을 때 0이 아닌
+코드로 종료하므로 CI에서 기동 시간 회귀를 잡을 수 있다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_TARGETS = {
+    "main": "import main",
+    "cli": "import src.chillmcp.cli",
+    "server": "import src.chillmcp.server",
+}
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "bench-startup", "version": "1.0"},
+    },
+}
+
+
+def measure_importtime(statement: str, *, top: int) -> dict[str, object]:
+    """``-X importtime`` 출력을 파싱해 총 시간과 누적 시간 상위 모듈을 반환한다."""
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: list[tuple[str, int, int]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    total_us = sum(self_us for _, self_us, _ in modules)
+    heaviest = sorted(modules, key=lambda item: item[2], reverse=True)[:top]
+    return {
+        "total_ms": total_us / 1000,
+        "modules": len(modules),
+        "top_cumulative_ms": {
+            name: cumulative / 1000 for name, _, cumulative in heaviest
+        },
+    }
+
+
+def measure_first_response(timeout: float) -> float:
+    """``main.py``를 띄우고 ``initialize`` 응답을 받을 때까지의 초를 반환한다."""
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=ROOT,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+    )
+    try:
+        assert process.stdin is not None and process.stdout is not None
+        process.stdin.write(json.dumps(INITIALIZE_REQUEST) + "\n")
+        process.stdin.flush()
+        deadline = started + timeout
+        while time.perf_counter() < deadline:
+            line = process.stdout.readline()
+            if not line:
+                break
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if message.get("id") == 1:
+                return time.perf_counter() - started
+        raise RuntimeError("initialize 응답을 받지 못했습니다.")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ChillMCP 기동 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="기동 측정 반복 횟수")
+    parser.add_argument("--top", type=int, default=8, help="출력할 상위 모듈 수")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="time-to-first-response 중앙값 예산. 넘으면 종료 코드 1",
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    imports = {
+        name: measure_importtime(statement, top=args.top)
+        for name, statement in IMPORT_TARGETS.items()
+    }
+    samples = [measure_first_response(args.timeout) for _ in range(args.runs)]
+    first_response = {
+        "runs": len(samples),
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+    results = {"imports": imports, "first_response": first_response}
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        for name, data in imports.items():
+            print(
+                f"[import {name}] total {data['total_ms']:.1f}ms ({data['modules']} modules)"
+            )
+            for module, cumulative in data["top_cumulative_ms"].items():
+                print(f"  {cumulative:9.1f}ms  {module}")
+        print(
+            f"[first response] median {first_response['median_ms']:.1f}ms "
+            f"(min {first_response['min_ms']:.1f}, max {first_response['max_ms']:.1f}, "
+            f"runs {first_response['runs']})"
+        )
+
+    if args.budget_ms is not None and first_response["median_ms"] > args.budget_ms:
+        print(
+            f"time-to-first-response {first_response['median_ms']:.1f}ms exceeds "
+            f"budget {args.budget_ms:.1f}ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
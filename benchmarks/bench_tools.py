@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""``tools/call`` 처리량과 꼬리 지연을 전송 방식별로 측정하는 벤치마크.
+
+``python -m benchmarks.bench_tools``는 ``ROUTINES``의 모든 루틴 도구를 돌아가며
+호출하고 전송 방식마다 다음을 측정한다.
+
+* ``inprocess``: 테스트와 같이 ``fastmcp.Client(server.mcp)``로 같은 프로세스 안에서 호출
+* ``stdio``: ``main.py``를 자식 프로세스로 띄워 stdio로 호출
+* ``http``: ``main.py --transport http``를 띄워 streamable HTTP로 호출
+
+결과는 calls/sec, p50/p99/p999 지연(ms), 측정 구간 동안의 서버 RSS 증가량(KiB)과
+측정 후 세션 상태 레지스트리 크기다. ``--session-isolation``을 주면 서버를 세션
+격리 모드로 띄우며, 연결이 하나뿐이므로 레지스트리 크기는 1 이하여야 한다
+(호출마다 세션이 늘면 RSS 증가량은 그 누수를 재는 셈이 된다).
+``--output``으로 JSON을 저장하고, 다음 실행에서 ``--baseline``으로 그 파일을 주면
+처리량 하락이나 p50/p99 상승이 ``--tolerance``를 넘는 항목을 보고하고 종료 코드 1을
+반환한다. 동시 호출 수가 다른 기준선 항목은 비교하지 않는다. 경보 지연이
+측정을 가리지 않도록 서버는 ``--boss_alertness 0``으로 띄운다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+from src.chillmcp.routines import ROUTINES
+from src.chillmcp.server import create_server
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODES = ("inprocess", "stdio", "http")
+
+# 비교 대상 지표와 "나빠지는" 방향 (+1: 커질수록 나쁨, -1: 작아질수록 나쁨).
+COMPARED_METRICS = {"calls_per_sec": -1, "p50_ms": 1, "p99_ms": 1}
+
+
+def _rss_kib(pid: int | None) -> int | None:
+    """``/proc``에서 프로세스의 현재 RSS(KiB)를 읽는다. 지원하지 않으면 None."""
+
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def _child_pid() -> int | None:
+    """현재 프로세스의 자식 프로세스 pid 하나를 찾는다 (stdio 서버용)."""
+
+    me = str(os.getpid())
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="ascii") as stat:
+                # pid (comm) state ppid ... : comm에 공백이 있을 수 있어 ')' 뒤를 자른다.
+                fields = stat.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if fields[1] == me:
+            return int(entry)
+    return None
+
+
+def _server_args(seed: int, session_isolation: bool) -> list[str]:
+    args = ["main.py", "--boss_alertness", "0", "--rng_seed", str(seed)]
+    if session_isolation:
+        args.append("--session-isolation")
+    return args
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@asynccontextmanager
+async def open_client(
+    mode: str, seed: int, session_isolation: bool = False
+) -> AsyncIterator[tuple[Client, Callable[[], int | None]]]:
+    """전송 방식에 맞는 클라이언트와 서버 pid 조회 함수를 준비한다."""
+
+    if mode == "inprocess":
+        server = create_server(
+            boss_alertness=0, rng_seed=seed, session_isolation=session_isolation
+        )
+        async with Client(server.mcp) as client:
+            yield client, os.getpid
+        return
+
+    if mode == "stdio":
+        with open(os.devnull, "w") as devnull:
+            transport = StdioTransport(
+                command=sys.executable,
+                args=_server_args(seed, session_isolation),
+                cwd=str(ROOT),
+                keep_alive=False,
+                log_file=devnull,
+            )
+            async with Client(transport) as client:
+                yield client, _child_pid
+        return
+
+    if mode != "http":
+        raise ValueError(f"알 수 없는 전송 방식입니다: {mode}")
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            *_server_args(seed, session_isolation),
+            "--transport",
+            "http",
+            "--port",
+            str(port),
+        ],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("HTTP 서버가 준비되지 않았습니다.") from None
+                await asyncio.sleep(0.05)
+        async with Client(f"http://127.0.0.1:{port}/mcp") as client:
+            yield client, lambda: process.pid
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """정렬된 표본에서 nearest-rank 백분위를 구한다."""
+
+    index = min(len(ordered) - 1, max(0, int(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+async def drive(client: Client, names: list[str], concurrency: int) -> list[float]:
+    """``names`` 순서대로 도구를 호출하고 호출별 지연(초)을 반환한다."""
+
+    latencies: list[float] = []
+    cursor = iter(names)
+
+    async def worker() -> None:
+        for name in cursor:
+            started = time.perf_counter()
+            await client.call_tool(name)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return latencies
+
+
+async def _session_count(client: Client) -> int | None:
+    """``get_metrics``에서 세션 레지스트리의 현재 크기를 읽는다. 격리가 꺼져 있으면 None."""
+
+    result = await client.call_tool("get_metrics")
+    sessions = json.loads(result.content[0].text).get("sessions")
+    return None if sessions is None else sessions["active"]
+
+
+async def measure(
+    mode: str,
+    *,
+    calls: int,
+    warmup: int,
+    concurrency: int,
+    seed: int,
+    session_isolation: bool = False,
+) -> dict[str, object]:
+    """전송 방식 하나의 처리량, 지연 백분위, RSS 증가량, 세션 수를 측정한다."""
+
+    routine_names = [routine.name for routine in ROUTINES]
+    async with open_client(mode, seed, session_isolation) as (client, server_pid):
+        await drive(client, routine_names * warmup, concurrency)
+        pid = server_pid()
+        rss_before = _rss_kib(pid)
+        names = [routine_names[i % len(routine_names)] for i in range(calls)]
+        started = time.perf_counter()
+        latencies = await drive(client, names, concurrency)
+        elapsed = time.perf_counter() - started
+        rss_after = _rss_kib(pid)
+        sessions = await _session_count(client)
+
+    ordered = sorted(latencies)
+    return {
+        "calls": len(latencies),
+        "routines": len(routine_names),
+        "concurrency": concurrency,
+        "calls_per_sec": len(latencies) / elapsed,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": _percentile(ordered, 0.50) * 1000,
+        "p99_ms": _percentile(ordered, 0.99) * 1000,
+        "p999_ms": _percentile(ordered, 0.999) * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "rss_before_kib": rss_before,
+        "rss_growth_kib": (
+            rss_after - rss_before
+            if rss_before is not None and rss_after is not None
+            else None
+        ),
+        "sessions": sessions,
+    }
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], tolerance: float
+) -> list[str]:
+    """기준선 대비 ``tolerance``보다 나빠진 지표를 설명하는 문자열 목록을 반환한다."""
+
+    regressions = []
+    for mode, current in results.items():
+        previous = baseline.get(mode)
+        if previous is None or previous.get("concurrency") != current.get(
+            "concurrency"
+        ):
+            # 동시 호출 수가 다르면 지연 분포를 비교할 수 없다.
+            continue
+        for metric, direction in COMPARED_METRICS.items():
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if change * direction > tolerance:
+                regressions.append(
+                    f"{mode}.{metric}: {before:.2f} -> {after:.2f} ({change:+.1%})"
+                )
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ChillMCP tools/call 벤치마크")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=MODES,
+        default=list(MODES),
+        help="측정할 전송 방식",
+    )
+    parser.add_argument("--calls", type=int, default=2000, help="측정 호출 수")
+    parser.add_argument("--warmup", type=int, default=3, help="루틴별 워밍업 호출 수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 호출 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--session-isolation",
+        action="store_true",
+        help="서버를 세션 격리 모드로 띄우고 세션 레지스트리 크기를 함께 보고",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    parser.add_argument(
+        "--baseline", type=Path, default=None, help="비교할 이전 결과 JSON"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="기준선 대비 허용하는 악화 비율 (기본 0.2 = 20%%)",
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = {
+        mode: asyncio.run(
+            measure(
+                mode,
+                calls=args.calls,
+                warmup=args.warmup,
+                concurrency=args.concurrency,
+                seed=args.seed,
+                session_isolation=args.session_isolation,
+            )
+        )
+        for mode in args.modes
+    }
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for mode, data in results.items():
+            growth = data["rss_growth_kib"]
+            sessions = data["sessions"]
+            print(
+                f"{mode:>9}: {data['calls_per_sec']:.0f} calls/s, "
+                f"p50 {data['p50_ms']:.2f}ms, p99 {data['p99_ms']:.2f}ms, "
+                f"p999 {data['p999_ms']:.2f}ms, "
+                f"rss {'n/a' if growth is None else f'{growth:+d}KiB'}, "
+                f"sessions {'n/a' if sessions is None else sessions}"
+            )
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"regression: {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
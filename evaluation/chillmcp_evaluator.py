@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import argparse
+import asyncio
 import json
+import os
+import queue
 import re
 import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional
 
 import sys
 
@@ -16,6 +23,13 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# 서버가 initialize에 응답하기까지 기다리는 최대 시간(초).
+READY_TIMEOUT = 30.0
+# 일반 요청의 응답을 기다리는 최대 시간(초). 20초 지연 테스트를 포함한다.
+RESPONSE_TIMEOUT = 60.0
+# AsyncMCPClient가 읽을 수 있는 stdout 한 줄의 최대 크기(바이트).
+STREAM_LIMIT = 4 * 1024 * 1024
+
 
 @dataclass
 class EvaluationResult:
@@ -27,8 +41,70 @@ class EvaluationResult:
     bonus: bool = False
 
 
+def _unwrap_payload(text: str) -> str:
+    """도구가 돌려준 ``{"content": [...]}`` JSON 문자열이면 안쪽 텍스트를 꺼낸다."""
+
+    try:
+        payload = json.loads(text)
+    except json.JSONDecodeError:
+        return text
+    if isinstance(payload, dict):
+        content = payload.get("content")
+        if content and isinstance(content, list) and isinstance(content[0], dict):
+            return content[0].get("text", text)
+    return text
+
+
+def _server_command(
+    boss_alertness: int, boss_alertness_cooldown: int, rng_seed: Optional[int]
+) -> List[str]:
+    """평가 대상 서버를 띄우는 명령줄을 만든다."""
+
+    args = [
+        sys.executable,
+        "-u",  # unbuffered 모드
+        str(PROJECT_ROOT / "main.py"),
+        "--boss_alertness",
+        str(boss_alertness),
+        "--boss_alertness_cooldown",
+        str(boss_alertness_cooldown),
+    ]
+    if rng_seed is not None:
+        args.extend(["--rng_seed", str(rng_seed)])
+    return args
+
+
+INITIALIZE_PARAMS = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "clientInfo": {"name": "ChillMCP-Evaluator", "version": "1.0.0"},
+}
+INITIALIZED_NOTIFICATION = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+
+def _tool_text(response: dict) -> str:
+    """``tools/call`` 응답에서 텍스트를 추출한다."""
+
+    if "error" in response:
+        raise RuntimeError(f"도구 호출 실패: {response['error']}")
+
+    # 결과에서 텍스트 추출
+    result = response.get("result", {})
+    if isinstance(result, dict):
+        content = result.get("content", [])
+        if content and isinstance(content, list):
+            return _unwrap_payload(content[0].get("text", ""))
+    return str(result)
+
+
 class MCPClient:
-    """MCP 서버와 stdio로 통신하는 클라이언트."""
+    """MCP 서버와 stdio로 통신하는 클라이언트.
+
+    고정 시간 대기 대신 ``initialize`` 응답을 준비 완료 신호로 사용한다.
+    stdout은 리더 스레드가 줄 단위로 큐에 넣어 응답 대기에 시간 제한을 걸 수
+    있게 하고, stderr는 별도 스레드가 계속 비워 서버 로그가 파이프를 채워
+    멈추는 일이 없게 한다.
+    """
 
     def __init__(
         self,
@@ -37,34 +113,61 @@ class MCPClient:
         rng_seed: Optional[int] = None,
     ):
         """서버 프로세스를 시작한다."""
-        args = [
-            sys.executable,
-            "-u",  # unbuffered 모드
-            str(PROJECT_ROOT / "main.py"),
-            "--boss_alertness",
-            str(boss_alertness),
-            "--boss_alertness_cooldown",
-            str(boss_alertness_cooldown),
-        ]
-        if rng_seed is not None:
-            args.extend(["--rng_seed", str(rng_seed)])
-
         self.process = subprocess.Popen(
-            args,
+            _server_command(boss_alertness, boss_alertness_cooldown, rng_seed),
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            bufsize=0,  # unbuffered
+            encoding="utf-8",
         )
         self.request_id = 0
         self._initialized = False
-
-        # 서버 시작 메시지 대기 (stderr에서)
-        time.sleep(0.5)
-
-    def _send_request(self, method: str, params: Optional[dict] = None) -> dict:
-        """JSON-RPC 요청을 보내고 응답을 받는다."""
+        self._lines: queue.Queue[Optional[str]] = queue.Queue()
+        self.stderr_tail: deque[str] = deque(maxlen=200)
+        threading.Thread(target=self._pump_stdout, daemon=True).start()
+        threading.Thread(target=self._pump_stderr, daemon=True).start()
+
+    def _pump_stdout(self) -> None:
+        for line in self.process.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def _pump_stderr(self) -> None:
+        for line in self.process.stderr:
+            self.stderr_tail.append(line.rstrip("\n"))
+
+    def _read_message(self, deadline: float) -> dict:
+        """JSON-RPC 메시지 한 줄을 마감 시각까지 기다려 읽는다."""
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("서버 응답 대기 시간을 초과했습니다")
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is None:
+                tail = " / ".join(list(self.stderr_tail)[-3:])
+                raise RuntimeError(f"서버로부터 응답을 받지 못했습니다 ({tail})")
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                # stdout에 섞인 비 JSON 출력은 건너뛴다.
+                continue
+
+    def _send_request(
+        self,
+        method: str,
+        params: Optional[dict] = None,
+        *,
+        timeout: float = RESPONSE_TIMEOUT,
+    ) -> dict:
+        """JSON-RPC 요청을 보내고 같은 id의 응답을 받는다."""
         self.request_id += 1
         request = {
             "jsonrpc": "2.0",
@@ -79,28 +182,20 @@ class MCPClient:
         self.process.stdin.write(request_line)
         self.process.stdin.flush()
 
-        # 응답 읽기
-        response_line = self.process.stdout.readline()
-        if not response_line:
-            raise RuntimeError("서버로부터 응답을 받지 못했습니다")
-
-        return json.loads(response_line)
+        # 응답 읽기 (중간에 끼어드는 알림은 건너뛴다)
+        deadline = time.monotonic() + timeout
+        while True:
+            message = self._read_message(deadline)
+            if message.get("id") == self.request_id:
+                return message
 
-    def initialize(self) -> dict:
-        """서버를 초기화한다."""
-        response = self._send_request(
-            "initialize",
-            {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "ChillMCP-Evaluator", "version": "1.0.0"},
-            },
-        )
+    def initialize(self, timeout: float = READY_TIMEOUT) -> dict:
+        """서버를 초기화한다. 응답이 오면 서버가 준비된 것이다."""
+        response = self._send_request("initialize", INITIALIZE_PARAMS, timeout=timeout)
         self._initialized = True
 
         # initialized 알림 전송
-        notification = {"jsonrpc": "2.0", "method": "notifications/initialized"}
-        notification_line = json.dumps(notification) + "\n"
+        notification_line = json.dumps(INITIALIZED_NOTIFICATION) + "\n"
         self.process.stdin.write(notification_line)
         self.process.stdin.flush()
 
@@ -120,69 +215,226 @@ class MCPClient:
         response = self._send_request(
             "tools/call", {"name": tool_name, "arguments": arguments or {}}
         )
-
-        if "error" in response:
-            raise RuntimeError(f"도구 호출 실패: {response['error']}")
-
-        # 결과에서 텍스트 추출
-        result = response.get("result", {})
-        if isinstance(result, dict):
-            content = result.get("content", [])
-            if content and isinstance(content, list):
-                return content[0].get("text", "")
-        return str(result)
+        return _tool_text(response)
 
     def close(self):
         """서버 프로세스를 종료한다."""
         if self.process.poll() is None:
             self.process.stdin.close()
-            self.process.wait(timeout=5)
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
         self.process.stdout.close()
         self.process.stderr.close()
 
+    def __enter__(self) -> "MCPClient":
+        return self
 
-def evaluate() -> List[EvaluationResult]:
-    """모든 핵심 및 가산 항목을 검사한다."""
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
-    results: List[EvaluationResult] = []
 
-    # 1. 커맨드라인 파라미터 테스트
-    try:
-        client = MCPClient(boss_alertness=77, boss_alertness_cooldown=33, rng_seed=9)
-        time.sleep(1)  # 서버 시작 대기
-        client.initialize()
+class AsyncMCPClient:
+    """요청을 JSON-RPC id로 파이프라이닝하는 asyncio 기반 stdio 클라이언트.
 
-        # 서버가 정상적으로 시작되고 파라미터를 받았는지 확인
-        tools_response = client.list_tools()
+    요청은 응답을 기다리지 않고 연달아 보낼 수 있으며, 리더 태스크가 도착한
+    응답을 id로 찾아 해당 future를 완료한다. stderr는 별도 태스크가 계속 읽어
+    최근 ``stderr_lines``줄만 보관하므로 서버 로그가 파이프를 채워 서버가 멈추는
+    일이 없다. 모든 요청에는 마감 시간이 걸린다.
 
-        # 도구 목록이 반환되면 서버가 정상 동작하는 것으로 판단
-        passed = "result" in tools_response and "tools" in tools_response.get(
-            "result", {}
-        )
+    ``async with await AsyncMCPClient.start(...) as client:`` 형태로 사용한다.
+    """
 
-        results.append(
-            EvaluationResult(
-                name="커맨드라인 파라미터 인식",
-                passed=passed,
-                detail=f"서버 시작 및 초기화 완료, 도구 수={len(tools_response.get('result', {}).get('tools', []))}",
-            )
+    def __init__(
+        self,
+        process: asyncio.subprocess.Process,
+        *,
+        stderr_lines: int = 200,
+        default_timeout: float = RESPONSE_TIMEOUT,
+    ) -> None:
+        self.process = process
+        self.default_timeout = default_timeout
+        self.stderr_tail: deque[str] = deque(maxlen=stderr_lines)
+        self._next_id = 0
+        self._pending: dict[int, asyncio.Future[dict]] = {}
+        self._closed_error: Optional[BaseException] = None
+        self._reader = asyncio.create_task(self._read_stdout())
+        self._stderr_reader = asyncio.create_task(self._drain_stderr())
+
+    @classmethod
+    async def start(
+        cls,
+        boss_alertness: int = 50,
+        boss_alertness_cooldown: int = 300,
+        rng_seed: Optional[int] = None,
+        **kwargs: Any,
+    ) -> "AsyncMCPClient":
+        """서버 프로세스를 시작하고 클라이언트를 만든다."""
+
+        process = await asyncio.create_subprocess_exec(
+            *_server_command(boss_alertness, boss_alertness_cooldown, rng_seed),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # tools/list 응답처럼 긴 한 줄도 읽을 수 있게 한다.
+            limit=STREAM_LIMIT,
         )
-        client.close()
-    except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="커맨드라인 파라미터 인식",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
+        return cls(process, **kwargs)
+
+    async def _read_stdout(self) -> None:
+        assert self.process.stdout is not None
+        try:
+            async for raw in self.process.stdout:
+                try:
+                    message = json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # stdout에 섞인 비 JSON 출력은 건너뛴다.
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+            error: BaseException = RuntimeError(
+                f"서버로부터 응답을 받지 못했습니다 ({self._stderr_summary()})"
             )
-        )
+        except Exception as exc:
+            error = exc
+        self._closed_error = error
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def _drain_stderr(self) -> None:
+        assert self.process.stderr is not None
+        async for raw in self.process.stderr:
+            self.stderr_tail.append(raw.decode("utf-8", "replace").rstrip("\n"))
+
+    def _stderr_summary(self) -> str:
+        return " / ".join(list(self.stderr_tail)[-3:])
+
+    async def _write(self, message: dict) -> None:
+        assert self.process.stdin is not None
+        self.process.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+        await self.process.stdin.drain()
+
+    async def request(
+        self,
+        method: str,
+        params: Optional[dict] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """JSON-RPC 요청을 보내고 같은 id의 응답을 마감 시간까지 기다린다."""
+
+        if self._closed_error is not None:
+            raise self._closed_error
+        self._next_id += 1
+        request_id = self._next_id
+        request: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params:
+            request["params"] = params
+        future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._write(request)
+            return await asyncio.wait_for(
+                future, timeout if timeout is not None else self.default_timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"{method} 응답 대기 시간을 초과했습니다 (id={request_id})"
+            ) from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def initialize(self, timeout: float = READY_TIMEOUT) -> dict:
+        """서버를 초기화한다. 응답이 오면 서버가 준비된 것이다."""
+
+        response = await self.request("initialize", INITIALIZE_PARAMS, timeout=timeout)
+        await self._write(INITIALIZED_NOTIFICATION)
+        return response
 
-    # 2. 연속 휴식 테스트 - 상사 경보 상승
-    try:
-        boss_alert_pattern = r"Boss Alert Level:\s*([0-5])"
-        client = MCPClient(
-            boss_alertness=100, boss_alertness_cooldown=9999, rng_seed=2024
+    async def list_tools(self) -> dict:
+        """사용 가능한 도구 목록을 조회한다."""
+
+        return await self.request("tools/list")
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Optional[dict] = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """도구를 호출하고 결과 텍스트를 반환한다."""
+
+        response = await self.request(
+            "tools/call",
+            {"name": tool_name, "arguments": arguments or {}},
+            timeout=timeout,
         )
+        return _tool_text(response)
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """stdin을 닫아 서버를 종료시키고, 시간 안에 끝나지 않으면 강제 종료한다."""
+
+        if self.process.returncode is None:
+            assert self.process.stdin is not None
+            self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        await asyncio.gather(self._reader, self._stderr_reader, return_exceptions=True)
+
+    async def __aenter__(self) -> "AsyncMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+@dataclass(frozen=True)
+class Check:
+    """독립된 서버 프로세스에서 실행되는 평가 항목 하나."""
+
+    name: str
+    run: Callable[[], EvaluationResult]
+    bonus: bool = False
+    # 대략적인 벽시계 소요 시간(초). 오래 걸리는 항목을 먼저 시작하는 데 쓴다.
+    expected_seconds: float = 1.0
+
+
+def check_cli_parameters() -> EvaluationResult:
+    """1. 커맨드라인 파라미터 테스트"""
+
+    with MCPClient(boss_alertness=77, boss_alertness_cooldown=33, rng_seed=9) as client:
+        client.initialize()
+
+        # 서버가 정상적으로 시작되고 파라미터를 받았는지 확인
+        tools_response = client.list_tools()
+
+    # 도구 목록이 반환되면 서버가 정상 동작하는 것으로 판단
+    passed = "result" in tools_response and "tools" in tools_response.get("result", {})
+    return EvaluationResult(
+        name="커맨드라인 파라미터 인식",
+        passed=passed,
+        detail=f"서버 시작 및 초기화 완료, 도구 수={len(tools_response.get('result', {}).get('tools', []))}",
+    )
+
+
+def check_consecutive_breaks() -> EvaluationResult:
+    """2. 연속 휴식 테스트 - 상사 경보 상승"""
+
+    boss_alert_pattern = r"Boss Alert Level:\s*([0-5])"
+    with MCPClient(
+        boss_alertness=100, boss_alertness_cooldown=9999, rng_seed=2024
+    ) as client:
         client.initialize()
 
         response1 = client.call_tool("take_a_break")
@@ -194,27 +446,20 @@ def evaluate() -> List[EvaluationResult]:
         response3 = client.call_tool("show_meme")
         boss_level_3 = int(re.search(boss_alert_pattern, response3).group(1))
 
-        results.append(
-            EvaluationResult(
-                name="연속 휴식 경보 상승",
-                passed=boss_level_3 >= 3,
-                detail=f"boss_alert_level: {boss_level_1} → {boss_level_2} → {boss_level_3}",
-            )
-        )
-        client.close()
-    except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="연속 휴식 경보 상승",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
-            )
-        )
+    return EvaluationResult(
+        name="연속 휴식 경보 상승",
+        passed=boss_level_3 >= 3,
+        detail=f"boss_alert_level: {boss_level_1} → {boss_level_2} → {boss_level_3}",
+    )
 
-    # 3. 스트레스 누적 테스트 - 여러 휴식 도구 호출로 스트레스 감소 확인
-    try:
-        stress_level_pattern = r"Stress Level:\s*(\d{1,3})"
-        client = MCPClient(boss_alertness=10, boss_alertness_cooldown=9999, rng_seed=1)
+
+def check_stress_management() -> EvaluationResult:
+    """3. 스트레스 누적 테스트 - 여러 휴식 도구 호출로 스트레스 감소 확인"""
+
+    stress_level_pattern = r"Stress Level:\s*(\d{1,3})"
+    with MCPClient(
+        boss_alertness=10, boss_alertness_cooldown=9999, rng_seed=1
+    ) as client:
         client.initialize()
 
         # 초기 스트레스 확인
@@ -226,26 +471,19 @@ def evaluate() -> List[EvaluationResult]:
         response2 = client.call_tool("watch_netflix")
         after_stress = int(re.search(stress_level_pattern, response2).group(1))
 
-        results.append(
-            EvaluationResult(
-                name="스트레스 관리 기능",
-                passed=after_stress != initial_stress,  # 스트레스 수치가 변동됨을 확인
-                detail=f"stress: {initial_stress} → {after_stress}",
-            )
-        )
-        client.close()
-    except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="스트레스 관리 기능",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
-            )
-        )
+    return EvaluationResult(
+        name="스트레스 관리 기능",
+        passed=after_stress != initial_stress,  # 스트레스 수치가 변동됨을 확인
+        detail=f"stress: {initial_stress} → {after_stress}",
+    )
 
-    # 4. 지연 테스트 - 최고 경보 시 응답 시간 측정
-    try:
-        client = MCPClient(boss_alertness=100, boss_alertness_cooldown=9999, rng_seed=2)
+
+def check_max_alert_delay() -> EvaluationResult:
+    """4. 지연 테스트 - 최고 경보 시 응답 시간 측정"""
+
+    with MCPClient(
+        boss_alertness=100, boss_alertness_cooldown=9999, rng_seed=2
+    ) as client:
         client.initialize()
 
         # Boss Alert 레벨을 최대로 올림
@@ -254,60 +492,43 @@ def evaluate() -> List[EvaluationResult]:
 
         # 최대 경보 상태에서 호출 시간 측정
         start_time = time.time()
-        response = client.call_tool("coffee_mission")
+        client.call_tool("coffee_mission")
         elapsed = time.time() - start_time
 
-        # 최고 경보 시 20초 지연이 있어야 함
-        results.append(
-            EvaluationResult(
-                name="Boss Alert 최대 지연",
-                passed=elapsed >= 15,  # 네트워크 오버헤드 감안하여 15초 이상
-                detail=f"지연 시간={elapsed:.1f}초",
-            )
-        )
-        client.close()
-    except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="Boss Alert 최대 지연",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
-            )
-        )
+    # 최고 경보 시 20초 지연이 있어야 함
+    return EvaluationResult(
+        name="Boss Alert 최대 지연",
+        passed=elapsed >= 15,  # 네트워크 오버헤드 감안하여 15초 이상
+        detail=f"지연 시간={elapsed:.1f}초",
+    )
 
-    # 5. 파싱 테스트 - 텍스트에서 수치 추출
-    try:
-        client = MCPClient(boss_alertness=35, boss_alertness_cooldown=120, rng_seed=3)
-        client.initialize()
 
+def check_response_parsing() -> EvaluationResult:
+    """5. 파싱 테스트 - 텍스트에서 수치 추출"""
+
+    with MCPClient(
+        boss_alertness=35, boss_alertness_cooldown=120, rng_seed=3
+    ) as client:
+        client.initialize()
         response = client.call_tool("coffee_mission")
-        stress_match = re.search(
-            r"^Stress Level: (?P<value>\d+)$", response, flags=re.MULTILINE
-        )
-        boss_match = re.search(
-            r"^Boss Alert Level: (?P<value>\d+)$", response, flags=re.MULTILINE
-        )
 
-        results.append(
-            EvaluationResult(
-                name="응답 파싱 가능성",
-                passed=bool(stress_match and boss_match),
-                detail=f"stress={stress_match.group('value') if stress_match else 'NA'}, boss={boss_match.group('value') if boss_match else 'NA'}",
-            )
-        )
-        client.close()
-    except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="응답 파싱 가능성",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
-            )
-        )
+    stress_match = re.search(
+        r"^Stress Level: (?P<value>\d+)$", response, flags=re.MULTILINE
+    )
+    boss_match = re.search(
+        r"^Boss Alert Level: (?P<value>\d+)$", response, flags=re.MULTILINE
+    )
+    return EvaluationResult(
+        name="응답 파싱 가능성",
+        passed=bool(stress_match and boss_match),
+        detail=f"stress={stress_match.group('value') if stress_match else 'NA'}, boss={boss_match.group('value') if boss_match else 'NA'}",
+    )
 
-    # 6. 쿨다운 테스트 - 시간 경과에 따른 경보 감소
-    try:
-        client = MCPClient(boss_alertness=100, boss_alertness_cooldown=3, rng_seed=4)
+
+def check_alert_cooldown() -> EvaluationResult:
+    """6. 쿨다운 테스트 - 시간 경과에 따른 경보 감소"""
+
+    with MCPClient(boss_alertness=100, boss_alertness_cooldown=3, rng_seed=4) as client:
         client.initialize()
 
         # Boss Alert 레벨을 올림
@@ -317,61 +538,44 @@ def evaluate() -> List[EvaluationResult]:
         response2 = client.call_tool("watch_netflix")
         boss_level_2 = int(re.search(r"Boss Alert Level: (\d+)", response2).group(1))
 
-        # 쿨다운 시간만큼 대기 (3초 * 2 = 6초 이상)
+        # 쿨다운 시간만큼 대기 (3초 * 2 = 6초 이상). 서버 쪽 시간 경과가 검사
+        # 대상이므로 이 대기는 준비 신호로 대체할 수 없다.
         time.sleep(7)
 
         # 다시 도구 호출하여 경보 레벨 확인
         response3 = client.call_tool("coffee_mission")
         boss_level_3 = int(re.search(r"Boss Alert Level: (\d+)", response3).group(1))
 
-        results.append(
-            EvaluationResult(
-                name="Boss Alert 쿨다운",
-                passed=boss_level_3 < boss_level_2,
-                detail=f"boss_alert_level: {boss_level_1} → {boss_level_2} → {boss_level_3}",
-            )
-        )
-        client.close()
-    except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="Boss Alert 쿨다운",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
-            )
-        )
+    return EvaluationResult(
+        name="Boss Alert 쿨다운",
+        passed=boss_level_3 < boss_level_2,
+        detail=f"boss_alert_level: {boss_level_1} → {boss_level_2} → {boss_level_3}",
+    )
 
-    # === 가산점 항목 ===
 
-    # 7. 치맥 프로토콜
-    try:
-        client = MCPClient(boss_alertness=35, boss_alertness_cooldown=120, rng_seed=5)
-        client.initialize()
+def check_chimaek() -> EvaluationResult:
+    """7. 치맥 프로토콜"""
 
+    with MCPClient(
+        boss_alertness=35, boss_alertness_cooldown=120, rng_seed=5
+    ) as client:
+        client.initialize()
         chimaek_response = client.call_tool("virtual_chimaek")
 
-        results.append(
-            EvaluationResult(
-                name="치맥 프로토콜",
-                passed="치킨" in chimaek_response and "🍻" in chimaek_response,
-                detail="치맥 호출 완료",
-                bonus=True,
-            )
-        )
-        client.close()
-    except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="치맥 프로토콜",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
-                bonus=True,
-            )
-        )
+    return EvaluationResult(
+        name="치맥 프로토콜",
+        passed="치킨" in chimaek_response and "🍻" in chimaek_response,
+        detail="치맥 호출 완료",
+        bonus=True,
+    )
 
-    # 8. 즉시 퇴근 모드
-    try:
-        client = MCPClient(boss_alertness=100, boss_alertness_cooldown=9999, rng_seed=6)
+
+def check_emergency_clockout() -> EvaluationResult:
+    """8. 즉시 퇴근 모드"""
+
+    with MCPClient(
+        boss_alertness=100, boss_alertness_cooldown=9999, rng_seed=6
+    ) as client:
         client.initialize()
 
         # 스트레스와 Boss Alert를 올림
@@ -381,57 +585,89 @@ def evaluate() -> List[EvaluationResult]:
         # 즉시 퇴근 호출
         exit_response = client.call_tool("emergency_clockout")
 
-        # 응답에서 수치 추출
-        stress_after = int(re.search(r"Stress Level: (\d+)", exit_response).group(1))
-        boss_after = int(re.search(r"Boss Alert Level: (\d+)", exit_response).group(1))
+    # 응답에서 수치 추출
+    stress_after = int(re.search(r"Stress Level: (\d+)", exit_response).group(1))
+    boss_after = int(re.search(r"Boss Alert Level: (\d+)", exit_response).group(1))
+    return EvaluationResult(
+        name="즉시 퇴근 모드",
+        passed=(stress_after == 0 and boss_after == 0),
+        detail=f"stress={stress_after}, boss={boss_after}",
+        bonus=True,
+    )
 
-        results.append(
-            EvaluationResult(
-                name="즉시 퇴근 모드",
-                passed=(stress_after == 0 and boss_after == 0),
-                detail=f"stress={stress_after}, boss={boss_after}",
-                bonus=True,
-            )
-        )
-        client.close()
-    except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="즉시 퇴근 모드",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
-                bonus=True,
-            )
-        )
 
-    # 9. 랜덤 회식 이벤트
-    try:
-        client = MCPClient(boss_alertness=35, boss_alertness_cooldown=120, rng_seed=7)
-        client.initialize()
+def check_company_dinner() -> EvaluationResult:
+    """9. 랜덤 회식 이벤트"""
 
+    with MCPClient(
+        boss_alertness=35, boss_alertness_cooldown=120, rng_seed=7
+    ) as client:
+        client.initialize()
         dinner_response = client.call_tool("company_dinner")
 
-        results.append(
-            EvaluationResult(
-                name="랜덤 회식 이벤트",
-                passed="Event Log:" in dinner_response
-                and "Lucky Draw:" in dinner_response,
-                detail="회식 시나리오 생성",
-                bonus=True,
-            )
-        )
-        client.close()
+    return EvaluationResult(
+        name="랜덤 회식 이벤트",
+        passed="Event Log:" in dinner_response and "Lucky Draw:" in dinner_response,
+        detail="회식 시나리오 생성",
+        bonus=True,
+    )
+
+
+CHECKS: List[Check] = [
+    Check("커맨드라인 파라미터 인식", check_cli_parameters),
+    Check("연속 휴식 경보 상승", check_consecutive_breaks),
+    Check("스트레스 관리 기능", check_stress_management),
+    Check("Boss Alert 최대 지연", check_max_alert_delay, expected_seconds=20.0),
+    Check("응답 파싱 가능성", check_response_parsing),
+    Check("Boss Alert 쿨다운", check_alert_cooldown, expected_seconds=7.0),
+    # === 가산점 항목 ===
+    Check("치맥 프로토콜", check_chimaek, bonus=True),
+    Check("즉시 퇴근 모드", check_emergency_clockout, bonus=True),
+    Check("랜덤 회식 이벤트", check_company_dinner, bonus=True),
+]
+
+
+def run_check(check: Check) -> EvaluationResult:
+    """항목 하나를 실행하고, 예외는 실패 결과로 바꾼다."""
+
+    try:
+        return check.run()
     except Exception as e:
-        results.append(
-            EvaluationResult(
-                name="랜덤 회식 이벤트",
-                passed=False,
-                detail=f"오류 발생: {str(e)}",
-                bonus=True,
-            )
+        return EvaluationResult(
+            name=check.name,
+            passed=False,
+            detail=f"오류 발생: {str(e)}",
+            bonus=check.bonus,
         )
 
-    return results
+
+def default_workers() -> int:
+    """기본 동시 실행 수.
+
+    서버 기동은 CPU를 쓰고 지연/쿨다운 검사는 대부분 잠들어 있으므로 코어 수보다
+    조금 많게 잡는다. 코어 수보다 훨씬 많이 띄우면 기동끼리 경합해 오히려 느려진다.
+    """
+
+    return min(len(CHECKS), (os.cpu_count() or 1) + 2)
+
+
+def evaluate(
+    *, parallel: bool = True, max_workers: Optional[int] = None
+) -> List[EvaluationResult]:
+    """모든 핵심 및 가산 항목을 검사한다.
+
+    각 항목은 자기 서버 프로세스를 띄우므로 서로 독립적이다. 기본적으로
+    스레드 풀에서 동시에 실행하되 ``expected_seconds``가 큰 항목부터 시작해
+    전체 소요 시간이 가장 느린 항목(20초 지연 테스트) 수준이 되도록 한다.
+    결과 순서는 항상 ``CHECKS`` 순서를 유지한다.
+    """
+
+    if not parallel:
+        return [run_check(check) for check in CHECKS]
+    schedule = sorted(CHECKS, key=lambda check: check.expected_seconds, reverse=True)
+    with ThreadPoolExecutor(max_workers=max_workers or default_workers()) as executor:
+        futures = {check.name: executor.submit(run_check, check) for check in schedule}
+        return [futures[check.name].result() for check in CHECKS]
 
 
 def summarise(results: Iterable[EvaluationResult]) -> str:
@@ -459,12 +695,26 @@ def summarise(results: Iterable[EvaluationResult]) -> str:
     return "\n".join(lines)
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """스크립트를 직접 실행할 때 평가를 수행한다."""
 
-    results = evaluate()
+    parser = argparse.ArgumentParser(description="ChillMCP 자동 평가")
+    parser.add_argument(
+        "--serial", action="store_true", help="항목을 하나씩 순서대로 실행합니다."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="동시에 실행할 항목 수 (기본: CPU 코어 수 + 2)",
+    )
+    args = parser.parse_args(argv)
+
+    started = time.monotonic()
+    results = evaluate(parallel=not args.serial, max_workers=args.workers)
     report = summarise(results)
     print(report)
+    print(f"\n⏱️ 총 소요 시간: {time.monotonic() - started:.1f}초")
 
 
 if __name__ == "__main__":
@@ -4,13 +4,22 @@
 from __future__ import annotations
 
 import sys
+from typing import Any
 
-from src.chillmcp import ChillServer, create_server, parse_args
+import src.chillmcp as _chillmcp
 from src.chillmcp.cli import main as _cli_main
 
 __all__ = ["ChillServer", "create_server", "parse_args"]
 
 
+def __getattr__(name: str) -> Any:
+    """서버 관련 이름은 처음 접근할 때 패키지에서 지연 임포트한다."""
+
+    if name in __all__:
+        return getattr(_chillmcp, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main(argv: list[str] | None = None) -> None:
     """명령행 인자를 전달받아 ChillMCP 서버를 실행한다."""
 
@@ -1,6 +1,36 @@
-"""ChillMCP 서버 패키지 초기화 모듈."""
+"""ChillMCP 서버 패키지 초기화 모듈.
 
-from .cli import main, parse_args
-from .server import ChillServer, create_server
+``ChillServer``/``create_server``는 fastmcp를 불러오므로 처음 접근할 때 임포트한다.
+패키지만 임포트하거나 ``parse_args``로 인자를 검증할 때는 기동 비용이 들지 않는다.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cli import main, parse_args
+    from .server import ChillServer, create_server
 
 __all__ = ["ChillServer", "create_server", "parse_args", "main"]
+
+_LAZY_ATTRS = {
+    "ChillServer": ".server",
+    "create_server": ".server",
+    "parse_args": ".cli",
+    "main": ".cli",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
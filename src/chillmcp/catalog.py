@@ -0,0 +1,368 @@
+"""외부 JSON/TOML 파일에서 휴식 루틴 카탈로그를 읽고 핫 리로드하는 모듈.
+
+카탈로그 파일은 다음과 같은 구조를 가진다. TOML에서는 같은 구조를
+``[[routines]]``/``[[routines.scenarios]]`` 테이블 배열로 표현한다.
+
+.. code-block:: json
+
+    {
+      "include_builtin": true,
+      "routines": [
+        {
+          "name": "tea_time",
+          "description": "따뜻한 차 한 잔으로 쉬어 가는 루틴",
+          "post_hook": null,
+          "scenarios": [
+            {
+              "headline": "탕비실에서 녹차를 우렸다.",
+              "stress_reduction": [10, 20],
+              "details": [
+                "Tea Log: 80℃ 물 200ml",
+                {"choice": ["Snack: 양갱", "Snack: 약과"]},
+                {"template": "Refill: {}잔", "randint": [1, 3]}
+              ]
+            }
+          ]
+        }
+      ]
+    }
+
+``include_builtin``이 참이면(기본값) 내장 ``ROUTINES`` 위에 파일의 루틴을
+이름 기준으로 덮어쓴다. ``python -m src.chillmcp.catalog``를 실행하면 내장
+카탈로그를 같은 형식의 JSON으로 출력하므로 편집용 템플릿으로 쓸 수 있다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Sequence
+
+from .routines import POST_HOOKS, ROUTINES
+from .state import BreakRoutine, Choice, DetailSlot, RandInt, RoutineScenario
+
+logger = logging.getLogger("ChillMCP")
+
+
+class CatalogError(ValueError):
+    """카탈로그 파일을 읽거나 검증하지 못했을 때 발생한다."""
+
+
+# 서버가 루틴과 별도로 등록하는 도구 이름. 루틴이 같은 이름을 쓰면 내장 도구에
+# 가려지고, 이후 리로드에서 그 루틴이 빠질 때 내장 도구가 함께 지워진다.
+RESERVED_TOOL_NAMES = frozenset(
+    {
+        "get_status",
+        "get_metrics",
+        "run_break_plan",
+        "wait_until_safe",
+        "break_history_query",
+        "advance_clock",
+    }
+)
+
+
+def _parse_detail(raw: Any, where: str) -> DetailSlot:
+    """디테일 항목 하나를 정적 문장 또는 난수 슬롯으로 변환한다."""
+
+    if isinstance(raw, str):
+        return raw
+    if isinstance(raw, Mapping):
+        if "choice" in raw:
+            options = raw["choice"]
+            if (
+                not isinstance(options, list)
+                or not options
+                or not all(isinstance(item, str) for item in options)
+            ):
+                raise CatalogError(
+                    f"{where}: choice는 비어 있지 않은 문자열 목록이어야 합니다."
+                )
+            return Choice(*options)
+        if "randint" in raw:
+            bounds = raw["randint"]
+            template = raw.get("template", "{}")
+            if (
+                not isinstance(bounds, list)
+                or len(bounds) != 2
+                or not all(isinstance(value, int) for value in bounds)
+                or bounds[0] > bounds[1]
+            ):
+                raise CatalogError(
+                    f"{where}: randint는 [low, high] 정수 쌍이어야 합니다."
+                )
+            if not isinstance(template, str) or template.count("{}") != 1:
+                raise CatalogError(
+                    f"{where}: template에는 '{{}}' 자리가 하나 있어야 합니다."
+                )
+            return RandInt(template, bounds[0], bounds[1])
+    raise CatalogError(f"{where}: 지원하지 않는 디테일 항목입니다: {raw!r}")
+
+
+def _parse_scenario(raw: Any, where: str) -> RoutineScenario:
+    if not isinstance(raw, Mapping):
+        raise CatalogError(f"{where}: 시나리오는 객체여야 합니다.")
+    headline = raw.get("headline")
+    if not isinstance(headline, str) or not headline:
+        raise CatalogError(f"{where}: headline이 필요합니다.")
+    reduction = raw.get("stress_reduction")
+    if (
+        not isinstance(reduction, list)
+        or len(reduction) != 2
+        or not all(isinstance(value, int) for value in reduction)
+        or not 0 <= reduction[0] <= reduction[1]
+    ):
+        raise CatalogError(
+            f"{where}: stress_reduction은 [low, high] 정수 쌍이어야 합니다."
+        )
+    details = raw.get("details", [])
+    if not isinstance(details, list):
+        raise CatalogError(f"{where}: details는 목록이어야 합니다.")
+    return RoutineScenario(
+        headline=headline,
+        stress_reduction=(reduction[0], reduction[1]),
+        detail_lines=tuple(
+            _parse_detail(item, f"{where}.details[{index}]")
+            for index, item in enumerate(details)
+        ),
+    )
+
+
+def _parse_routine(raw: Any, where: str) -> BreakRoutine:
+    if not isinstance(raw, Mapping):
+        raise CatalogError(f"{where}: 루틴은 객체여야 합니다.")
+    name = raw.get("name")
+    if not isinstance(name, str) or not name.isidentifier():
+        raise CatalogError(
+            f"{where}: name은 도구 이름으로 쓸 수 있는 식별자여야 합니다."
+        )
+    if name in RESERVED_TOOL_NAMES:
+        raise CatalogError(
+            f"{where}: '{name}'은 서버 내장 도구 이름이라 쓸 수 없습니다."
+        )
+    hook_name = raw.get("post_hook")
+    if hook_name is not None and hook_name not in POST_HOOKS:
+        raise CatalogError(
+            f"{where}: 알 수 없는 post_hook '{hook_name}' "
+            f"(사용 가능: {', '.join(sorted(POST_HOOKS))})"
+        )
+    scenarios = raw.get("scenarios")
+    if not isinstance(scenarios, list) or not scenarios:
+        raise CatalogError(f"{where}: scenarios가 최소 한 개 필요합니다.")
+    routine = BreakRoutine(
+        name=name,
+        scenarios=tuple(
+            _parse_scenario(item, f"{where}.scenarios[{index}]")
+            for index, item in enumerate(scenarios)
+        ),
+        post_hook=POST_HOOKS[hook_name] if hook_name is not None else None,
+        description=str(raw.get("description", "")),
+    )
+    for scenario in routine.scenarios:
+        # 잘못된 슬롯은 교체 전에 드러나도록 로드 시점에 컴파일한다.
+        scenario.compiled
+    return routine
+
+
+def parse_catalog(
+    data: Mapping[str, Any],
+    *,
+    builtin: Sequence[BreakRoutine] = ROUTINES,
+) -> dict[str, BreakRoutine]:
+    """카탈로그 문서를 검증하고 이름별 루틴 사전으로 변환한다."""
+
+    if not isinstance(data, Mapping):
+        raise CatalogError("카탈로그 최상위는 객체여야 합니다.")
+    raw_routines = data.get("routines", [])
+    if not isinstance(raw_routines, list):
+        raise CatalogError("routines는 목록이어야 합니다.")
+
+    routines: dict[str, BreakRoutine] = {}
+    if data.get("include_builtin", True):
+        routines.update((routine.name, routine) for routine in builtin)
+    seen: set[str] = set()
+    for index, raw in enumerate(raw_routines):
+        routine = _parse_routine(raw, f"routines[{index}]")
+        if routine.name in seen:
+            raise CatalogError(
+                f"routines[{index}]: '{routine.name}' 이름이 중복되었습니다."
+            )
+        seen.add(routine.name)
+        routines[routine.name] = routine
+    if not routines:
+        raise CatalogError("등록할 루틴이 하나도 없습니다.")
+    return routines
+
+
+def load_catalog_file(
+    path: str | os.PathLike[str],
+    *,
+    builtin: Sequence[BreakRoutine] = ROUTINES,
+) -> dict[str, BreakRoutine]:
+    """확장자에 따라 JSON 또는 TOML 카탈로그 파일을 읽는다."""
+
+    path = Path(path)
+    try:
+        raw = path.read_bytes()
+        if path.suffix.lower() == ".toml":
+            import tomllib
+
+            data = tomllib.loads(raw.decode("utf-8"))
+        else:
+            data = json.loads(raw)
+    except (OSError, UnicodeDecodeError, ValueError) as exc:
+        raise CatalogError(f"{path}: 카탈로그를 읽지 못했습니다 ({exc})") from exc
+    return parse_catalog(data, builtin=builtin)
+
+
+def _detail_to_dict(slot: DetailSlot) -> Any:
+    if isinstance(slot, Choice):
+        return {"choice": list(slot.options)}
+    if isinstance(slot, RandInt):
+        return {"template": slot.template, "randint": [slot.low, slot.high]}
+    return slot
+
+
+def routine_to_dict(routine: BreakRoutine) -> dict[str, Any]:
+    """루틴을 카탈로그 파일 형식의 사전으로 변환한다."""
+
+    hook_names = {hook: name for name, hook in POST_HOOKS.items()}
+    scenarios = []
+    for scenario in routine.scenarios:
+        if callable(scenario.detail_lines):
+            raise CatalogError(
+                f"'{routine.name}'의 팩토리 기반 시나리오는 내보낼 수 없습니다."
+            )
+        scenarios.append(
+            {
+                "headline": scenario.headline,
+                "stress_reduction": list(scenario.stress_reduction),
+                "details": [
+                    _detail_to_dict(slot) for slot in scenario.detail_lines or ()
+                ],
+            }
+        )
+    return {
+        "name": routine.name,
+        "description": routine.description,
+        "post_hook": hook_names.get(routine.post_hook),
+        "scenarios": scenarios,
+    }
+
+
+class RoutineCatalog:
+    """현재 루틴 스냅샷을 보관하고 파일이 바뀌면 통째로 교체하는 카탈로그.
+
+    스냅샷은 읽기 전용 매핑이며, 리로드는 새 매핑을 끝까지 검증한 뒤 참조
+    하나만 바꿔 끼운다. 진행 중인 호출은 시작할 때 꺼낸 ``BreakRoutine``을
+    그대로 사용하므로 교체 도중에도 반쯤 바뀐 루틴을 보는 일이 없다.
+    파일 변경 확인은 요청이 들어올 때 ``reload_interval``초에 한 번만 수행한다.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        builtin: Sequence[BreakRoutine] = ROUTINES,
+        reload_interval: float = 2.0,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.reload_interval = reload_interval
+        self._builtin = builtin
+        self._time_fn = time_fn
+        self._reload_lock = threading.Lock()
+        self._next_check = 0.0
+        self._signature: tuple[int, int] | None = None
+        self.version = 0
+        self.reload_errors = 0
+        if self.path is None:
+            routines = {routine.name: routine for routine in builtin}
+        else:
+            self._signature = self._stat_signature()
+            routines = load_catalog_file(self.path, builtin=builtin)
+            self._next_check = time_fn() + reload_interval
+        self._snapshot: Mapping[str, BreakRoutine] = MappingProxyType(routines)
+
+    def snapshot(self) -> Mapping[str, BreakRoutine]:
+        """현재 카탈로그의 읽기 전용 스냅샷을 반환한다."""
+
+        return self._snapshot
+
+    def get(self, name: str) -> BreakRoutine | None:
+        """이름에 해당하는 루틴을 현재 스냅샷에서 찾는다."""
+
+        return self._snapshot.get(name)
+
+    def _stat_signature(self) -> tuple[int, int] | None:
+        """변경 감지에 쓰는 (mtime, 크기) 쌍을 반환한다."""
+
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def maybe_reload(self, *, force: bool = False) -> bool:
+        """파일이 바뀌었으면 다시 읽어 스냅샷을 교체하고, 교체 여부를 반환한다.
+
+        새 파일이 잘못되었으면 경고만 남기고 기존 스냅샷을 유지한다.
+        """
+
+        if self.path is None:
+            return False
+        now = self._time_fn()
+        if not force and now < self._next_check:
+            return False
+        if not self._reload_lock.acquire(blocking=False):
+            # 다른 스레드가 이미 확인 중이다.
+            return False
+        try:
+            self._next_check = now + self.reload_interval
+            signature = self._stat_signature()
+            if signature is None or (signature == self._signature and not force):
+                return False
+            self._signature = signature
+            try:
+                routines = load_catalog_file(self.path, builtin=self._builtin)
+            except CatalogError as exc:
+                self.reload_errors += 1
+                logger.warning(
+                    "Routine catalog reload failed; keeping previous: %s", exc
+                )
+                return False
+            self._snapshot = MappingProxyType(routines)
+            self.version += 1
+            logger.info(
+                "Routine catalog reloaded from %s (version=%d, routines=%d)",
+                self.path,
+                self.version,
+                len(routines),
+            )
+            return True
+        finally:
+            self._reload_lock.release()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """내장 카탈로그를 JSON 템플릿으로 출력한다."""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ChillMCP 내장 루틴 카탈로그 내보내기")
+    parser.add_argument("--indent", type=int, default=2, help="JSON 들여쓰기 칸 수")
+    args = parser.parse_args(argv)
+    document = {
+        "include_builtin": False,
+        "routines": [routine_to_dict(routine) for routine in ROUTINES],
+    }
+    print(json.dumps(document, ensure_ascii=False, indent=args.indent))
+
+
+if __name__ == "__main__":
+    main()
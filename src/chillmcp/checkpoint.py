@@ -0,0 +1,206 @@
+"""ChillState를 파일에 체크포인트하고 재시작할 때 복원하는 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger("ChillMCP")
+
+CHECKPOINT_VERSION = 1
+
+CheckpointDocument = dict[str, object]
+
+
+class StateCheckpointer:
+    """상태 체크포인트를 주기적으로, 그리고 종료할 때 파일 하나에 기록한다.
+
+    커밋은 ``mark_dirty``로 표시만 하고, 이벤트 루프 타이머 하나가
+    ``interval``초에 최대 한 번 ``collect``로 문서를 만든다. 상태 변경은 모두
+    루프 위에서 동기적으로 끝나므로 루프에서 모은 문서는 항상 일관된 시점이다.
+    JSON 직렬화, 쓰기, fsync, ``os.replace``는 백그라운드 스레드가 맡고, 쓰는
+    동안 새 문서가 들어오면 가장 최근 것만 남겨 다음 쓰기 한 번으로 묶는다.
+    따라서 도구 호출 경로에는 파일 입출력이 없다.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        collect: Callable[[], CheckpointDocument],
+        interval: float = 30.0,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.interval = max(0.0, interval)
+        self._collect = collect
+        self._time_fn = time_fn
+        self._last_collect = float("-inf")
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_loop: asyncio.AbstractEventLoop | None = None
+        self._pending: CheckpointDocument | None = None
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self.collected = 0
+        self.coalesced = 0
+        self.writes = 0
+        self.write_errors = 0
+        self.last_write_ms = 0.0
+        self.last_write_bytes = 0
+
+    def load(self) -> CheckpointDocument | None:
+        """체크포인트 파일을 한 번 읽어 반환한다. 없으면 None."""
+
+        try:
+            with open(self.path, "rb") as handle:
+                document = json.loads(handle.read())
+        except FileNotFoundError:
+            return None
+        if (
+            not isinstance(document, dict)
+            or document.get("version") != CHECKPOINT_VERSION
+        ):
+            raise ValueError(f"지원하지 않는 체크포인트 형식입니다: {self.path}")
+        # 복원할 때 시각을 옮기는 데 쓰는 값이라, 없으면 상태를 하나도 믿을 수 없다.
+        offset = document.get("clock_offset")
+        if (
+            not _is_number(document.get("clock_time"))
+            or not (offset is None or _is_number(offset))
+            or not isinstance(document.get("states"), dict)
+        ):
+            raise ValueError(f"체크포인트에 필요한 항목이 없습니다: {self.path}")
+        return document
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="chillmcp-checkpoint", daemon=True
+        )
+        self._thread.start()
+
+    def mark_dirty(self) -> None:
+        """상태가 바뀌었음을 알린다. 필요하면 다음 수집 타이머를 건다."""
+
+        if self._timer is not None and not (
+            self._timer_loop is None or self._timer_loop.is_closed()
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 루프 밖의 변경은 종료 시 체크포인트에 포함된다.
+            return
+        delay = max(0.0, self._last_collect + self.interval - self._time_fn())
+        self._timer_loop = loop
+        self._timer = loop.call_later(delay, self._flush)
+
+    def close(self) -> None:
+        """스레드를 멈추고 현재 상태를 동기적으로 기록한다 (종료 시 체크포인트)."""
+
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = None
+        try:
+            self._write(self._collect_now())
+        except (OSError, TypeError, ValueError) as exc:
+            self.write_errors += 1
+            logger.warning("Failed to write checkpoint %s: %s", self.path, exc)
+
+    def stats(self) -> dict[str, object]:
+        """체크포인트 수집·기록 현황을 요약한다."""
+
+        return {
+            "collected": self.collected,
+            "coalesced": self.coalesced,
+            "writes": self.writes,
+            "write_errors": self.write_errors,
+            "last_write_ms": round(self.last_write_ms, 3),
+            "last_write_bytes": self.last_write_bytes,
+        }
+
+    def _collect_now(self) -> CheckpointDocument:
+        self._last_collect = self._time_fn()
+        self.collected += 1
+        return self._collect()
+
+    def _flush(self) -> None:
+        self._timer = None
+        document = self._collect_now()
+        with self._condition:
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = document
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                document, self._pending = self._pending, None
+            try:
+                self._write(document)
+            except (OSError, TypeError, ValueError) as exc:
+                self.write_errors += 1
+                logger.warning("Failed to write checkpoint %s: %s", self.path, exc)
+
+    def _write(self, document: CheckpointDocument) -> None:
+        """임시 파일에 쓰고 fsync한 뒤 원자적으로 교체한다."""
+
+        started = time.perf_counter()
+        data = json.dumps(document, separators=(",", ":")).encode("utf-8")
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".chillmcp-checkpoint-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        _fsync_directory(directory)
+        self.writes += 1
+        self.last_write_bytes = len(data)
+        self.last_write_ms = (time.perf_counter() - started) * 1000
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _fsync_directory(directory: str) -> None:
+    """교체한 파일 이름이 디스크에 남도록 디렉터리도 fsync한다 (지원할 때만)."""
+
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
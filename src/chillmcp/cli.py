@@ -4,9 +4,35 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+import signal
 import sys
 
-from .server import create_server
+from .clock import ScaledClock, VirtualClock, make_clock
+from .logging_pipeline import configure_logging
+
+
+class _ShutdownSignal(SystemExit):
+    """SIGTERM·SIGHUP으로 종료할 때 발생시키는 SystemExit."""
+
+
+def _exit_on_signal(signum: int, frame: object) -> None:
+    """종료 신호를 SystemExit로 바꿔 ``finally``의 종료 처리를 거치게 한다."""
+
+    raise _ShutdownSignal(128 + signum)
+
+
+def _install_shutdown_signals() -> None:
+    """SIGTERM·SIGHUP의 기본 동작(즉시 종료) 대신 정상 종료 경로를 타게 한다.
+
+    배포 도구의 ``kill``로 멈춰도 종료 시 체크포인트와 이벤트 기록이 남는다.
+    http/sse에서는 uvicorn이 SIGTERM을 직접 받아 서버를 정상 종료시킨다.
+    """
+
+    for name in ("SIGTERM", "SIGHUP"):
+        signum = getattr(signal, name, None)
+        if signum is not None:
+            signal.signal(signum, _exit_on_signal)
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -38,7 +64,237 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="재현 가능한 테스트를 위한 랜덤 시드 (선택 사항).",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--session-isolation",
+        dest="session_isolation",
+        action="store_true",
+        help="MCP 세션마다 독립적인 스트레스/보스 경보 상태를 유지합니다.",
+    )
+    parser.add_argument(
+        "--session-ttl",
+        dest="session_ttl",
+        type=float,
+        default=1800.0,
+        help="세션 상태를 유휴 상태로 보관하는 최대 시간(초). 0이면 만료하지 않습니다.",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        dest="max_sessions",
+        type=int,
+        default=4096,
+        help="동시에 보관할 세션 상태의 최대 개수. 초과 시 가장 오래된 세션부터 정리합니다.",
+    )
+    parser.add_argument(
+        "--trust-client-id",
+        dest="trust_client_id",
+        action="store_true",
+        help=(
+            "요청 _meta.client_id로 세션 상태를 고릅니다. 클라이언트가 임의로 보낼 수 "
+            "있는 값이므로 앞단에서 client_id를 검증하는 배포에서만 켜세요."
+        ),
+    )
+    parser.add_argument(
+        "--max-delayed-calls",
+        dest="max_delayed_calls",
+        type=int,
+        default=0,
+        help="보스 경보 지연을 동시에 기다릴 수 있는 호출 수 상한. 0이면 제한하지 않습니다.",
+    )
+    parser.add_argument(
+        "--delay-overflow",
+        dest="delay_overflow",
+        choices=("queue", "reject"),
+        default="queue",
+        help="지연 슬롯이 가득 찼을 때 대기열에 넣을지(queue) 즉시 거절할지(reject) 선택합니다.",
+    )
+    parser.add_argument(
+        "--max-delay-queue",
+        dest="max_delay_queue",
+        type=int,
+        default=1024,
+        help="지연 슬롯을 기다리는 대기열의 최대 길이. 초과한 호출은 거절됩니다.",
+    )
+    parser.add_argument(
+        "--routine-catalog",
+        dest="routine_catalog",
+        default=None,
+        help="휴식 루틴을 정의한 JSON/TOML 카탈로그 파일. 파일이 바뀌면 재시작 없이 다시 읽습니다.",
+    )
+    parser.add_argument(
+        "--catalog-reload-interval",
+        dest="catalog_reload_interval",
+        type=float,
+        default=2.0,
+        help="카탈로그 파일 변경을 확인하는 최소 간격(초).",
+    )
+    parser.add_argument(
+        "--output-profile",
+        dest="output_profile",
+        choices=("full", "compact", "numeric"),
+        default="full",
+        help=(
+            "휴식 응답의 상세 수준. compact는 헤드라인만, numeric은 수치 두 줄만 "
+            "반환합니다. 도구 호출의 output_profile 인자로 호출마다 바꿀 수 있습니다."
+        ),
+    )
+    parser.add_argument(
+        "--idempotency-ttl",
+        dest="idempotency_ttl",
+        type=float,
+        default=600.0,
+        help="idempotency_key로 저장한 휴식 결과를 재사용하는 시간(초). 0이면 만료 없음.",
+    )
+    parser.add_argument(
+        "--idempotency-max-entries",
+        dest="idempotency_max_entries",
+        type=int,
+        default=10000,
+        help="멱등성 캐시에 보관할 최대 결과 수. 초과하면 오래 쓰이지 않은 것부터 지웁니다.",
+    )
+    parser.add_argument(
+        "--state-notify-interval",
+        dest="state_notify_interval",
+        type=float,
+        default=1.0,
+        help="chillmcp://state 구독자에게 보내는 변경 알림의 최소 간격(초). 그 사이 변경은 한 번으로 묶습니다.",
+    )
+    parser.add_argument(
+        "--log-mode",
+        dest="log_mode",
+        choices=("sync", "async"),
+        default="sync",
+        help="async는 로그를 유한 큐에 넣고 백그라운드 스레드에서 출력해 도구 응답을 막지 않습니다.",
+    )
+    parser.add_argument(
+        "--log-format",
+        dest="log_format",
+        choices=("text", "json"),
+        default="text",
+        help="로그 출력 형식. json은 한 줄에 하나의 JSON 객체를 출력합니다.",
+    )
+    parser.add_argument(
+        "--log-sample-rate",
+        dest="log_sample_rate",
+        type=float,
+        default=1.0,
+        help="휴식 전후 상태 로그를 남길 비율(0-1). 다른 로그는 항상 남습니다.",
+    )
+    parser.add_argument(
+        "--log-queue-size",
+        dest="log_queue_size",
+        type=int,
+        default=10000,
+        help="async 로그 큐의 최대 길이. 가득 차면 레코드를 버리고 개수만 셉니다.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        dest="metrics_file",
+        default=None,
+        help="지표를 Prometheus 텍스트 형식으로 주기적으로 기록할 파일 경로 (선택 사항).",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        dest="metrics_interval",
+        type=float,
+        default=15.0,
+        help="--metrics-file을 다시 쓰는 간격(초).",
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        dest="checkpoint_file",
+        default=None,
+        help="상태를 주기적으로·종료 시 저장하고 시작할 때 복원할 파일 경로 (선택 사항).",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        dest="checkpoint_interval",
+        type=float,
+        default=30.0,
+        help="상태가 바뀌었을 때 --checkpoint-file을 다시 쓰는 최소 간격(초).",
+    )
+    parser.add_argument(
+        "--history-db",
+        dest="history_db",
+        default=None,
+        help="휴식 결과를 추가 전용 이벤트로 기록할 SQLite 파일 경로. 주면 break_history_query 도구가 켜집니다.",
+    )
+    parser.add_argument(
+        "--history-batch-size",
+        dest="history_batch_size",
+        type=int,
+        default=256,
+        help="--history-db에 한 트랜잭션으로 쓰는 최대 이벤트 수.",
+    )
+    parser.add_argument(
+        "--history-flush-interval",
+        dest="history_flush_interval",
+        type=float,
+        default=0.5,
+        help="배치가 차지 않아도 --history-db에 커밋하는 최대 대기 시간(초).",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=("stdio", "http", "sse"),
+        default="stdio",
+        help="MCP 전송 방식. http(streamable HTTP)/sse는 한 프로세스로 여러 에이전트를 받습니다.",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="http/sse 전송에서 바인딩할 주소.",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="http/sse 전송에서 바인딩할 포트.",
+    )
+    parser.add_argument(
+        "--http-path",
+        dest="http_path",
+        default=None,
+        help="MCP 엔드포인트 경로 (기본값: FastMCP 기본 경로, 예: /mcp).",
+    )
+    parser.add_argument(
+        "--max-connections",
+        dest="max_connections",
+        type=int,
+        default=0,
+        help="동시에 처리할 HTTP 연결 수 상한. 초과 연결은 503으로 거절합니다. 0이면 제한하지 않습니다.",
+    )
+    parser.add_argument(
+        "--keep-alive-timeout",
+        dest="keep_alive_timeout",
+        type=float,
+        default=5.0,
+        help="유휴 keep-alive 연결을 유지하는 시간(초).",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=2048,
+        help="accept 대기열 길이.",
+    )
+    clock_group = parser.add_mutually_exclusive_group()
+    clock_group.add_argument(
+        "--time-scale",
+        dest="time_scale",
+        type=float,
+        default=1.0,
+        help="상태 머신 시계를 가속하는 배율. 60이면 실제 1초가 1분으로 계산됩니다.",
+    )
+    clock_group.add_argument(
+        "--virtual-clock",
+        dest="virtual_clock",
+        action="store_true",
+        help="advance_clock 도구로만 흐르는 가상 시계를 사용합니다. 지연은 즉시 처리됩니다.",
+    )
+    args = parser.parse_args(argv)
+    if args.time_scale <= 0:
+        parser.error("--time-scale 값은 0보다 커야 합니다.")
+    if not 0.0 <= args.log_sample_rate <= 1.0:
+        parser.error("--log-sample-rate 값은 0과 1 사이여야 합니다.")
+    return args
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -46,14 +302,48 @@ def main(argv: list[str] | None = None) -> None:
 
     args = parse_args(argv)
 
-    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    # fastmcp/pydantic 임포트가 기동 시간의 대부분이므로, 인자 검증이 끝난 뒤에
+    # 불러와 --help나 잘못된 인자에는 즉시 응답한다.
+    from .catalog import CatalogError
+    from .metrics import PrometheusFileExporter
+    from .server import create_server
 
-    server = create_server(
-        boss_alertness=args.boss_alertness,
-        boss_alertness_cooldown=args.boss_alertness_cooldown,
-        stress_increase_rate=args.stress_increase_rate,
-        rng_seed=args.rng_seed,
+    log_pipeline = configure_logging(
+        mode=args.log_mode,
+        fmt=args.log_format,
+        sample_rate=args.log_sample_rate,
+        queue_size=args.log_queue_size,
+        stream=sys.stderr,
     )
+
+    try:
+        server = create_server(
+            boss_alertness=args.boss_alertness,
+            boss_alertness_cooldown=args.boss_alertness_cooldown,
+            stress_increase_rate=args.stress_increase_rate,
+            rng_seed=args.rng_seed,
+            session_isolation=args.session_isolation,
+            session_ttl=args.session_ttl,
+            max_sessions=args.max_sessions,
+            trust_client_id=args.trust_client_id,
+            clock=make_clock(time_scale=args.time_scale, virtual=args.virtual_clock),
+            max_delayed_calls=args.max_delayed_calls or None,
+            delay_overflow=args.delay_overflow,
+            max_delay_queue=args.max_delay_queue,
+            routine_catalog=args.routine_catalog,
+            catalog_reload_interval=args.catalog_reload_interval,
+            output_profile=args.output_profile,
+            idempotency_ttl=args.idempotency_ttl,
+            idempotency_max_entries=args.idempotency_max_entries,
+            state_notify_interval=args.state_notify_interval,
+            checkpoint_path=args.checkpoint_file,
+            checkpoint_interval=args.checkpoint_interval,
+            history_path=args.history_db,
+            history_batch_size=args.history_batch_size,
+            history_flush_interval=args.history_flush_interval,
+        )
+    except CatalogError as exc:
+        raise SystemExit(f"ChillMCP: {exc}") from exc
     logger = logging.getLogger("ChillMCP")
 
     logger.info("🚀 ChillMCP - 농땡이 자동화 서버를 부팅합니다...")
@@ -61,5 +351,90 @@ def main(argv: list[str] | None = None) -> None:
     logger.info(f"Boss alertness configured: {server.state.boss_alertness}")
     logger.info(f"Stress increase rate: {server.state.stress_increase_rate}/min")
     logger.info(f"Boss alertness cooldown: {server.state.boss_alertness_cooldown}s")
+    if isinstance(server.clock, VirtualClock):
+        logger.info("Virtual clock enabled: time advances via advance_clock only")
+    elif isinstance(server.clock, ScaledClock):
+        logger.info(f"Time scale: x{server.clock.scale}")
+    if server.delay_scheduler.max_active is not None:
+        logger.info(
+            f"Delayed call limit: {server.delay_scheduler.max_active} "
+            f"(overflow={server.delay_scheduler.policy})"
+        )
+    if server.sessions is not None:
+        logger.info(
+            f"Session isolation enabled: max_sessions={args.max_sessions}, "
+            f"ttl={args.session_ttl}s"
+        )
+        if server.trust_client_id:
+            logger.info("Session keys: trusting request _meta.client_id")
+
+    if server.catalog.path is not None:
+        logger.info(
+            f"Routine catalog: {server.catalog.path} "
+            f"({len(server.catalog.snapshot())} routines, "
+            f"reload every {args.catalog_reload_interval}s)"
+        )
+
+    if server.output_profile != "full":
+        logger.info(f"Output profile: {server.output_profile}")
+
+    if log_pipeline.mode == "async" or log_pipeline.sampler.rate < 1.0:
+        logger.info(
+            f"Logging: mode={log_pipeline.mode}, format={log_pipeline.format}, "
+            f"state sample rate={log_pipeline.sampler.rate}"
+        )
+
+    exporter: PrometheusFileExporter | None = None
+    if args.metrics_file:
+        exporter = PrometheusFileExporter(
+            server.metrics, args.metrics_file, args.metrics_interval
+        )
+        exporter.start()
+        logger.info(f"Metrics file: {args.metrics_file} (every {exporter.interval}s)")
+
+    if server.checkpointer is not None:
+        logger.info(
+            f"Checkpoint file: {server.checkpointer.path} "
+            f"(every {server.checkpointer.interval}s while state changes, and on shutdown)"
+        )
+
+    if server.history is not None:
+        logger.info(
+            f"Break history: {server.history.path} "
+            f"(batch {server.history.batch_size}, flush {server.history.flush_interval}s)"
+        )
 
-    server.run(transport="stdio")
+    _install_shutdown_signals()
+    signal_exit: int | None = None
+    try:
+        if args.transport != "stdio":
+            logger.info(
+                f"Transport: {args.transport} on {args.host}:{args.port} "
+                f"(max_connections={args.max_connections or 'unlimited'}, "
+                f"keep_alive={args.keep_alive_timeout}s)"
+            )
+        server.run(
+            transport=args.transport,
+            host=args.host,
+            port=args.port,
+            path=args.http_path,
+            max_connections=args.max_connections or None,
+            keep_alive_timeout=args.keep_alive_timeout,
+            backlog=args.backlog,
+        )
+    except _ShutdownSignal as exc:
+        signal_exit = int(exc.code)
+    finally:
+        if server.checkpointer is not None:
+            server.checkpointer.close()
+        if server.history is not None:
+            server.history.close()
+        if exporter is not None:
+            exporter.stop()
+        log_pipeline.stop()
+    if signal_exit is not None:
+        # stdio 전송은 stdin을 읽는 작업 스레드를 깨울 수 없어, 인터프리터 종료가
+        # 그 스레드를 기다리며 멈춘다. 정리는 끝났으므로 프로세스를 바로 끝낸다.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(signal_exit)
@@ -0,0 +1,89 @@
+"""ChillState에 주입할 가속/가상 시계를 정의하는 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Callable
+
+
+class ScaledClock:
+    """실제 단조 시계를 ``scale``배 빠르게 흐르도록 변환한다.
+
+    ``scale=60``이면 실제 1초가 상태 머신에서는 1분으로 계산되고,
+    20초 보스 경보 지연도 실제로는 약 0.33초만 대기한다.
+    """
+
+    def __init__(
+        self,
+        scale: float,
+        *,
+        base_time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if scale <= 0:
+            raise ValueError("time scale은 0보다 커야 합니다.")
+        self.scale = scale
+        self._base_time_fn = base_time_fn
+        self._origin = base_time_fn()
+
+    def time(self) -> float:
+        """가속된 현재 시각을 반환한다."""
+
+        return self._origin + (self._base_time_fn() - self._origin) * self.scale
+
+    async def sleep(self, seconds: float) -> None:
+        """가속 비율만큼 줄어든 실제 시간 동안 대기한다."""
+
+        await asyncio.sleep(max(0.0, seconds) / self.scale)
+
+
+class VirtualClock:
+    """명시적으로 전진시킬 때만 흐르는 가상 시계.
+
+    ``sleep``은 실제로 기다리지 않고 요청된 시간만큼 시계를 즉시 앞당긴다.
+    따라서 보스 경보 지연과 쿨다운이 모두 벽시계와 무관하게 처리된다.
+    ``add_listener``로 등록한 콜백은 시계가 전진할 때마다 새 시각과 함께 불린다.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+        self._listeners: list[Callable[[float], None]] = []
+
+    def time(self) -> float:
+        """현재 가상 시각을 반환한다."""
+
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        """가상 시각을 ``seconds``만큼 전진시키고 새 시각을 반환한다."""
+
+        if seconds < 0:
+            raise ValueError("가상 시계는 뒤로 돌릴 수 없습니다.")
+        self._now += seconds
+        for listener in list(self._listeners):
+            listener(self._now)
+        return self._now
+
+    def add_listener(self, listener: Callable[[float], None]) -> None:
+        """시계가 전진할 때마다 새 시각으로 호출할 콜백을 등록한다."""
+
+        self._listeners.append(listener)
+
+    async def sleep(self, seconds: float) -> None:
+        """대기 대신 시계를 전진시키고 이벤트 루프에 제어권만 넘긴다."""
+
+        self.advance(max(0.0, seconds))
+        await asyncio.sleep(0)
+
+
+Clock = ScaledClock | VirtualClock
+
+
+def make_clock(*, time_scale: float = 1.0, virtual: bool = False) -> Clock | None:
+    """CLI 옵션에 맞는 시계를 만들고, 실제 시계를 쓰면 ``None``을 반환한다."""
+
+    if virtual:
+        return VirtualClock()
+    if time_scale != 1.0:
+        return ScaledClock(time_scale)
+    return None
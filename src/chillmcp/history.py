@@ -0,0 +1,374 @@
+"""휴식 결과를 SQLite에 추가 전용 이벤트로 남기고 집계를 제공하는 모듈."""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Callable, Literal, Sequence
+
+from .state import BreakOutcome
+
+logger = logging.getLogger("ChillMCP")
+
+HistoryGroupBy = Literal["routine", "day", "scenario", "session"]
+HistoryOrderBy = Literal["count", "avg_reduction", "total_reduction", "avg_delay"]
+
+HISTORY_GROUP_BY: tuple[str, ...] = ("routine", "day", "scenario", "session")
+HISTORY_ORDER_BY: tuple[str, ...] = (
+    "count",
+    "avg_reduction",
+    "total_reduction",
+    "avg_delay",
+)
+
+SCHEMA_VERSION = 1
+SECONDS_PER_DAY = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS break_events (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    day INTEGER NOT NULL,
+    session TEXT NOT NULL,
+    routine TEXT NOT NULL,
+    scenario_index INTEGER NOT NULL,
+    stress_reduction INTEGER NOT NULL,
+    stress_after REAL NOT NULL,
+    alert_before INTEGER NOT NULL,
+    alert_after INTEGER NOT NULL,
+    delay_seconds REAL NOT NULL,
+    commit_seq INTEGER NOT NULL
+);
+-- 기간 조건의 시나리오·세션별 집계가 테이블을 읽지 않도록 필요한 열을 모두 담는다.
+CREATE INDEX IF NOT EXISTS break_events_by_time ON break_events (
+    ts, routine, scenario_index, session,
+    stress_reduction, delay_seconds, alert_before, alert_after
+);
+CREATE INDEX IF NOT EXISTS break_events_by_routine ON break_events (routine, ts);
+CREATE TRIGGER IF NOT EXISTS break_events_no_update
+BEFORE UPDATE ON break_events
+BEGIN SELECT RAISE(ABORT, 'break_events is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS break_events_no_delete
+BEFORE DELETE ON break_events
+BEGIN SELECT RAISE(ABORT, 'break_events is append-only'); END;
+-- 루틴·일자별 집계는 쓰기 배치마다 갱신되는 일 단위 롤업에서 바로 읽는다.
+CREATE TABLE IF NOT EXISTS break_rollup_daily (
+    day INTEGER NOT NULL,
+    routine TEXT NOT NULL,
+    events INTEGER NOT NULL,
+    total_reduction INTEGER NOT NULL,
+    max_reduction INTEGER NOT NULL,
+    total_delay REAL NOT NULL,
+    boss_noticed INTEGER NOT NULL,
+    PRIMARY KEY (day, routine)
+) WITHOUT ROWID;
+"""
+
+_INSERT_EVENT = """
+INSERT INTO break_events (
+    ts, day, session, routine, scenario_index, stress_reduction, stress_after,
+    alert_before, alert_after, delay_seconds, commit_seq
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_ROLLUP = """
+INSERT INTO break_rollup_daily (
+    day, routine, events, total_reduction, max_reduction, total_delay, boss_noticed
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (day, routine) DO UPDATE SET
+    events = events + excluded.events,
+    total_reduction = total_reduction + excluded.total_reduction,
+    max_reduction = MAX(max_reduction, excluded.max_reduction),
+    total_delay = total_delay + excluded.total_delay,
+    boss_noticed = boss_noticed + excluded.boss_noticed
+"""
+
+_ROLLUP_COLUMNS = """
+    SUM(events) AS count,
+    SUM(total_reduction) AS total_reduction,
+    CAST(SUM(total_reduction) AS REAL) / SUM(events) AS avg_reduction,
+    MAX(max_reduction) AS max_reduction,
+    SUM(total_delay) / SUM(events) AS avg_delay,
+    SUM(boss_noticed) AS boss_noticed
+"""
+
+_EVENT_COLUMNS = """
+    COUNT(*) AS count,
+    SUM(stress_reduction) AS total_reduction,
+    AVG(stress_reduction) AS avg_reduction,
+    MAX(stress_reduction) AS max_reduction,
+    AVG(delay_seconds) AS avg_delay,
+    SUM(alert_after > alert_before) AS boss_noticed
+"""
+
+# group_by별 (선택 열, 묶는 열, 롤업 사용 여부). 롤업은 (day, routine) 키로 범위 조회된다.
+_GROUPS: dict[str, tuple[str, str, bool]] = {
+    "routine": ("routine", "routine", True),
+    "day": ("date(day * 86400, 'unixepoch') AS date", "day", True),
+    "scenario": ("routine, scenario_index", "routine, scenario_index", False),
+    "session": ("session", "session", False),
+}
+
+EventRow = tuple[float, int, str, str, int, int, float, int, int, float, int]
+
+
+class _Flush:
+    """쓰기 스레드에 지금까지 들어온 이벤트를 바로 커밋하라고 알리는 표식."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class BreakHistory:
+    """휴식 결과를 SQLite에 기록하고 기간별 집계를 조회한다.
+
+    ``record``는 행 튜플을 유한 큐에 넣기만 하고, 쓰기 스레드가 최대
+    ``batch_size``개 또는 ``flush_interval``초 단위로 모아 한 트랜잭션에
+    ``executemany``로 넣으면서 일 단위 롤업도 함께 갱신한다. 큐가 가득 차면
+    이벤트를 버리고 ``dropped``만 올리므로 도구 응답이 디스크를 기다리지 않는다.
+    조회는 별도 읽기 연결(WAL)로 하며, 아직 커밋되지 않은 이벤트는 포함되지
+    않는다.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        queue_size: int = 10000,
+        wall_fn: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self._wall_fn = wall_fn
+        self._queue: queue.Queue[EventRow | _Flush | None] = queue.Queue(
+            maxsize=max(1, queue_size)
+        )
+        with self._connect() as setup:
+            setup.executescript(_SCHEMA)
+            setup.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        setup.close()
+        self._reader = self._connect(check_same_thread=False)
+        self._reader_lock = threading.Lock()
+        self.recorded = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.write_errors = 0
+        self._thread = threading.Thread(
+            target=self._run, name="chillmcp-history", daemon=True
+        )
+        self._thread.start()
+
+    def _connect(self, **kwargs: object) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, **kwargs)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def record(self, session: str, outcomes: Sequence[BreakOutcome]) -> None:
+        """커밋된 휴식 결과를 쓰기 큐에 넣는다. 큐가 가득 차면 버린다."""
+
+        ts = self._wall_fn()
+        day = int(ts // SECONDS_PER_DAY)
+        for outcome in outcomes:
+            row = (
+                ts,
+                day,
+                session,
+                outcome.routine,
+                outcome.scenario_index,
+                outcome.stress_reduction,
+                outcome.stress_level,
+                outcome.boss_alert_before,
+                outcome.boss_alert_level,
+                outcome.delay_seconds,
+                outcome.commit_seq,
+            )
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self.dropped += 1
+            else:
+                self.recorded += 1
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """지금까지 기록한 이벤트가 커밋될 때까지 기다린다."""
+
+        marker = _Flush()
+        self._queue.put(marker, timeout=timeout)
+        return marker.done.wait(timeout)
+
+    def query(
+        self,
+        *,
+        group_by: HistoryGroupBy = "routine",
+        days: int = 7,
+        routine: str | None = None,
+        order_by: HistoryOrderBy = "avg_reduction",
+        limit: int = 20,
+    ) -> list[dict[str, object]]:
+        """오늘을 포함한 최근 ``days``일(UTC)의 휴식 이벤트를 묶어 집계한다.
+
+        루틴·일자별 집계는 롤업 테이블, 시나리오·세션별 집계는 시각 커버링
+        인덱스의 범위 조회로 계산하므로 전체 이벤트를 훑지 않는다.
+        """
+
+        sql, params = self._query_sql(
+            group_by=group_by,
+            days=days,
+            routine=routine,
+            order_by=order_by,
+            limit=limit,
+        )
+        with self._reader_lock:
+            cursor = self._reader.execute(sql, params)
+            names = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        return [_round_row(dict(zip(names, row))) for row in rows]
+
+    def explain(self, **kwargs: object) -> list[str]:
+        """``query``와 같은 인자로 SQL 실행 계획을 반환한다 (인덱스 사용 확인용)."""
+
+        sql, params = self._query_sql(**kwargs)
+        with self._reader_lock:
+            plan = self._reader.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return [row[-1] for row in plan.fetchall()]
+
+    def _query_sql(
+        self,
+        *,
+        group_by: str = "routine",
+        days: int = 7,
+        routine: str | None = None,
+        order_by: str = "avg_reduction",
+        limit: int = 20,
+    ) -> tuple[str, list[object]]:
+        if group_by not in _GROUPS:
+            raise ValueError(f"알 수 없는 group_by입니다: {group_by}")
+        if order_by not in HISTORY_ORDER_BY:
+            raise ValueError(f"알 수 없는 order_by입니다: {order_by}")
+        key, group, use_rollup = _GROUPS[group_by]
+        first_day = int(self._wall_fn() // SECONDS_PER_DAY) - max(1, days) + 1
+        params: list[object]
+        if use_rollup:
+            table, columns, where = "break_rollup_daily", _ROLLUP_COLUMNS, "day >= ?"
+            params = [first_day]
+        else:
+            table, columns, where = "break_events", _EVENT_COLUMNS, "ts >= ?"
+            params = [first_day * SECONDS_PER_DAY]
+            if routine is None:
+                # 통계가 없을 때 플래너가 GROUP BY 정렬을 피하려고 다른 인덱스
+                # 전체를 훑지 않도록 기간 범위 조회를 고정한다.
+                table += " INDEXED BY break_events_by_time"
+        if routine is not None:
+            where += " AND routine = ?"
+            params.append(routine)
+        sql = (
+            f"SELECT {key}, {columns} FROM {table} WHERE {where} "
+            f"GROUP BY {group} ORDER BY {order_by} DESC LIMIT ?"
+        )
+        params.append(max(1, limit))
+        return sql, params
+
+    def stats(self) -> dict[str, int]:
+        """이벤트 기록 현황을 요약한다."""
+
+        return {
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "batches": self.batches,
+            "write_errors": self.write_errors,
+        }
+
+    def close(self) -> None:
+        """남은 이벤트를 모두 커밋하고 연결을 닫는다."""
+
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        with self._reader_lock:
+            self._reader.close()
+
+    def _run(self) -> None:
+        # sqlite3 연결은 만든 스레드에서만 쓸 수 있으므로 쓰기 연결은 여기서 연다.
+        connection = self._connect()
+        try:
+            stopping = False
+            while not stopping:
+                item = self._queue.get()
+                batch: list[EventRow] = []
+                markers: list[_Flush] = []
+                deadline = time.monotonic() + self.flush_interval
+                while True:
+                    if item is None:
+                        stopping = True
+                        break
+                    if isinstance(item, _Flush):
+                        markers.append(item)
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    remaining = deadline - time.monotonic()
+                    try:
+                        item = (
+                            self._queue.get(timeout=remaining)
+                            if remaining > 0
+                            else self._queue.get_nowait()
+                        )
+                    except queue.Empty:
+                        break
+                self._write(connection, batch)
+                for marker in markers:
+                    marker.done.set()
+        finally:
+            connection.close()
+
+    def _write(self, connection: sqlite3.Connection, batch: list[EventRow]) -> None:
+        """이벤트와 일 단위 롤업 증분을 한 트랜잭션으로 기록한다."""
+
+        if not batch:
+            return
+        rollup: dict[tuple[int, str], list] = {}
+        for row in batch:
+            _, day, _, routine, _, reduction, _, before, after, delay, _ = row
+            # 훅이 스트레스를 올리면 감소량이 음수이므로 최댓값은 첫 행에서 시작한다.
+            totals = rollup.setdefault((day, routine), [0, 0, reduction, 0.0, 0])
+            totals[0] += 1
+            totals[1] += reduction
+            totals[2] = max(totals[2], reduction)
+            totals[3] += delay
+            totals[4] += int(after > before)
+        try:
+            with connection:
+                connection.executemany(_INSERT_EVENT, batch)
+                connection.executemany(
+                    _UPSERT_ROLLUP,
+                    [
+                        (day, routine, *totals)
+                        for (day, routine), totals in rollup.items()
+                    ],
+                )
+        except sqlite3.Error as exc:
+            self.write_errors += 1
+            logger.warning("Failed to write %d break events: %s", len(batch), exc)
+            return
+        self.written += len(batch)
+        self.batches += 1
+
+
+def _round_row(row: dict[str, object]) -> dict[str, object]:
+    for name in ("avg_reduction", "avg_delay"):
+        value = row.get(name)
+        if isinstance(value, float):
+            row[name] = round(value, 3)
+    return row
@@ -0,0 +1,140 @@
+"""재시도된 휴식 호출을 한 번만 반영하기 위한 멱등성 캐시 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IdempotencyConflict(ValueError):
+    """같은 멱등성 키가 다른 요청 내용으로 다시 사용되었을 때 발생한다."""
+
+
+@dataclass
+class _CacheEntry(Generic[T]):
+    """요청 지문, 결과(또는 진행 중인 호출)의 future, 마지막 접근 시각."""
+
+    fingerprint: Hashable
+    future: asyncio.Future[T]
+    last_seen: float
+
+
+class IdempotencyCache(Generic[T]):
+    """멱등성 키별로 최근 결과를 보관하고 TTL/LRU로 정리한다.
+
+    처음 보는 키는 호출을 실행하고 결과를 저장한다. 같은 키로 다시 들어온
+    요청은 상태를 건드리지 않고 저장된 결과를 돌려주며, 원래 호출이 아직
+    진행 중이면(예: 20초 지연 대기 중 클라이언트가 타임아웃 후 재시도) 같은
+    future를 기다린다. 실패하거나 취소된 호출은 저장하지 않으므로 재시도가
+    다시 실행된다. 정리 방식은 ``StateRegistry``와 같다.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 600.0,
+        max_entries: int = 10000,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+        self._ttl = max(0.0, ttl_seconds)
+        self._max_entries = max_entries
+        self._time_fn = time_fn
+        self._entries: OrderedDict[Hashable, _CacheEntry[T]] = OrderedDict()
+        self.stored = 0
+        self.hits = 0
+        self.joined = 0
+        self.conflicts = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def run(
+        self,
+        key: Hashable,
+        fingerprint: Hashable,
+        call: Callable[[], Awaitable[T]],
+    ) -> Tuple[T, bool]:
+        """키에 대한 결과와 재사용 여부를 반환한다. 처음이면 ``call``을 실행한다."""
+
+        now = self._time_fn()
+        self._evict(now)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.fingerprint != fingerprint:
+                self.conflicts += 1
+                raise IdempotencyConflict(
+                    "이 idempotency_key는 다른 도구나 인자의 요청에 이미 사용되었습니다."
+                )
+            entry.last_seen = now
+            self._entries.move_to_end(key)
+            if entry.future.done():
+                self.hits += 1
+                return entry.future.result(), True
+            self.joined += 1
+            # 재시도가 취소되어도 원래 호출은 계속 진행되어야 한다.
+            return await asyncio.shield(entry.future), True
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        entry = _CacheEntry(fingerprint=fingerprint, future=future, last_seen=now)
+        self._entries[key] = entry
+        try:
+            result = await call()
+        except BaseException as exc:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            if isinstance(exc, asyncio.CancelledError):
+                exc = RuntimeError(
+                    "같은 idempotency_key의 원래 호출이 취소되었습니다. 다시 시도해 주세요."
+                )
+            future.set_exception(exc)
+            # 기다리는 재시도가 없어도 "never retrieved" 경고가 남지 않게 한다.
+            future.exception()
+            raise
+        future.set_result(result)
+        entry.last_seen = self._time_fn()
+        self.stored += 1
+        self._evict(entry.last_seen)
+        return result, False
+
+    def stats(self) -> dict[str, int]:
+        """캐시 사용량 요약을 반환한다."""
+
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "stored": self.stored,
+            "hits": self.hits,
+            "joined": self.joined,
+            "conflicts": self.conflicts,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+    def _is_expired(self, entry: _CacheEntry[T], now: float) -> bool:
+        # 진행 중인 호출은 끝날 때까지 만료시키지 않는다.
+        return (
+            self._ttl > 0 and entry.future.done() and now - entry.last_seen >= self._ttl
+        )
+
+    def _evict(self, now: float) -> None:
+        """TTL이 지난 항목과 용량을 넘는 LRU 항목을 앞에서부터 제거한다."""
+
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if not self._is_expired(oldest, now):
+                break
+            self._entries.popitem(last=False)
+            self.expired += 1
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evicted += 1
@@ -0,0 +1,243 @@
+"""도구 호출 경로를 막지 않는 로깅 파이프라인을 구성하는 모듈.
+
+``sync`` 모드는 기존 ``logging.basicConfig``와 같이 호출한 스레드에서 바로
+stderr에 쓴다. ``async`` 모드는 이벤트 루프 스레드에서 레코드를 유한 큐에
+넣기만 하고, 포매팅과 출력은 ``QueueListener``의 백그라운드 스레드가
+담당한다. 클라이언트가 stderr를 늦게 비워 큐가 가득 차면 레코드를 버리고
+``dropped`` 카운터만 올리므로 도구 응답 지연에는 영향을 주지 않는다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Literal, TextIO
+
+LogMode = Literal["sync", "async"]
+LogFormat = Literal["text", "json"]
+
+# 휴식 전후 상태 로그에 붙는 이벤트 이름 (state.py의 ``_log_state`` 참고).
+STATE_EVENTS = frozenset({"state_before", "state_after"})
+
+_ACTIVE: "LoggingPipeline | None" = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON 객체로 직렬화한다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        document: dict[str, object] = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        event = getattr(record, "chill_event", None)
+        if event is not None:
+            document["event"] = event
+        fields = getattr(record, "chill_fields", None)
+        if fields:
+            document.update(fields)
+        if record.exc_info:
+            document["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            document["exc"] = record.exc_text
+        return json.dumps(document, ensure_ascii=False, default=str)
+
+
+class StateLogSampler(logging.Filter):
+    """휴식 전후 상태 로그를 ``rate`` 비율만큼만 통과시키는 필터.
+
+    커밋 번호(``commit_seq``) 기준으로 결정하므로 같은 호출의 before/after
+    줄은 항상 함께 남거나 함께 빠지고, 난수를 쓰지 않아 재현 가능하다.
+    """
+
+    def __init__(self, rate: float = 1.0) -> None:
+        super().__init__()
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("log sample rate는 0과 1 사이여야 합니다.")
+        self.rate = rate
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or getattr(record, "chill_event", None) not in STATE_EVENTS:
+            return True
+        seq = record.chill_fields.get("commit_seq", 0)
+        if int(seq * self.rate) != int((seq - 1) * self.rate):
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler."""
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """메시지 포매팅을 리스너 스레드로 미루기 위해 레코드를 얕게 복사만 한다.
+
+        예외 정보만은 트레이스백 프레임을 붙잡지 않도록 여기서 문자열로 바꾼다.
+        """
+
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+        else:
+            self.enqueued += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    """종료 신호를 넣을 때만은 큐에 빈자리가 날 때까지 기다리는 리스너.
+
+    기본 구현은 ``put_nowait``를 써서 큐가 가득 찬 상태로 종료하면
+    ``queue.Full``이 발생한다. writer 스레드가 계속 비우고 있으므로 기다려도 된다.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class LoggingPipeline:
+    """루트 로거에 설치된 핸들러 구성과 카운터를 보관한다."""
+
+    def __init__(
+        self,
+        *,
+        mode: LogMode,
+        fmt: LogFormat,
+        sampler: StateLogSampler,
+        handler: logging.Handler,
+        listener: QueueListener | None = None,
+        writer: logging.Handler | None = None,
+        log_queue: queue.Queue | None = None,
+    ) -> None:
+        self.mode = mode
+        self.format = fmt
+        self.sampler = sampler
+        self.handler = handler
+        self._listener = listener
+        self._writer = writer
+        self._queue = log_queue
+        self._stop_lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        """큐가 가득 차 버려진 레코드 수."""
+
+        if isinstance(self.handler, _DroppingQueueHandler):
+            return self.handler.dropped
+        return 0
+
+    def stats(self) -> dict[str, object]:
+        """로깅 파이프라인 상태를 요약한다."""
+
+        return {
+            "mode": self.mode,
+            "format": self.format,
+            "sample_rate": self.sampler.rate,
+            "sampled_out": self.sampler.sampled_out,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "enqueued": getattr(self.handler, "enqueued", 0),
+            "dropped": self.dropped,
+        }
+
+    def stop(self) -> None:
+        """백그라운드 writer가 남은 레코드를 모두 쓰고 종료하도록 한다."""
+
+        with self._stop_lock:
+            listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        # 종료 이후에 남는 로그(종료 인사 등)는 writer로 바로 출력한다.
+        root = logging.getLogger()
+        root.removeHandler(self.handler)
+        if self._writer is not None:
+            self._writer.addFilter(self.sampler)
+            root.addHandler(self._writer)
+        if self.dropped:
+            logging.getLogger("ChillMCP").warning(
+                "Dropped %d log records (queue full)", self.dropped
+            )
+
+
+def configure_logging(
+    *,
+    mode: LogMode = "sync",
+    fmt: LogFormat = "text",
+    sample_rate: float = 1.0,
+    queue_size: int = 10000,
+    level: int = logging.INFO,
+    stream: TextIO | None = None,
+) -> LoggingPipeline:
+    """루트 로거에 sync/async 핸들러를 설치하고 파이프라인을 반환한다."""
+
+    global _ACTIVE
+
+    if mode not in ("sync", "async"):
+        raise ValueError(f"알 수 없는 로그 모드입니다: {mode}")
+    if _ACTIVE is not None:
+        _ACTIVE.stop()
+
+    formatter: logging.Formatter
+    if fmt == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(logging.BASIC_FORMAT)
+    writer = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    writer.setFormatter(formatter)
+    sampler = StateLogSampler(sample_rate)
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.setLevel(level)
+
+    if mode == "sync":
+        writer.addFilter(sampler)
+        root.addHandler(writer)
+        _ACTIVE = LoggingPipeline(mode=mode, fmt=fmt, sampler=sampler, handler=writer)
+        return _ACTIVE
+
+    log_queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+    handler = _DroppingQueueHandler(log_queue)
+    # 샘플링은 큐에 넣기 전에 걸러 큐 공간을 아낀다.
+    handler.addFilter(sampler)
+    listener = _DrainingQueueListener(log_queue, writer, respect_handler_level=True)
+    listener.start()
+    root.addHandler(handler)
+    _ACTIVE = LoggingPipeline(
+        mode=mode,
+        fmt=fmt,
+        sampler=sampler,
+        handler=handler,
+        listener=listener,
+        writer=writer,
+        log_queue=log_queue,
+    )
+    atexit.register(_ACTIVE.stop)
+    return _ACTIVE
+
+
+def active_pipeline() -> LoggingPipeline | None:
+    """``configure_logging``으로 설치된 현재 파이프라인을 반환한다."""
+
+    return _ACTIVE
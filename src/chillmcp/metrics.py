@@ -0,0 +1,344 @@
+"""도구별 호출 지표를 모으고 JSON/Prometheus 형식으로 내보내는 모듈.
+
+모든 관측은 이벤트 루프 스레드에서만 일어나므로 갱신 경로에는 잠금이 없다.
+다른 스레드(파일 덤프)에서 읽을 때는 ``dict``/``list`` 복사본을 떠서 쓰는데,
+CPython에서 내장 컨테이너 복사는 GIL 아래에서 한 번에 끝나므로 찢어진 값을
+보지 않는다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable, Iterable, Mapping, Sequence
+
+from .state import BreakOutcome, BreakPlanOutcome, BreakRoutine
+
+logger = logging.getLogger("ChillMCP")
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 20.0, 30.0)
+DELAY_BUCKETS = (0.0, 1.0, 5.0, 10.0, 20.0, 30.0)
+RESPONSE_BYTES_BUCKETS = (128, 256, 384, 512, 768, 1024, 2048)
+
+# 시나리오 선택, 스트레스 감소량, 보스 경보 판정에 항상 쓰는 난수 개수.
+FIXED_RNG_DRAWS = 3
+
+Collector = Callable[[], Mapping[str, object]]
+
+
+class Histogram:
+    """고정 버킷 경계를 가진 누적 히스토그램."""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        # 마지막 칸은 +Inf 버킷이다.
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self) -> dict[str, object]:
+        """버킷별 누적 개수와 합계를 반환한다."""
+
+        counts = list(self.counts)
+        cumulative: list[int] = []
+        running = 0
+        for value in counts:
+            running += value
+            cumulative.append(running)
+        return {
+            "buckets": dict(zip([*map(str, self.bounds), "+Inf"], cumulative)),
+            "sum": self.total,
+            "count": self.count,
+        }
+
+
+class ToolMetrics:
+    """도구 하나의 호출 수, 오류, 지연, 응답 크기, 시나리오 분포."""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "rng_draws",
+        "boss_noticed",
+        "scenarios",
+        "latency",
+        "boss_delay",
+        "response_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors: Counter[str] = Counter()
+        self.rng_draws = 0
+        self.boss_noticed = 0
+        self.scenarios: Counter[int] = Counter()
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.boss_delay = Histogram(DELAY_BUCKETS)
+        self.response_bytes = Histogram(RESPONSE_BYTES_BUCKETS)
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "calls": self.calls,
+            "errors": dict(self.errors),
+            "rng_draws": self.rng_draws,
+            "boss_noticed": self.boss_noticed,
+            "scenarios": {str(k): v for k, v in sorted(dict(self.scenarios).items())},
+            "latency_seconds": self.latency.snapshot(),
+            "boss_delay_seconds": self.boss_delay.snapshot(),
+            "response_bytes": self.response_bytes.snapshot(),
+        }
+
+
+def outcome_rng_draws(outcome: BreakOutcome, routine: BreakRoutine) -> int:
+    """휴식 한 건이 소비한 난수 개수를 계산한다.
+
+    팩토리 기반 시나리오는 세부 문장이 쓰는 난수를 알 수 없어 고정 개수만 센다.
+    """
+
+    compiled = routine.scenarios[outcome.scenario_index].compiled
+    return FIXED_RNG_DRAWS + (compiled.rng_draws if compiled is not None else 0)
+
+
+class MetricsRegistry:
+    """도구별 ``ToolMetrics``와 외부 상태 수집기를 보관한다."""
+
+    def __init__(self, tools: Iterable[str] = ()) -> None:
+        self._tools: dict[str, ToolMetrics] = {}
+        self._collectors: dict[str, Collector] = {}
+        self.started_at = time.time()
+        self.ensure_tools(tools)
+
+    def ensure_tools(self, names: Iterable[str]) -> None:
+        """호출 전에도 0으로 보이도록 도구 항목을 미리 만든다."""
+
+        for name in names:
+            self.tool(name)
+
+    def tool(self, name: str) -> ToolMetrics:
+        metrics = self._tools.get(name)
+        if metrics is None:
+            metrics = self._tools[name] = ToolMetrics()
+        return metrics
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        """스냅샷마다 호출해 숫자 값을 함께 내보낼 수집기를 등록한다."""
+
+        self._collectors[name] = collector
+
+    def observe_break(
+        self,
+        tool: str,
+        outcome: BreakOutcome,
+        *,
+        routine: BreakRoutine,
+        latency: float,
+        response_bytes: int,
+    ) -> None:
+        """성공한 휴식 호출 한 건을 기록한다."""
+
+        metrics = self.tool(tool)
+        metrics.calls += 1
+        metrics.scenarios[outcome.scenario_index] += 1
+        metrics.rng_draws += outcome_rng_draws(outcome, routine)
+        if outcome.boss_noticed:
+            metrics.boss_noticed += 1
+        metrics.latency.observe(latency)
+        metrics.boss_delay.observe(outcome.delay_seconds)
+        metrics.response_bytes.observe(response_bytes)
+
+    def observe_plan(
+        self,
+        tool: str,
+        plan: BreakPlanOutcome,
+        *,
+        routines: Sequence[BreakRoutine],
+        latency: float,
+        response_bytes: int,
+    ) -> None:
+        """일괄 실행 한 건을 기록한다.
+
+        호출 수·지연·응답 크기는 일괄 도구에, 시나리오·난수·경보 통계는
+        각 단계의 루틴에 나누어 쌓는다.
+        """
+
+        metrics = self.tool(tool)
+        metrics.calls += 1
+        metrics.latency.observe(latency)
+        metrics.boss_delay.observe(plan.delay_seconds)
+        metrics.response_bytes.observe(response_bytes)
+        for step, routine in zip(plan.steps, routines):
+            step_metrics = self.tool(step.routine)
+            step_metrics.scenarios[step.scenario_index] += 1
+            step_metrics.rng_draws += outcome_rng_draws(step, routine)
+            if step.boss_noticed:
+                step_metrics.boss_noticed += 1
+
+    def observe_error(self, tool: str, kind: str, *, latency: float) -> None:
+        """취소·거절·예외로 끝난 호출을 기록한다."""
+
+        metrics = self.tool(tool)
+        metrics.calls += 1
+        metrics.errors[kind] += 1
+        metrics.latency.observe(latency)
+
+    def snapshot(self) -> dict[str, object]:
+        """현재 지표를 JSON 직렬화 가능한 사전으로 반환한다."""
+
+        collected: dict[str, object] = {}
+        for name, collector in dict(self._collectors).items():
+            try:
+                collected[name] = dict(collector())
+            except Exception:  # noqa: BLE001 - 수집기 실패가 전체를 막으면 안 된다.
+                logger.debug("Metrics collector %s failed", name, exc_info=True)
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "tools": {
+                name: metrics.snapshot()
+                for name, metrics in sorted(dict(self._tools).items())
+            },
+            **collected,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 직렬화한다."""
+
+        snapshot = self.snapshot()
+        lines: list[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        tools: Mapping[str, dict] = snapshot["tools"]  # type: ignore[assignment]
+        header("chillmcp_tool_calls_total", "counter", "Tool calls by tool name.")
+        for tool, data in tools.items():
+            lines.append(f'chillmcp_tool_calls_total{{tool="{tool}"}} {data["calls"]}')
+        header("chillmcp_tool_errors_total", "counter", "Failed tool calls by kind.")
+        for tool, data in tools.items():
+            for kind, value in sorted(data["errors"].items()):
+                lines.append(
+                    f'chillmcp_tool_errors_total{{tool="{tool}",kind="{kind}"}} {value}'
+                )
+        header("chillmcp_tool_rng_draws_total", "counter", "RNG draws consumed.")
+        for tool, data in tools.items():
+            lines.append(
+                f'chillmcp_tool_rng_draws_total{{tool="{tool}"}} {data["rng_draws"]}'
+            )
+        header(
+            "chillmcp_tool_boss_noticed_total", "counter", "Breaks noticed by the boss."
+        )
+        for tool, data in tools.items():
+            lines.append(
+                f'chillmcp_tool_boss_noticed_total{{tool="{tool}"}} '
+                f'{data["boss_noticed"]}'
+            )
+        header(
+            "chillmcp_tool_scenario_total", "counter", "Selected scenario index counts."
+        )
+        for tool, data in tools.items():
+            for index, value in data["scenarios"].items():
+                lines.append(
+                    f'chillmcp_tool_scenario_total{{tool="{tool}",scenario="{index}"}} '
+                    f"{value}"
+                )
+        for key, metric, help_text in (
+            ("latency_seconds", "chillmcp_tool_latency_seconds", "Tool latency."),
+            ("boss_delay_seconds", "chillmcp_tool_boss_delay_seconds", "Boss delay."),
+            ("response_bytes", "chillmcp_tool_response_bytes", "Response size."),
+        ):
+            header(metric, "histogram", help_text)
+            for tool, data in tools.items():
+                histogram = data[key]
+                for bound, value in histogram["buckets"].items():
+                    lines.append(
+                        f'{metric}_bucket{{tool="{tool}",le="{bound}"}} {value}'
+                    )
+                lines.append(f'{metric}_sum{{tool="{tool}"}} {histogram["sum"]}')
+                lines.append(f'{metric}_count{{tool="{tool}"}} {histogram["count"]}')
+
+        for group, values in snapshot.items():
+            if group in ("tools", "uptime_seconds") or not isinstance(values, dict):
+                continue
+            for key, value in values.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                metric = f"chillmcp_{group}_{key}"
+                header(metric, "gauge", f"{group} {key}.")
+                lines.append(f"{metric} {value}")
+        header("chillmcp_uptime_seconds", "gauge", "Seconds since server start.")
+        lines.append(f"chillmcp_uptime_seconds {snapshot['uptime_seconds']}")
+        return "\n".join(lines) + "\n"
+
+
+class PrometheusFileExporter:
+    """일정 간격으로 Prometheus 텍스트 파일을 원자적으로 다시 쓰는 데몬 스레드.
+
+    node_exporter의 textfile collector 같은 수집기가 읽을 수 있도록, 임시 파일에
+    쓴 뒤 ``os.replace``로 교체한다.
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, path: str | os.PathLike[str], interval: float
+    ) -> None:
+        self.registry = registry
+        self.path = os.fspath(path)
+        self.interval = max(0.1, interval)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def write_once(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".chillmcp-metrics-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(self.registry.to_prometheus())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write_once()
+            except OSError as exc:
+                logger.warning("Failed to write metrics file %s: %s", self.path, exc)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="chillmcp-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """스레드를 멈추고 마지막 지표를 한 번 더 기록한다."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1.0)
+            self._thread = None
+        try:
+            self.write_once()
+        except OSError as exc:
+            logger.warning("Failed to write metrics file %s: %s", self.path, exc)
@@ -0,0 +1,328 @@
+"""보스 경보 지연을 하나의 타이머 힙으로 처리하는 공유 스케줄러 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Literal
+
+OverflowPolicy = Literal["queue", "reject"]
+
+
+class DelayRejected(RuntimeError):
+    """지연 슬롯과 대기열이 모두 가득 차 호출을 거절할 때 발생한다."""
+
+
+@dataclass(order=True)
+class _Timer:
+    """힙에 저장되는 만료 시각과 대기 중인 Future."""
+
+    deadline: float
+    seq: int
+    future: asyncio.Future = field(compare=False)
+    # 수동 시계에서 시계를 직접 전진시키지 않고 외부 전진만 기다리는 타이머.
+    parked: bool = field(default=False, compare=False)
+
+
+class DelayScheduler:
+    """모든 지연 호출을 단일 드라이버 태스크와 최소 힙으로 깨우는 스케줄러.
+
+    호출마다 ``asyncio.sleep``을 거는 대신 만료 시각을 힙에 넣고 Future만
+    기다린다. 드라이버는 가장 이른 만료 시각까지 한 번만 잠들었다가 도래한
+    타이머를 한꺼번에 깨우므로, 동시에 수천 건이 지연되어도 타이머 핸들은
+    하나만 유지된다.
+
+    ``max_active``로 동시에 지연 중인 호출 수를 제한할 수 있다. 한도를 넘는
+    호출은 ``policy``에 따라 FIFO 대기열에서 슬롯을 기다리거나(``queue``)
+    즉시 ``DelayRejected``로 거절된다(``reject``). 대기열 길이도
+    ``max_queue``로 제한되어 폭주 상황에서도 메모리와 지연이 유한하게 유지된다.
+
+    ``manual_time``이 참이면(가상 시계) ``sleep_or_wake`` 대기자는 드라이버가
+    ``sleep_fn``으로 시계를 앞당기지 않고, 다른 지연이 시계를 움직이거나
+    ``notify_time_advanced``가 불릴 때까지 멈춰 있는다. 가상 시계는 모든
+    세션이 공유하므로, 한 대기자가 모두의 시간을 빨리 감으면 안 되기 때문이다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_active: int | None = None,
+        policy: OverflowPolicy = "queue",
+        max_queue: int | None = None,
+        time_fn: Callable[[], float] = time.monotonic,
+        sleep_fn: Callable[[float], Awaitable[None]] | None = None,
+        manual_time: bool = False,
+    ) -> None:
+        if max_active is not None and max_active < 1:
+            raise ValueError("max_active는 1 이상이어야 합니다.")
+        if policy not in ("queue", "reject"):
+            raise ValueError(f"알 수 없는 overflow 정책입니다: {policy}")
+        self.max_active = max_active
+        self.policy = policy
+        self.max_queue = max_queue
+        self._time_fn = time_fn
+        self._sleep_fn = sleep_fn
+        self.manual_time = manual_time
+        self._advanced: asyncio.Future | None = None
+        self._heap: list[_Timer] = []
+        self._stale = 0
+        self._seq = itertools.count()
+        self._driver: asyncio.Task | None = None
+        self._waiting: deque[asyncio.Future] = deque()
+        self.active = 0
+        self.peak_active = 0
+        self.peak_queued = 0
+        self.scheduled = 0
+        self.completed = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self.woken_early = 0
+
+    @property
+    def queued(self) -> int:
+        """슬롯을 기다리는 호출 수."""
+
+        return len(self._waiting)
+
+    def stats(self) -> dict[str, object]:
+        """지연 슬롯과 대기열 상태를 요약한다."""
+
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "pending_timers": len(self._heap) - self._stale,
+            "peak_active": self.peak_active,
+            "peak_queued": self.peak_queued,
+            "scheduled": self.scheduled,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+            "woken_early": self.woken_early,
+            "max_active": self.max_active,
+            "policy": self.policy,
+        }
+
+    async def delay(self, seconds: float) -> None:
+        """슬롯을 확보한 뒤 ``seconds``만큼 기다린다."""
+
+        await self._acquire_slot()
+        try:
+            await self.sleep(seconds)
+        finally:
+            self._release_slot()
+
+    async def sleep(self, seconds: float) -> None:
+        """슬롯 제한 없이 공유 타이머 힙에서 ``seconds``만큼 기다린다."""
+
+        timer = self._schedule(max(0.0, seconds))
+        self.scheduled += 1
+        try:
+            await timer.future
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            self._discard(timer)
+            raise
+        self.completed += 1
+
+    async def sleep_or_wake(self, seconds: float, wake: asyncio.Future) -> bool:
+        """``seconds``가 지나거나 ``wake``가 완료될 때까지 기다린다.
+
+        타이머는 ``sleep``과 같은 공유 힙에 들어가고 별도 태스크를 만들지
+        않으므로, 수천 명이 기다려도 힙 항목과 Future 하나씩만 든다. 시간이
+        다 되어 깨어났으면 True, ``wake``로 먼저 깨어났으면 False를 반환한다.
+        """
+
+        timer = self._schedule(max(0.0, seconds), parked=self.manual_time)
+        self.scheduled += 1
+        try:
+            await asyncio.wait(
+                (timer.future, wake), return_when=asyncio.FIRST_COMPLETED
+            )
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            if not timer.future.done():
+                timer.future.cancel()
+                self._discard(timer)
+        if timer.future.cancelled():
+            self.woken_early += 1
+            return False
+        self.completed += 1
+        return True
+
+    def notify_time_advanced(self, now: float | None = None) -> None:
+        """시계가 외부에서 전진했음을 알려 멈춰 있던 드라이버가 다시 계산하게 한다."""
+
+        advanced, self._advanced = self._advanced, None
+        if advanced is None or advanced.done():
+            return
+        loop = advanced.get_loop()
+        if loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            advanced.set_result(None)
+        else:
+            loop.call_soon_threadsafe(_resolve, advanced)
+
+    async def _acquire_slot(self) -> None:
+        """동시 지연 한도 안에서 슬롯을 얻거나 정책에 따라 대기/거절한다."""
+
+        if self.max_active is None or (
+            self.active < self.max_active and not self.queued
+        ):
+            self._take_slot()
+            return
+
+        queue_full = self.max_queue is not None and self.queued >= self.max_queue
+        if self.policy == "reject" or queue_full:
+            self.rejected += 1
+            raise DelayRejected(
+                "보스 경보 지연 슬롯이 모두 사용 중입니다. 잠시 후 다시 시도하세요."
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiting.append(waiter)
+        self.peak_queued = max(self.peak_queued, self.queued)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 직후 취소되었으면 다음 대기자에게 돌려준다.
+                self._release_slot()
+            else:
+                try:
+                    self._waiting.remove(waiter)
+                except ValueError:
+                    # 깨어나기 전에 _release_slot이 취소된 대기자를 이미 걷어냈다.
+                    pass
+            self.cancelled += 1
+            raise
+
+    def _take_slot(self) -> None:
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+
+    def _release_slot(self) -> None:
+        """슬롯을 반납하고, 대기 중인 호출이 있으면 그대로 넘겨준다."""
+
+        while self._waiting:
+            waiter = self._waiting.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _schedule(self, seconds: float, *, parked: bool = False) -> _Timer:
+        """힙에 타이머를 추가하고 필요하면 드라이버를 다시 시작한다."""
+
+        loop = asyncio.get_running_loop()
+        now = self._time_fn()
+        timer = _Timer(now + seconds, next(self._seq), loop.create_future(), parked)
+
+        driver = self._driver
+        if driver is not None and driver.get_loop() is not loop:
+            # 이전 이벤트 루프에 남은 타이머는 더 이상 깨울 수 없으므로 버린다.
+            self._heap = [t for t in self._heap if t.future.get_loop() is loop]
+            heapq.heapify(self._heap)
+            self._stale = 0
+            driver = None
+
+        becomes_head = not self._heap or timer < self._heap[0]
+        heapq.heappush(self._heap, timer)
+        if driver is None or driver.done() or becomes_head:
+            self._restart_driver(now)
+        elif not parked:
+            # 대기자 뒤에서 멈춰 있던 드라이버가 이 타이머까지 시계를 앞당기게 한다.
+            self.notify_time_advanced()
+        return timer
+
+    def _discard(self, timer: _Timer) -> None:
+        """취소된 타이머를 힙에서 즉시 걷어낸다.
+
+        맨 앞 타이머라면 바로 꺼내고 드라이버가 다음 만료 시각에 맞춰 다시
+        잠들게 한다. 중간에 있는 타이머는 표시만 해 두었다가, 취소된 항목이
+        힙의 절반을 넘으면 한 번에 재구성해 분할 상환 비용을 O(log n)으로 유지한다.
+        """
+
+        if not timer.future.cancelled():
+            # 이미 만료되어 힙에서 빠진 타이머다.
+            return
+        if self._heap and self._heap[0] is timer:
+            heapq.heappop(self._heap)
+            self._pop_stale_heads()
+            self._restart_driver(self._time_fn())
+            return
+
+        self._stale += 1
+        if self._stale * 2 > len(self._heap):
+            self._heap = [t for t in self._heap if not t.future.done()]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _pop_stale_heads(self) -> None:
+        while self._heap and self._heap[0].future.done():
+            heapq.heappop(self._heap)
+            self._stale -= 1
+
+    def _restart_driver(self, now: float) -> None:
+        """진행 중인 드라이버를 멈추고 남은 타이머가 있으면 새로 시작한다."""
+
+        if self._driver is not None and not self._driver.done():
+            self._driver.cancel()
+        self._driver = None
+        if self._heap:
+            loop = asyncio.get_running_loop()
+            self._driver = loop.create_task(self._drive(now))
+
+    async def _drive(self, now: float) -> None:
+        """가장 이른 만료 시각까지 잠들었다가 도래한 타이머를 깨운다.
+
+        ``sleep_fn``이 요청한 시간만큼 잤다고 간주해 내부 시각을 앞당기므로,
+        가상 시계나 테스트용 sleep에서도 타이머가 정확히 한 번씩 만료된다.
+        ``manual_time``에서 맨 앞이 멈춘 대기자면 가장 이른 일반 지연까지만
+        시계를 앞당기고, 그런 지연이 없으면 외부 전진을 기다린다.
+        """
+
+        sleep_fn = self._sleep_fn or asyncio.sleep
+        while self._heap:
+            self._pop_stale_heads()
+            if not self._heap:
+                break
+            head = self._heap[0]
+            wait = head.deadline - now
+            if wait > 0 and self.manual_time and head.parked:
+                target = min(
+                    (
+                        t.deadline
+                        for t in self._heap
+                        if not t.parked and not t.future.done()
+                    ),
+                    default=None,
+                )
+                if target is None:
+                    self._advanced = asyncio.get_running_loop().create_future()
+                    await self._advanced
+                    now = max(now, self._time_fn())
+                    continue
+                wait = target - now
+            if wait > 0:
+                await sleep_fn(wait)
+                now = max(now + wait, self._time_fn())
+                continue
+            heapq.heappop(self._heap)
+            head.future.set_result(None)
+            now = max(now, self._time_fn())
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
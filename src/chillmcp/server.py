@@ -2,10 +2,272 @@
 
 from __future__ import annotations
 
-from fastmcp import FastMCP
+import asyncio
+import itertools
+import json
+import logging
+import os
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Hashable, Iterator, Literal, Sequence
 
-from .routines import ROUTINES
-from .state import ChillState
+from fastmcp import Context, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools import ToolResult
+from mcp import types as mcp_types
+from mcp.server.subscriptions import InMemorySubscriptionBus, ListenHandler
+from mcp.shared.exceptions import MCPError
+
+from .catalog import RoutineCatalog
+from .checkpoint import CHECKPOINT_VERSION, CheckpointDocument, StateCheckpointer
+from .clock import Clock, VirtualClock
+from .history import HISTORY_GROUP_BY, HISTORY_ORDER_BY, BreakHistory
+from .idempotency import IdempotencyCache, IdempotencyConflict
+from .logging_pipeline import active_pipeline
+from .metrics import MetricsRegistry
+from .scheduler import DelayRejected, DelayScheduler, OverflowPolicy
+from .sessions import StateRegistry
+from .state import (
+    OUTPUT_PROFILES,
+    BreakDeferred,
+    BreakRoutine,
+    ChillState,
+    OutputProfile,
+)
+from .subscriptions import StateNotifier
+
+logger = logging.getLogger("ChillMCP")
+
+Transport = Literal["stdio", "http", "sse"]
+MetricsFormat = Literal["json", "prometheus"]
+
+PLAN_TOOL_NAME = "run_break_plan"
+# 한 계획이 상태 잠금을 쥐는 시간을 제한하기 위한 최대 단계 수.
+MAX_PLAN_STEPS = 10
+# 캐시 메모리를 제한하기 위한 idempotency_key 최대 길이.
+MAX_IDEMPOTENCY_KEY_LENGTH = 200
+# wait_until_safe 한 번이 요청을 붙잡아 둘 수 있는 최대 초.
+MAX_SAFE_WAIT_SECONDS = 300.0
+# 구독 가능한 상태 리소스. 세션 격리 시에는 읽는 세션의 상태를 돌려준다.
+STATE_RESOURCE_URI = "chillmcp://state"
+# 체크포인트 문서에서 세션 격리와 무관한 기본 상태를 가리키는 키.
+DEFAULT_STATE_KEY = "default"
+# 신뢰하는 client_id로 고른 상태 키의 접두사. 연결·HTTP 세션 키와 달리 재시작
+# 뒤에도 같은 클라이언트가 같은 키로 돌아오므로 체크포인트에 남긴다.
+CLIENT_KEY_PREFIX = "client:"
+# break_history_query가 한 번에 볼 수 있는 최대 일수와 최대 행 수.
+MAX_HISTORY_DAYS = 366
+MAX_HISTORY_ROWS = 100
+
+# 경보가 내려가지 않는 경우(경보 0단계, 쿨다운 꺼짐) null이 되는 초 단위 값.
+_OPTIONAL_SECONDS: dict[str, object] = {"type": ["number", "null"], "minimum": 0}
+
+# 루틴 도구의 structuredContent 스키마 (``BreakOutcome.structured_content`` 참고).
+# 텍스트 응답은 그대로 두고, 같은 값을 타입이 있는 필드로 함께 보낸다.
+BREAK_RESULT_SCHEMA: dict[str, object] = {
+    "type": "object",
+    "properties": {
+        "routine": {"type": "string"},
+        "scenario_index": {"type": "integer", "minimum": 0},
+        "stress_level": {"type": "integer", "minimum": 0, "maximum": 100},
+        "boss_alert_level": {"type": "integer", "minimum": 0, "maximum": 5},
+        "boss_alert_before": {"type": "integer", "minimum": 0, "maximum": 5},
+        "boss_noticed": {"type": "boolean"},
+        "stress_reduction": {"type": "integer"},
+        "delay_seconds": {"type": "number", "minimum": 0},
+        "commit_seq": {"type": "integer", "minimum": 1},
+        "summary": {"type": "string"},
+        "seconds_until_alert_decrement": _OPTIONAL_SECONDS,
+        "seconds_until_alert_zero": _OPTIONAL_SECONDS,
+    },
+    "required": [
+        "routine",
+        "scenario_index",
+        "stress_level",
+        "boss_alert_level",
+        "boss_alert_before",
+        "boss_noticed",
+        "stress_reduction",
+        "delay_seconds",
+        "commit_seq",
+        "summary",
+        "seconds_until_alert_decrement",
+        "seconds_until_alert_zero",
+    ],
+}
+
+PLAN_RESULT_SCHEMA: dict[str, object] = {
+    "type": "object",
+    "properties": {
+        "stress_level": {"type": "integer", "minimum": 0, "maximum": 100},
+        "boss_alert_level": {"type": "integer", "minimum": 0, "maximum": 5},
+        "stress_reduction": {"type": "integer"},
+        "delay_seconds": {"type": "number", "minimum": 0},
+        "commit_seq": {"type": "integer", "minimum": 1},
+        "seconds_until_alert_decrement": _OPTIONAL_SECONDS,
+        "seconds_until_alert_zero": _OPTIONAL_SECONDS,
+        "steps": {"type": "array", "items": BREAK_RESULT_SCHEMA},
+    },
+    "required": [
+        "stress_level",
+        "boss_alert_level",
+        "stress_reduction",
+        "delay_seconds",
+        "commit_seq",
+        "seconds_until_alert_decrement",
+        "seconds_until_alert_zero",
+        "steps",
+    ],
+}
+
+# get_status 도구의 structuredContent 스키마 (``ChillState.status`` 참고).
+STATUS_SCHEMA: dict[str, object] = {
+    "type": "object",
+    "properties": {
+        "stress_level": {"type": "integer", "minimum": 0, "maximum": 100},
+        "boss_alert_level": {"type": "integer", "minimum": 0, "maximum": 5},
+        "seconds_until_alert_decrement": _OPTIONAL_SECONDS,
+        "seconds_until_alert_zero": _OPTIONAL_SECONDS,
+        "seconds_until_no_delay": _OPTIONAL_SECONDS,
+        "commit_seq": {"type": "integer", "minimum": 0},
+    },
+    "required": [
+        "stress_level",
+        "boss_alert_level",
+        "seconds_until_alert_decrement",
+        "seconds_until_alert_zero",
+        "seconds_until_no_delay",
+        "commit_seq",
+    ],
+}
+
+
+# wait_until_safe 도구의 structuredContent 스키마: 상태에 도달 여부와 대기 시간을 더한다.
+WAIT_RESULT_SCHEMA: dict[str, object] = {
+    "type": "object",
+    "properties": {
+        **STATUS_SCHEMA["properties"],
+        "reached": {"type": "boolean"},
+        "waited_seconds": {"type": "number", "minimum": 0},
+    },
+    "required": [*STATUS_SCHEMA["required"], "reached", "waited_seconds"],
+}
+
+
+# break_history_query 도구의 structuredContent 스키마 (``BreakHistory.query`` 참고).
+HISTORY_RESULT_SCHEMA: dict[str, object] = {
+    "type": "object",
+    "properties": {
+        "group_by": {"type": "string", "enum": list(HISTORY_GROUP_BY)},
+        "days": {"type": "integer", "minimum": 1},
+        "rows": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "count": {"type": "integer", "minimum": 1},
+                    "total_reduction": {"type": "integer"},
+                    "avg_reduction": {"type": "number"},
+                    "max_reduction": {"type": "integer"},
+                    "avg_delay": {"type": "number", "minimum": 0},
+                    "boss_noticed": {"type": "integer", "minimum": 0},
+                },
+                "required": [
+                    "count",
+                    "total_reduction",
+                    "avg_reduction",
+                    "max_reduction",
+                    "avg_delay",
+                    "boss_noticed",
+                ],
+            },
+        },
+        "pending_events": {"type": "integer", "minimum": 0},
+    },
+    "required": ["group_by", "days", "rows", "pending_events"],
+}
+
+
+def _payload_bytes(payload: dict) -> int:
+    """응답 텍스트의 UTF-8 바이트 수."""
+
+    return len(payload["content"][0]["text"].encode("utf-8"))
+
+
+def _format_seconds(seconds: object) -> str:
+    return "없음" if seconds is None else f"{seconds:.1f}초"
+
+
+def _status_text(status: dict[str, object]) -> str:
+    """``ChillState.status`` 결과를 휴식 응답과 같은 키 형식의 텍스트로 만든다."""
+
+    return (
+        f"Status: 다음 경보 감소까지 {_format_seconds(status['seconds_until_alert_decrement'])}"
+        f" | 경보 0단계까지 {_format_seconds(status['seconds_until_alert_zero'])}"
+        f" | 지연 없는 휴식까지 {_format_seconds(status['seconds_until_no_delay'])}\n"
+        f"Stress Level: {status['stress_level']}\n"
+        f"Boss Alert Level: {status['boss_alert_level']}"
+    )
+
+
+class _ConnectionKeys:
+    """요청이 속한 클라이언트 연결을 연결 수명 동안 유지되는 상태 키로 바꾼다.
+
+    MCP SDK v2는 요청마다 ``ServerSession``과 ``Connection``을 새로 만들고,
+    2026-07-28 프로토콜에는 세션 ID도 없어 ``ctx.session_id``가 요청마다 바뀐다.
+    그래서 다음 순서로 연결을 구분한다.
+
+    1. ``trust_client_id``가 켜져 있으면 요청 ``_meta.client_id``
+    2. streamable HTTP 세션 ID (``mcp-session-id``, 세션을 쓰는 이전 프로토콜)
+    3. stdio·메모리 전송처럼 한 스트림을 계속 쓰는 연결의 송신 채널
+       (``Connection.outbound``). 연결이 끝나면 약한 참조라 함께 사라진다.
+
+    세션 ID가 없는 HTTP 요청은 모든 클라이언트가 송신 채널을 공유하므로
+    연결을 구분할 수 없어 None(기본 상태)을 돌려준다.
+    """
+
+    def __init__(self, *, trust_client_id: bool = False) -> None:
+        self.trust_client_id = trust_client_id
+        self._streams: weakref.WeakKeyDictionary[object, str] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._seq = itertools.count(1)
+
+    def __call__(self, ctx: Context) -> str | None:
+        client_id = ctx.client_id if self.trust_client_id else None
+        if client_id:
+            return f"{CLIENT_KEY_PREFIX}{client_id}"
+        request_ctx = ctx.request_context
+        if request_ctx is None:
+            return None
+        connection = getattr(request_ctx.session, "_connection", None)
+        session_id = getattr(connection, "session_id", None)
+        request = request_ctx.request
+        if session_id is None and request is not None:
+            session_id = request.headers.get("mcp-session-id")
+        if session_id:
+            return f"session:{session_id}"
+        outbound = getattr(connection, "outbound", None)
+        if request is not None or outbound is None:
+            return None
+        key = self._streams.get(outbound)
+        if key is None:
+            key = f"connection:{next(self._seq)}"
+            self._streams[outbound] = key
+        return key
+
+
+class _CatalogReloadMiddleware(Middleware):
+    """요청이 들어올 때마다 카탈로그 파일 변경을 (간격 제한을 두고) 확인한다."""
+
+    def __init__(self, server: "ChillServer") -> None:
+        self._server = server
+
+    async def on_request(self, context: MiddlewareContext, call_next):
+        await self._server.refresh_catalog(context.fastmcp_context)
+        return await call_next(context)
 
 
 class ChillServer:
@@ -18,114 +280,834 @@ class ChillServer:
         boss_alertness_cooldown: int = 300,
         stress_increase_rate: int = 10,
         rng_seed: int | None = None,
+        session_isolation: bool = False,
+        session_ttl: float = 1800.0,
+        max_sessions: int = 4096,
+        trust_client_id: bool = False,
+        clock: Clock | None = None,
+        max_delayed_calls: int | None = None,
+        delay_overflow: OverflowPolicy = "queue",
+        max_delay_queue: int | None = None,
+        routine_catalog: str | os.PathLike[str] | None = None,
+        catalog_reload_interval: float = 2.0,
+        output_profile: OutputProfile = "full",
+        idempotency_ttl: float = 600.0,
+        idempotency_max_entries: int = 10000,
+        state_notify_interval: float = 1.0,
+        checkpoint_path: str | os.PathLike[str] | None = None,
+        checkpoint_interval: float = 30.0,
+        history_path: str | os.PathLike[str] | None = None,
+        history_batch_size: int = 256,
+        history_flush_interval: float = 0.5,
     ) -> None:
-        boss_alertness = max(0, min(100, boss_alertness))
-        boss_alertness_cooldown = max(0, boss_alertness_cooldown)
-        stress_increase_rate = max(1, stress_increase_rate)
+        if output_profile not in OUTPUT_PROFILES:
+            raise ValueError(f"알 수 없는 출력 프로필입니다: {output_profile}")
+        self.clock = clock
+        # 도구 호출에서 output_profile을 생략했을 때 쓰는 기본 응답 상세 수준.
+        self.output_profile: OutputProfile = output_profile
+        self.boss_alertness = max(0, min(100, boss_alertness))
+        self.boss_alertness_cooldown = max(0, boss_alertness_cooldown)
+        self.stress_increase_rate = max(1, stress_increase_rate)
+        self.rng_seed = rng_seed
+        # 모든 세션 상태가 하나의 지연 스케줄러와 동시 지연 한도를 공유한다.
+        self.delay_scheduler = DelayScheduler(
+            max_active=max_delayed_calls,
+            policy=delay_overflow,
+            max_queue=max_delay_queue,
+            time_fn=clock.time if clock is not None else time.monotonic,
+            sleep_fn=clock.sleep if clock is not None else None,
+            manual_time=isinstance(clock, VirtualClock),
+        )
+        if isinstance(clock, VirtualClock):
+            # 안전 대기자는 가상 시계를 스스로 돌리지 않고 advance_clock을 기다린다.
+            clock.add_listener(self.delay_scheduler.notify_time_advanced)
 
-        self.state = ChillState(
-            boss_alertness=boss_alertness,
-            boss_alertness_cooldown=boss_alertness_cooldown,
-            stress_increase_rate=stress_increase_rate,
-            rng_seed=rng_seed,
+        # 상태 리소스 구독자에게 보내는 변경 알림을 최대 빈도로 묶는다 (벽시계 기준).
+        self.subscription_bus = InMemorySubscriptionBus()
+        self.notifier = StateNotifier(
+            min_interval=state_notify_interval, bus=self.subscription_bus
         )
+        self.state = self._new_state(on_commit=self._on_state_commit)
+        # 세션 격리가 켜져 있으면 MCP 세션마다 독립적인 상태를 지연 생성한다.
+        self.sessions: StateRegistry | None = None
+        # 요청 _meta.client_id를 세션 키로 믿을지 여부 (앞단에서 검증할 때만 켠다).
+        self.trust_client_id = trust_client_id
+        self._connection_keys = _ConnectionKeys(trust_client_id=trust_client_id)
+        if session_isolation:
+            self.sessions = StateRegistry(
+                self._new_state,
+                ttl_seconds=session_ttl,
+                max_sessions=max_sessions,
+                time_fn=clock.time if clock is not None else time.monotonic,
+            )
+        # 상태 체크포인트: 시작할 때 한 번 읽어 복원하고, 이후 변경을 모아 기록한다.
+        self.checkpointer: StateCheckpointer | None = None
+        self._checkpoint_cache: dict[str, tuple[int, dict]] = {}
+        if checkpoint_path is not None:
+            self.checkpointer = StateCheckpointer(
+                checkpoint_path,
+                collect=self._checkpoint_document,
+                interval=checkpoint_interval,
+            )
+            self._restore_checkpoint()
+            self.checkpointer.start()
+        # 휴식 결과를 SQLite에 추가 전용 이벤트로 남긴다 (선택 사항).
+        self.history: BreakHistory | None = None
+        if history_path is not None:
+            self.history = BreakHistory(
+                history_path,
+                batch_size=history_batch_size,
+                flush_interval=history_flush_interval,
+            )
+        self.cancelled_calls = 0
+        # wait_until_safe로 경보 하강을 기다리는 중인 요청 수.
+        self.safe_waiters = 0
+        # idempotency_key로 재시도된 휴식 호출의 결과를 세션별로 재사용한다.
+        self.idempotency: IdempotencyCache[ToolResult] = IdempotencyCache(
+            ttl_seconds=idempotency_ttl,
+            max_entries=idempotency_max_entries,
+            time_fn=clock.time if clock is not None else time.monotonic,
+        )
+        # 카탈로그 파일이 없으면 내장 ROUTINES만 사용하고 리로드하지 않는다.
+        self.catalog = RoutineCatalog(
+            routine_catalog, reload_interval=catalog_reload_interval
+        )
+        self._routine_tools: dict[str, str] = {}
+        self.metrics = MetricsRegistry([*self.catalog.snapshot(), PLAN_TOOL_NAME])
+        self._register_metric_collectors()
         self.mcp = FastMCP("ChillMCP")
         self._register_routines()
+        self._register_metrics_endpoints()
+        self._register_status_tool()
+        self._register_state_resource()
+        if self.history is not None:
+            self._register_history_tool(self.history)
+        if self.catalog.path is not None:
+            self.mcp.add_middleware(_CatalogReloadMiddleware(self))
+        if isinstance(clock, VirtualClock):
+            self._register_clock_tools(clock)
 
-    def _register_routines(self) -> None:
-        """각 휴식 루틴을 FastMCP 도구로 등록한다."""
+    def _new_state(self, on_commit: Callable[[], None] | None = None) -> ChillState:
+        """서버 설정으로 초기화된 새 상태 객체를 만든다.
 
-        routines_by_name = {r.name: r for r in ROUTINES}
+        ``chillmcp://state`` 리소스는 기본 상태만 보여 주므로, 세션 상태의 커밋은
+        구독 알림 없이 체크포인트만 갱신 대상으로 표시한다.
+        """
 
-        @self.mcp.tool(
-            name="take_a_break",
-            description="짧은 스트레칭과 호흡 운동으로 긴장을 풀어주는 휴식 루틴",
+        if on_commit is None:
+            on_commit = self._on_session_commit
+
+        if self.clock is None:
+            return ChillState(
+                boss_alertness=self.boss_alertness,
+                boss_alertness_cooldown=self.boss_alertness_cooldown,
+                stress_increase_rate=self.stress_increase_rate,
+                rng_seed=self.rng_seed,
+                delay_scheduler=self.delay_scheduler,
+                on_commit=on_commit,
+            )
+        return ChillState(
+            boss_alertness=self.boss_alertness,
+            boss_alertness_cooldown=self.boss_alertness_cooldown,
+            stress_increase_rate=self.stress_increase_rate,
+            rng_seed=self.rng_seed,
+            time_fn=self.clock.time,
+            sleep_fn=self.clock.sleep,
+            delay_scheduler=self.delay_scheduler,
+            on_commit=on_commit,
         )
-        async def take_a_break():
-            return await self.state.perform_break(routines_by_name["take_a_break"])
 
-        @self.mcp.tool(
-            name="watch_netflix",
-            description="넷플릭스 콘텐츠 감상으로 창의력을 충전하는 루틴",
+    def _on_state_commit(self) -> None:
+        self.notifier.mark_changed(STATE_RESOURCE_URI)
+        self._on_session_commit()
+
+    def _on_session_commit(self) -> None:
+        if self.checkpointer is not None:
+            self.checkpointer.mark_dirty()
+
+    def _session_key(self, ctx: Context) -> str | None:
+        return self._connection_keys(ctx)
+
+    def _history_session(self, ctx: Context) -> str:
+        """이벤트에 남길 상태 키. 세션 격리가 꺼져 있으면 모두 기본 상태다."""
+
+        if self.sessions is None:
+            return DEFAULT_STATE_KEY
+        return self._session_key(ctx) or DEFAULT_STATE_KEY
+
+    def _clock_offset(self) -> float | None:
+        """실제 시계일 때 벽시계와 monotonic 시각의 차이. 가상·가속 시계면 None."""
+
+        if self.clock is not None:
+            return None
+        return time.time() - time.monotonic()
+
+    def _states(self) -> Iterator[tuple[str, ChillState]]:
+        yield DEFAULT_STATE_KEY, self.state
+        if self.sessions is not None:
+            for session_key in list(self.sessions):
+                state = self.sessions.peek(session_key)
+                if state is not None:
+                    yield session_key, state
+
+    def _is_durable_state_key(self, key: str) -> bool:
+        """재시작 뒤에도 같은 클라이언트가 다시 고를 수 있는 상태 키인지 판단한다."""
+
+        if key == DEFAULT_STATE_KEY:
+            return True
+        return self.trust_client_id and key.startswith(CLIENT_KEY_PREFIX)
+
+    def _checkpoint_document(self) -> CheckpointDocument:
+        """모든 상태의 체크포인트 문서를 만든다 (이벤트 루프 위에서 호출).
+
+        마지막 수집 이후 커밋이 없는 상태는 이전 스냅샷을 그대로 재사용한다.
+        연결·HTTP 세션 키의 상태는 재시작하면 다시 찾아올 수 없으므로 남기지 않는다.
+        """
+
+        cache: dict[str, tuple[int, dict]] = {}
+        for key, state in self._states():
+            if not self._is_durable_state_key(key):
+                continue
+            cached = self._checkpoint_cache.get(key)
+            if cached is None or cached[0] != state.commit_seq:
+                cached = (state.commit_seq, state.checkpoint())
+            cache[key] = cached
+        self._checkpoint_cache = cache
+        return {
+            "version": CHECKPOINT_VERSION,
+            "saved_at": time.time(),
+            "clock_time": self.state.time_fn(),
+            "clock_offset": self._clock_offset(),
+            "states": {key: snapshot for key, (_, snapshot) in cache.items()},
+        }
+
+    def _restore_checkpoint(self) -> None:
+        """체크포인트 파일이 있으면 한 번 읽어 기본·세션 상태를 복원한다.
+
+        실제 시계로 저장·복원하면 벽시계 차이만큼 시각을 옮겨 꺼져 있던 동안의
+        스트레스 상승과 경보 쿨다운을 반영한다. 가상·가속 시계에서는 저장 당시의
+        경과 시간을 그대로 유지한다. 읽을 수 없는 파일은 경고 후 무시한다.
+        """
+
+        assert self.checkpointer is not None
+        try:
+            document = self.checkpointer.load()
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring checkpoint %s: %s", self.checkpointer.path, exc)
+            return
+        if document is None:
+            return
+        saved_offset, offset = document.get("clock_offset"), self._clock_offset()
+        if saved_offset is not None and offset is not None:
+            shift = float(saved_offset) - offset
+        else:
+            shift = self.state.time_fn() - float(document["clock_time"])
+        restored = skipped = 0
+        for key, snapshot in document["states"].items():
+            if key == DEFAULT_STATE_KEY:
+                state = self.state
+            elif self.sessions is not None and self._is_durable_state_key(key):
+                state = self.sessions.get(key)
+            else:
+                skipped += 1
+                continue
+            try:
+                state.restore_checkpoint(snapshot, shift=shift)
+            except (KeyError, TypeError, ValueError) as exc:
+                logger.warning("Skipping checkpointed state %s: %s", key, exc)
+                skipped += 1
+                continue
+            restored += 1
+        logger.info(
+            "Restored %d state(s) from checkpoint %s (skipped %d)",
+            restored,
+            self.checkpointer.path,
+            skipped,
         )
-        async def watch_netflix():
-            return await self.state.perform_break(routines_by_name["watch_netflix"])
 
-        @self.mcp.tool(
-            name="show_meme",
-            description="사내 밈을 탐색하며 분위기를 전환하는 루틴",
+    def state_for(self, ctx: Context | None) -> ChillState:
+        """도구 호출이 속한 MCP 세션의 상태를 반환한다."""
+
+        if self.sessions is None or ctx is None:
+            return self.state
+        session_key = self._session_key(ctx)
+        if session_key is None:
+            # 세션 정보가 없는 호출(직접 호출 등)은 기본 상태를 공유한다.
+            return self.state
+        return self.sessions.get(session_key)
+
+    async def _run_routine(
+        self,
+        ctx: Context,
+        routine: BreakRoutine,
+        output_profile: OutputProfile | None = None,
+        max_wait: float | None = None,
+    ) -> ToolResult:
+        """세션 상태에서 휴식을 실행하고 결과를 지표에 기록한다.
+
+        텍스트 콘텐츠는 기존과 같은 페이로드 JSON이고, structuredContent에는
+        같은 결과가 ``BREAK_RESULT_SCHEMA`` 형태로 담긴다. 지연이 ``max_wait``를
+        넘으면 ``BreakDeferred``가 그대로 전파된다.
+        """
+
+        state = self.state_for(ctx)
+        started = time.perf_counter()
+        with self._track_failures(routine.name, started):
+            outcome = await state.run_break(
+                routine,
+                label=routine.name,
+                profile=output_profile or self.output_profile,
+                max_wait=max_wait,
+            )
+        self.metrics.observe_break(
+            routine.name,
+            outcome,
+            routine=routine,
+            latency=time.perf_counter() - started,
+            response_bytes=_payload_bytes(outcome.payload),
+        )
+        if self.history is not None:
+            self.history.record(self._history_session(ctx), [outcome])
+        return ToolResult(
+            content=outcome.payload, structured_content=outcome.structured_content()
         )
-        async def show_meme():
-            return await self.state.perform_break(routines_by_name["show_meme"])
 
-        @self.mcp.tool(
-            name="bathroom_break",
-            description="화장실 잠입 작전으로 조용한 개인 시간을 확보",
+    async def _run_plan(
+        self,
+        ctx: Context,
+        names: Sequence[str],
+        output_profile: OutputProfile | None = None,
+        max_wait: float | None = None,
+    ) -> ToolResult:
+        """루틴 이름 목록을 검증한 뒤 한 트랜잭션으로 실행한다.
+
+        합산한 보스 경보 지연이 ``max_wait``를 넘으면 ``BreakDeferred``가
+        그대로 전파된다.
+        """
+
+        if not names:
+            raise ToolError("routines에 실행할 루틴 이름을 한 개 이상 넣어 주세요.")
+        if len(names) > MAX_PLAN_STEPS:
+            raise ToolError(
+                f"한 번에 실행할 수 있는 루틴은 최대 {MAX_PLAN_STEPS}개입니다."
+            )
+        # 카탈로그 스냅샷을 한 번만 읽어 계획 전체가 같은 버전의 루틴을 쓴다.
+        snapshot = self.catalog.snapshot()
+        unknown = [name for name in names if name not in snapshot]
+        if unknown:
+            raise ToolError(f"알 수 없는 루틴입니다: {', '.join(unknown)}")
+        routines = [snapshot[name] for name in names]
+
+        state = self.state_for(ctx)
+        started = time.perf_counter()
+        with self._track_failures(PLAN_TOOL_NAME, started):
+            plan = await state.run_break_plan(
+                routines,
+                profile=output_profile or self.output_profile,
+                label=PLAN_TOOL_NAME,
+                max_wait=max_wait,
+            )
+        self.metrics.observe_plan(
+            PLAN_TOOL_NAME,
+            plan,
+            routines=routines,
+            latency=time.perf_counter() - started,
+            response_bytes=_payload_bytes(plan.payload),
         )
-        async def bathroom_break():
-            return await self.state.perform_break(routines_by_name["bathroom_break"])
+        if self.history is not None:
+            self.history.record(self._history_session(ctx), plan.steps)
+        return ToolResult(
+            content=plan.payload, structured_content=plan.structured_content()
+        )
+
+    async def _idempotent(
+        self,
+        ctx: Context | None,
+        idempotency_key: str | None,
+        fingerprint: tuple,
+        call: Callable[[], Awaitable[ToolResult]],
+    ) -> ToolResult:
+        """``idempotency_key``가 있으면 같은 세션의 이전 결과를 재사용한다.
+
+        재사용된 응답은 ``ChillState``와 지표를 건드리지 않고, 원래 호출이
+        아직 20초 지연 중이면 그 결과를 함께 기다린다.
+        """
+
+        if idempotency_key is None:
+            return await call()
+        if not idempotency_key or len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            raise ToolError(
+                f"idempotency_key는 1~{MAX_IDEMPOTENCY_KEY_LENGTH}자여야 합니다."
+            )
+        # 키의 범위는 state_for가 고르는 상태와 같다. 세션 격리가 꺼져 있으면 모든
+        # 호출이 같은 상태를 쓰므로, 요청마다 바뀌는 세션 ID로 나누지 않는다.
+        scope = None
+        if self.sessions is not None and ctx is not None:
+            scope = self._session_key(ctx)
+        try:
+            result, replayed = await self.idempotency.run(
+                (scope, idempotency_key), fingerprint, call
+            )
+        except IdempotencyConflict as exc:
+            raise ToolError(str(exc)) from exc
+        if replayed:
+            logger.info(
+                "[tool=%s] Replayed result for idempotency key %r",
+                fingerprint[0],
+                idempotency_key,
+            )
+        return result
+
+    @contextmanager
+    def _track_failures(self, tool: str, started: float) -> Iterator[None]:
+        """취소·거절·예외로 끝난 호출을 지표와 로그에 남기고 그대로 전파한다.
+
+        MCP ``notifications/cancelled``를 받으면 SDK가 도구 핸들러를 취소한다.
+        단건 호출과 계획 모두 지연 대기와 잠금 대기가 커밋 이전에 있으므로,
+        취소된 호출은 지연 슬롯만 즉시 반납하고 ``ChillState``에는 아무 흔적도
+        남기지 않는다.
+        """
+
+        try:
+            yield
+        except asyncio.CancelledError:
+            self.cancelled_calls += 1
+            self.metrics.observe_error(
+                tool, "cancelled", latency=time.perf_counter() - started
+            )
+            logger.info(
+                "[tool=%s] cancelled by client before commit; state untouched", tool
+            )
+            raise
+        except DelayRejected:
+            self.metrics.observe_error(
+                tool, "rejected", latency=time.perf_counter() - started
+            )
+            raise
+        except BreakDeferred as deferred:
+            self.metrics.observe_error(
+                tool, "deferred", latency=time.perf_counter() - started
+            )
+            logger.info(
+                "[tool=%s] deferred: delay %.0fs exceeds caller deadline (retry after %s)",
+                tool,
+                deferred.required_delay_seconds,
+                deferred.retry_after_seconds,
+            )
+            raise
+        except Exception:
+            self.metrics.observe_error(
+                tool, "error", latency=time.perf_counter() - started
+            )
+            raise
+
+    def _register_routines(self) -> None:
+        """현재 카탈로그의 모든 루틴과 일괄 실행 도구를 FastMCP에 등록한다."""
+
+        for routine in self.catalog.snapshot().values():
+            self._add_routine_tool(routine)
 
         @self.mcp.tool(
-            name="coffee_mission",
-            description="사내 커피바 점검을 명목으로 여유를 즐기는 루틴",
+            name=PLAN_TOOL_NAME,
+            description=(
+                "여러 휴식 루틴 이름을 순서대로 받아 한 번의 호출로 모두 실행한다. "
+                "전부 적용되거나 전혀 적용되지 않으며, 단계별 결과와 최종 상태를 반환한다"
+            ),
+            output_schema=PLAN_RESULT_SCHEMA,
         )
-        async def coffee_mission():
-            return await self.state.perform_break(routines_by_name["coffee_mission"])
+        async def run_break_plan(
+            ctx: Context,
+            routines: list[str],
+            output_profile: OutputProfile | None = None,
+            idempotency_key: str | None = None,
+            deadline_seconds: float | None = None,
+            no_wait: bool = False,
+        ):
+            profile = output_profile or self.output_profile
+            max_wait = 0.0 if no_wait else deadline_seconds
+            try:
+                return await self._idempotent(
+                    ctx,
+                    idempotency_key,
+                    (
+                        PLAN_TOOL_NAME,
+                        tuple(routines),
+                        profile,
+                        deadline_seconds,
+                        no_wait,
+                    ),
+                    lambda: self._run_plan(ctx, routines, profile, max_wait),
+                )
+            except BreakDeferred as deferred:
+                # 루틴 도구와 같이, 미룬 계획은 캐시에 남지 않아 같은 키로 재시도할 수 있다.
+                return ToolResult(
+                    content=deferred.payload,
+                    structured_content=deferred.structured_content(),
+                    is_error=True,
+                )
 
-        @self.mcp.tool(
-            name="urgent_call",
-            description="긴급 전화 연기를 통해 외부 공기를 마시는 루틴",
+    def _add_routine_tool(self, routine: BreakRoutine) -> None:
+        """루틴 이름으로 호출 시점의 카탈로그를 조회하는 도구를 등록한다."""
+
+        name = routine.name
+
+        async def handler(
+            ctx: Context,
+            output_profile: OutputProfile | None = None,
+            idempotency_key: str | None = None,
+            deadline_seconds: float | None = None,
+            no_wait: bool = False,
+        ):
+            profile = output_profile or self.output_profile
+            max_wait = 0.0 if no_wait else deadline_seconds
+
+            async def call() -> ToolResult:
+                # 호출을 시작할 때 꺼낸 루틴을 끝까지 사용하므로 리로드와 섞이지 않는다.
+                current = self.catalog.get(name)
+                if current is None:
+                    raise ToolError(f"'{name}' 루틴이 카탈로그에서 제거되었습니다.")
+                return await self._run_routine(ctx, current, profile, max_wait)
+
+            try:
+                return await self._idempotent(
+                    ctx,
+                    idempotency_key,
+                    (name, profile, deadline_seconds, no_wait),
+                    call,
+                )
+            except BreakDeferred as deferred:
+                # 미룬 호출은 캐시에 남지 않으므로 같은 키로 재시도할 수 있다.
+                return ToolResult(
+                    content=deferred.payload,
+                    structured_content=deferred.structured_content(),
+                    is_error=True,
+                )
+
+        handler.__name__ = name
+        self.mcp.tool(
+            name=name,
+            description=routine.description or None,
+            output_schema=BREAK_RESULT_SCHEMA,
+        )(handler)
+        self._routine_tools[name] = routine.description
+
+    def _remove_tool(self, name: str) -> None:
+        remover = getattr(self.mcp, "remove_tool", None)
+        if remover is None:
+            remover = self.mcp.local_provider.remove_tool
+        remover(name)
+        self._routine_tools.pop(name, None)
+
+    def _sync_routine_tools(self) -> bool:
+        """카탈로그 스냅샷과 등록된 도구 목록을 맞추고, 변경 여부를 반환한다."""
+
+        snapshot = self.catalog.snapshot()
+        self.metrics.ensure_tools(snapshot)
+        changed = False
+        for name in list(self._routine_tools):
+            if name not in snapshot:
+                self._remove_tool(name)
+                changed = True
+        for name, routine in snapshot.items():
+            registered = self._routine_tools.get(name)
+            if registered == routine.description:
+                continue
+            if name in self._routine_tools:
+                self._remove_tool(name)
+            self._add_routine_tool(routine)
+            changed = True
+        return changed
+
+    async def refresh_catalog(self, ctx: Context | None = None) -> bool:
+        """카탈로그 파일 변경을 확인하고, 도구 목록이 바뀌면 클라이언트에 알린다."""
+
+        if not self.catalog.maybe_reload():
+            return False
+        if self._sync_routine_tools() and ctx is not None:
+            try:
+                await ctx.send_notification(mcp_types.ToolListChangedNotification())
+            except Exception:  # noqa: BLE001 - 알림 실패가 호출을 막으면 안 된다.
+                logger.debug("Failed to send tools/list_changed", exc_info=True)
+        return True
+
+    def _register_metric_collectors(self) -> None:
+        """도구 지표와 함께 내보낼 서버 구성 요소의 상태를 연결한다."""
+
+        self.metrics.register_collector("delay_scheduler", self.delay_scheduler.stats)
+        self.metrics.register_collector("idempotency", self.idempotency.stats)
+        self.metrics.register_collector("state_notifier", self.notifier.stats)
+        if self.checkpointer is not None:
+            self.metrics.register_collector("checkpoint", self.checkpointer.stats)
+        if self.history is not None:
+            self.metrics.register_collector("history", self.history.stats)
+        self.metrics.register_collector(
+            "server",
+            lambda: {
+                "cancelled_calls": self.cancelled_calls,
+                "safe_waiters": self.safe_waiters,
+                "catalog_version": self.catalog.version,
+                "catalog_reload_errors": self.catalog.reload_errors,
+            },
         )
-        async def urgent_call():
-            return await self.state.perform_break(routines_by_name["urgent_call"])
+        if self.sessions is not None:
+            self.metrics.register_collector("sessions", self.sessions.stats)
 
-        @self.mcp.tool(
-            name="deep_thinking",
-            description="화이트보드 앞 심층 사고 자세로 혼자만의 시간을 확보",
+        def logging_stats() -> dict[str, object]:
+            pipeline = active_pipeline()
+            return pipeline.stats() if pipeline is not None else {}
+
+        self.metrics.register_collector("logging", logging_stats)
+
+    def _register_metrics_endpoints(self) -> None:
+        """지표를 MCP 리소스와 도구로 노출한다."""
+
+        @self.mcp.resource(
+            "chillmcp://metrics",
+            name="metrics",
+            description="도구별 호출 수, 지연/응답 크기 히스토그램, 스케줄러 상태",
+            mime_type="application/json",
         )
-        async def deep_thinking():
-            return await self.state.perform_break(routines_by_name["deep_thinking"])
+        def metrics_resource() -> str:
+            return self.metrics.to_json()
 
         @self.mcp.tool(
-            name="email_organizing",
-            description="메일함 정리라는 명분으로 멀티태스킹 휴식을 실행",
+            name="get_metrics",
+            description="서버 지표를 JSON(기본) 또는 Prometheus 텍스트 형식으로 조회한다",
         )
-        async def email_organizing():
-            return await self.state.perform_break(routines_by_name["email_organizing"])
+        def get_metrics(output_format: MetricsFormat = "json") -> str:
+            if output_format == "prometheus":
+                return self.metrics.to_prometheus()
+            return self.metrics.to_json()
+
+    def _register_status_tool(self) -> None:
+        """상태를 바꾸지 않고 현재 수치와 예측 시간을 조회하는 도구를 등록한다."""
 
         @self.mcp.tool(
-            name="virtual_chimaek",
+            name="get_status",
             description=(
-                "VR 치맥 파티로 급속 회복하는 치유 루틴 (필수 루틴이 아니며 특수 상황에서만 실행)"
+                "휴식 없이 현재 스트레스·경보 수치와 다음 경보 감소, 경보 0단계, "
+                "지연 없는 휴식이 가능해지기까지 남은 초를 조회한다 (상태 변경 없음)"
             ),
+            output_schema=STATUS_SCHEMA,
         )
-        async def virtual_chimaek():
-            return await self.state.perform_break(routines_by_name["virtual_chimaek"])
+        async def get_status(ctx: Context) -> ToolResult:
+            status = self.state_for(ctx).status()
+            return ToolResult(
+                content={"content": [{"type": "text", "text": _status_text(status)}]},
+                structured_content=status,
+            )
 
         @self.mcp.tool(
-            name="emergency_clockout",
+            name="wait_until_safe",
             description=(
-                "긴급 퇴근 시나리오를 즉시 실행하는 최종 루틴 (필수 루틴이 아니며 특수 상황에서만 실행)"
+                "쿨다운으로 상사 경보가 max_level 이하가 될 때까지 서버에서 기다렸다가 "
+                f"상태를 돌려준다 (timeout 최대 {MAX_SAFE_WAIT_SECONDS:.0f}초, 상태 변경 없음)"
             ),
+            output_schema=WAIT_RESULT_SCHEMA,
         )
-        async def emergency_clockout():
-            return await self.state.perform_break(
-                routines_by_name["emergency_clockout"]
+        async def wait_until_safe(
+            ctx: Context, max_level: int = 0, timeout: float = 60.0
+        ) -> ToolResult:
+            state = self.state_for(ctx)
+            if not 0 <= max_level <= state.max_boss_alert:
+                raise ToolError(
+                    f"max_level은 0~{state.max_boss_alert} 사이여야 합니다."
+                )
+            if not 0 <= timeout <= MAX_SAFE_WAIT_SECONDS:
+                raise ToolError(
+                    f"timeout은 0~{MAX_SAFE_WAIT_SECONDS:.0f}초 사이여야 합니다."
+                )
+            self.safe_waiters += 1
+            try:
+                reached, waited = await state.wait_until_alert_at_most(
+                    max_level, timeout
+                )
+            finally:
+                self.safe_waiters -= 1
+            status = {
+                **state.status(),
+                "reached": reached,
+                "waited_seconds": round(waited, 3),
+            }
+            headline = (
+                f"Wait Result: 경보 {max_level}단계 이하 도달 ({waited:.1f}초 대기)"
+                if reached
+                else f"Wait Result: 시간 초과 ({waited:.1f}초 대기)"
+            )
+            return ToolResult(
+                content={
+                    "content": [
+                        {"type": "text", "text": f"{headline}\n{_status_text(status)}"}
+                    ]
+                },
+                structured_content=status,
             )
 
+    def _register_state_resource(self) -> None:
+        """상태 리소스와 구독 요청 처리기를 등록한다.
+
+        FastMCP는 구독 요청을 처리하지 않으므로 저수준 서버에 직접 등록한다.
+        2026-07-28 이후 클라이언트는 ``subscriptions/listen``, 이전 클라이언트는
+        ``resources/subscribe``로 구독하고, 알림은 ``StateNotifier``가 묶어서
+        보낸다. 경보가 시간에 따라 내려가는 것은 커밋이 아니므로 알리지 않는다.
+        리소스와 알림은 모두 기본 상태만 다루며, 격리된 세션 상태는 각 세션이
+        ``get_status``로 조회한다.
+        """
+
+        @self.mcp.resource(
+            STATE_RESOURCE_URI,
+            name="state",
+            description=(
+                "기본 상태의 현재 스트레스·경보 수치와 예측 시간 "
+                "(resources/subscribe 지원, 세션 격리 상태는 포함하지 않음)"
+            ),
+            mime_type="application/json",
+        )
+        def state_resource() -> str:
+            # 알림은 URI 하나에 모든 구독자가 공유하므로, 읽기도 세션과 무관하게
+            # 기본 상태를 돌려줘야 알림과 읽은 값이 같은 상태를 가리킨다.
+            return json.dumps(self.state.status())
+
+        def subscriber(ctx) -> tuple[Hashable, object]:
+            session = ctx.session
+            # 요청마다 ServerSession이 새로 만들어질 수 있어 연결 객체로 구독자를 구분한다.
+            return getattr(session, "_connection", session), session
+
+        async def on_subscribe(ctx, params: mcp_types.SubscribeRequestParams):
+            uri = str(params.uri)
+            if uri != STATE_RESOURCE_URI:
+                raise MCPError(
+                    mcp_types.INVALID_PARAMS, f"구독할 수 없는 리소스입니다: {uri}"
+                )
+            key, session = subscriber(ctx)
+            try:
+                self.notifier.subscribe(uri, key, session)
+            except ValueError as exc:
+                raise MCPError(mcp_types.INVALID_PARAMS, str(exc)) from None
+            return mcp_types.EmptyResult()
+
+        async def on_unsubscribe(ctx, params: mcp_types.UnsubscribeRequestParams):
+            key, _ = subscriber(ctx)
+            self.notifier.unsubscribe(str(params.uri), key)
+            return mcp_types.EmptyResult()
+
+        # FastMCP가 구독 처리기 등록 API를 공개하지 않아 내부 저수준 서버를 쓴다.
+        # 구조가 바뀐 버전에서는 리소스 읽기만 제공하고 구독은 끈다.
+        lowlevel = getattr(self.mcp, "_mcp_server", None)
+        if not hasattr(lowlevel, "add_request_handler"):
+            logger.warning(
+                "FastMCP low-level server is unavailable; "
+                "%s subscriptions are disabled",
+                STATE_RESOURCE_URI,
+            )
+            return
+        lowlevel.add_request_handler(
+            "subscriptions/listen",
+            mcp_types.SubscriptionsListenRequestParams,
+            ListenHandler(self.subscription_bus),
+        )
+        lowlevel.add_request_handler(
+            "resources/subscribe", mcp_types.SubscribeRequestParams, on_subscribe
+        )
+        lowlevel.add_request_handler(
+            "resources/unsubscribe", mcp_types.UnsubscribeRequestParams, on_unsubscribe
+        )
+
+    def _register_history_tool(self, history: BreakHistory) -> None:
+        """휴식 이벤트 기록을 기간별로 집계하는 도구를 등록한다."""
+
         @self.mcp.tool(
-            name="company_dinner",
+            name="break_history_query",
             description=(
-                "가상 회식 시뮬레이션으로 사회적 체면을 챙기는 루틴 (필수 루틴이 아니며 특수 상황에서만 실행)"
+                "최근 days일(UTC, 오늘 포함)의 휴식 기록을 routine/day/scenario/session별로 "
+                "집계한다 (횟수, 스트레스 감소 합계·평균·최대, 평균 지연, 경보 상승 횟수)"
             ),
+            output_schema=HISTORY_RESULT_SCHEMA,
         )
-        async def company_dinner():
-            return await self.state.perform_break(routines_by_name["company_dinner"])
+        async def break_history_query(
+            group_by: str = "routine",
+            days: int = 7,
+            routine: str | None = None,
+            order_by: str = "avg_reduction",
+            limit: int = 20,
+        ) -> ToolResult:
+            if group_by not in HISTORY_GROUP_BY:
+                raise ToolError(
+                    f"group_by는 {', '.join(HISTORY_GROUP_BY)} 중 하나여야 합니다."
+                )
+            if order_by not in HISTORY_ORDER_BY:
+                raise ToolError(
+                    f"order_by는 {', '.join(HISTORY_ORDER_BY)} 중 하나여야 합니다."
+                )
+            if not 1 <= days <= MAX_HISTORY_DAYS:
+                raise ToolError(f"days는 1~{MAX_HISTORY_DAYS} 사이여야 합니다.")
+            if not 1 <= limit <= MAX_HISTORY_ROWS:
+                raise ToolError(f"limit은 1~{MAX_HISTORY_ROWS} 사이여야 합니다.")
+            # 인덱스 범위 조회라 빠르지만, 디스크 I/O가 이벤트 루프를 막지 않게 한다.
+            rows = await asyncio.to_thread(
+                history.query,
+                group_by=group_by,
+                days=days,
+                routine=routine,
+                order_by=order_by,
+                limit=limit,
+            )
+            result = {
+                "group_by": group_by,
+                "days": days,
+                "rows": rows,
+                "pending_events": history.stats()["queued"],
+            }
+            return ToolResult(
+                content=json.dumps(result, ensure_ascii=False),
+                structured_content=result,
+            )
 
-    def run(self, *, transport: str = "stdio") -> None:
-        """FastMCP 서버를 실행한다."""
+    def _register_clock_tools(self, clock: VirtualClock) -> None:
+        """가상 시계 모드에서 시간을 수동으로 전진시키는 도구를 등록한다."""
 
-        self.mcp.run(transport=transport)
+        @self.mcp.tool(
+            name="advance_clock",
+            description="가상 시계를 지정한 초만큼 전진시킨다 (--virtual-clock 모드 전용)",
+        )
+        async def advance_clock(seconds: float) -> str:
+            now = clock.advance(seconds)
+            return f"Virtual Clock: {now:.3f}s"
+
+    def run(
+        self,
+        *,
+        transport: Transport = "stdio",
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        path: str | None = None,
+        max_connections: int | None = None,
+        keep_alive_timeout: float = 5.0,
+        backlog: int = 2048,
+    ) -> None:
+        """FastMCP 서버를 실행한다.
+
+        ``http``(streamable HTTP)와 ``sse``는 한 프로세스가 keep-alive 연결로
+        여러 MCP 세션을 동시에 받는다. ``max_connections``를 넘는 동시 연결은
+        uvicorn이 503으로 돌려보내 과부하 시에도 메모리가 유한하게 유지된다.
+        """
+
+        if transport == "stdio":
+            self.mcp.run(transport="stdio")
+            return
+        uvicorn_config: dict[str, object] = {
+            "timeout_keep_alive": keep_alive_timeout,
+            "backlog": backlog,
+        }
+        if max_connections:
+            uvicorn_config["limit_concurrency"] = max_connections
+        self.mcp.run(
+            transport=transport,
+            host=host,
+            port=port,
+            path=path,
+            uvicorn_config=uvicorn_config,
+        )
 
 
 def create_server(
@@ -134,6 +1116,25 @@ def create_server(
     boss_alertness_cooldown: int = 300,
     stress_increase_rate: int = 10,
     rng_seed: int | None = None,
+    session_isolation: bool = False,
+    session_ttl: float = 1800.0,
+    max_sessions: int = 4096,
+    trust_client_id: bool = False,
+    clock: Clock | None = None,
+    max_delayed_calls: int | None = None,
+    delay_overflow: OverflowPolicy = "queue",
+    max_delay_queue: int | None = None,
+    routine_catalog: str | os.PathLike[str] | None = None,
+    catalog_reload_interval: float = 2.0,
+    output_profile: OutputProfile = "full",
+    idempotency_ttl: float = 600.0,
+    idempotency_max_entries: int = 10000,
+    state_notify_interval: float = 1.0,
+    checkpoint_path: str | os.PathLike[str] | None = None,
+    checkpoint_interval: float = 30.0,
+    history_path: str | os.PathLike[str] | None = None,
+    history_batch_size: int = 256,
+    history_flush_interval: float = 0.5,
 ) -> ChillServer:
     """외부에서 사용하기 위한 ChillServer 생성 팩토리."""
 
@@ -142,4 +1143,23 @@ def create_server(
         boss_alertness_cooldown=boss_alertness_cooldown,
         stress_increase_rate=stress_increase_rate,
         rng_seed=rng_seed,
+        session_isolation=session_isolation,
+        session_ttl=session_ttl,
+        max_sessions=max_sessions,
+        trust_client_id=trust_client_id,
+        clock=clock,
+        max_delayed_calls=max_delayed_calls,
+        delay_overflow=delay_overflow,
+        max_delay_queue=max_delay_queue,
+        routine_catalog=routine_catalog,
+        catalog_reload_interval=catalog_reload_interval,
+        output_profile=output_profile,
+        idempotency_ttl=idempotency_ttl,
+        idempotency_max_entries=idempotency_max_entries,
+        state_notify_interval=state_notify_interval,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=checkpoint_interval,
+        history_path=history_path,
+        history_batch_size=history_batch_size,
+        history_flush_interval=history_flush_interval,
     )
@@ -0,0 +1,124 @@
+"""MCP 세션별 ChillState를 관리하는 레지스트리 모듈."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from .state import ChillState
+
+StateFactory = Callable[[], ChillState]
+
+
+@dataclass
+class _SessionEntry:
+    """레지스트리에 보관되는 세션 상태와 마지막 접근 시각."""
+
+    state: ChillState
+    last_seen: float
+
+
+class StateRegistry:
+    """세션 ID를 키로 ChillState를 지연 생성하고 TTL/LRU로 정리한다.
+
+    항목은 접근 순서대로 ``OrderedDict``에 유지되므로 가장 오래 쓰이지 않은
+    세션이 항상 맨 앞에 위치한다. 덕분에 TTL 만료 정리와 용량 초과 시 LRU
+    축출을 모두 앞에서부터 상수 시간에 처리할 수 있다.
+    """
+
+    def __init__(
+        self,
+        factory: StateFactory,
+        *,
+        ttl_seconds: float = 1800.0,
+        max_sessions: int = 4096,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions는 1 이상이어야 합니다.")
+        self._factory = factory
+        self._ttl = max(0.0, ttl_seconds)
+        self._max_sessions = max_sessions
+        self._time_fn = time_fn
+        self._entries: OrderedDict[str, _SessionEntry] = OrderedDict()
+        self.created = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def get(self, session_id: str) -> ChillState:
+        """세션에 연결된 상태를 반환하고, 없거나 만료되었으면 새로 만든다."""
+
+        now = self._time_fn()
+        entry = self._entries.get(session_id)
+        if entry is not None and self._is_expired(entry, now):
+            del self._entries[session_id]
+            self.expired += 1
+            entry = None
+
+        if entry is None:
+            entry = _SessionEntry(state=self._factory(), last_seen=now)
+            self._entries[session_id] = entry
+            self.created += 1
+        else:
+            entry.last_seen = now
+            self._entries.move_to_end(session_id)
+
+        self._evict(now)
+        return entry.state
+
+    def peek(self, session_id: str) -> ChillState | None:
+        """접근 시각을 갱신하지 않고 상태를 조회한다."""
+
+        entry = self._entries.get(session_id)
+        return entry.state if entry is not None else None
+
+    def discard(self, session_id: str) -> None:
+        """세션 상태를 즉시 제거한다."""
+
+        self._entries.pop(session_id, None)
+
+    def prune(self) -> int:
+        """만료된 세션을 정리하고 제거된 개수를 반환한다."""
+
+        before = len(self._entries)
+        self._evict(self._time_fn())
+        return before - len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """레지스트리 사용량 요약을 반환한다."""
+
+        return {
+            "active": len(self._entries),
+            "max_sessions": self._max_sessions,
+            "created": self.created,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+    def _is_expired(self, entry: _SessionEntry, now: float) -> bool:
+        return self._ttl > 0 and now - entry.last_seen >= self._ttl
+
+    def _evict(self, now: float) -> None:
+        """TTL이 지난 세션과 용량을 넘는 LRU 세션을 앞에서부터 제거한다."""
+
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if not self._is_expired(oldest, now):
+                break
+            self._entries.popitem(last=False)
+            self.expired += 1
+
+        while len(self._entries) > self._max_sessions:
+            self._entries.popitem(last=False)
+            self.evicted += 1
@@ -0,0 +1,360 @@
+"""ChillState 상태 규칙을 NumPy 배열로 벡터화한 몬테카를로 시뮬레이터.
+
+``perform_break``/``_apply_stress_drift``/``_apply_boss_cooldown``과 동일한
+규칙을 (파라미터 조합 × 에이전트) 2차원 배열에 한 번에 적용한다. 라이브 서버를
+띄우지 않고도 ``boss_alertness``, ``boss_alertness_cooldown``,
+``stress_increase_rate`` 조합별 스트레스/경보 분포를 빠르게 비교할 수 있다.
+
+실행 예시::
+
+    python -m src.chillmcp.simulate --boss-alertness 30 50 80 \\
+        --cooldown 60 300 --stress-increase-rate 5 10 --agents 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+from dataclasses import asdict, dataclass, field, replace
+from typing import Callable, Iterable, Literal, Sequence
+
+import numpy as np
+
+from . import routines as _routines
+from .routines import ROUTINES
+from .state import BreakRoutine
+
+IntervalMode = Literal["fixed", "exponential"]
+VectorHook = Callable[[np.ndarray, np.ndarray, np.ndarray, int], None]
+
+# 최고 경보 단계에서 perform_break가 기다리는 시간(초).
+MAX_ALERT_DELAY = 20.0
+
+
+def _vector_emergency_clockout(stress, alert, mask, max_stress) -> None:
+    """비상 퇴근 훅: 스트레스와 보스 경보를 0으로 초기화한다."""
+
+    stress[mask] = 0
+    alert[mask] = 0
+
+
+def _vector_company_dinner(stress, alert, mask, max_stress) -> None:
+    """회식 훅: 스트레스를 3만큼 되돌린다."""
+
+    stress[mask] = np.minimum(max_stress, stress[mask] + 3)
+
+
+# routines.py의 post_hook과 1:1로 대응하는 벡터화 규칙.
+VECTOR_POST_HOOKS: dict[Callable, VectorHook] = {
+    _routines._emergency_clockout_post_hook: _vector_emergency_clockout,
+    _routines._company_dinner_post_hook: _vector_company_dinner,
+}
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """단일 시뮬레이션 실행에 필요한 파라미터 묶음."""
+
+    boss_alertness: int = 50
+    boss_alertness_cooldown: int = 300
+    stress_increase_rate: int = 10
+    agents: int = 10_000
+    steps: int = 60
+    call_interval: float = 60.0
+    interval_mode: IntervalMode = "fixed"
+    initial_stress: float = 50.0
+    max_stress: int = 100
+    max_boss_alert: int = 5
+    seed: int | None = None
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """시뮬레이션 종료 시점의 스트레스/경보 분포 요약."""
+
+    config: SimulationConfig
+    stress_mean: float
+    stress_std: float
+    stress_percentiles: dict[str, float]
+    alert_distribution: tuple[float, ...]
+    delayed_call_ratio: float
+    mean_reduction: float
+    trajectory_stress_mean: float = field(default=0.0)
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON 직렬화가 가능한 딕셔너리로 변환한다."""
+
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class _RoutineTable:
+    """루틴/시나리오별 스트레스 감소 범위를 배열로 펼친 테이블."""
+
+    low: np.ndarray
+    high: np.ndarray
+    scenario_counts: np.ndarray
+    hooks: tuple[tuple[int, VectorHook], ...]
+
+
+def _build_routine_table(routines: Sequence[BreakRoutine]) -> _RoutineTable:
+    """루틴 목록을 (루틴 × 시나리오) 범위 배열로 변환한다."""
+
+    if not routines:
+        raise ValueError("시뮬레이션할 루틴이 없습니다.")
+
+    width = max(len(routine.scenarios) for routine in routines)
+    low = np.zeros((len(routines), width), dtype=np.int64)
+    high = np.zeros((len(routines), width), dtype=np.int64)
+    counts = np.zeros(len(routines), dtype=np.int64)
+    hooks: list[tuple[int, VectorHook]] = []
+
+    for index, routine in enumerate(routines):
+        if not routine.scenarios:
+            raise ValueError(f"Routine '{routine.name}'에 등록된 시나리오가 없습니다.")
+        counts[index] = len(routine.scenarios)
+        for column, scenario in enumerate(routine.scenarios):
+            low[index, column], high[index, column] = scenario.stress_reduction
+        if routine.post_hook is not None:
+            hook = VECTOR_POST_HOOKS.get(routine.post_hook)
+            if hook is None:
+                raise ValueError(
+                    f"Routine '{routine.name}'의 post_hook에 대응하는 벡터화 규칙이 없습니다."
+                )
+            hooks.append((index, hook))
+
+    return _RoutineTable(low=low, high=high, scenario_counts=counts, hooks=tuple(hooks))
+
+
+def _apply_drift(stress, elapsed, rate, max_stress) -> None:
+    """``ChillState._apply_stress_drift``의 벡터화 버전."""
+
+    np.clip(stress + elapsed * rate / 60, 0, max_stress, out=stress)
+
+
+def _apply_cooldown(alert, phase, cooldown) -> None:
+    """``ChillState._apply_boss_cooldown``의 벡터화 버전.
+
+    ``phase``는 ``now - last_boss_alert_decay``에 해당하며 제자리에서 갱신된다.
+    """
+
+    idle = alert <= 0
+    phase[idle] = 0
+
+    active = ~idle & (cooldown > 0)
+    safe_cooldown = np.where(cooldown > 0, cooldown, 1)
+    steps = np.where(active, np.floor_divide(phase, safe_cooldown), 0)
+    alert -= np.minimum(alert, steps.astype(alert.dtype))
+    phase -= steps * safe_cooldown
+
+
+def _simulate_batch(
+    configs: Sequence[SimulationConfig],
+    routines: Sequence[BreakRoutine],
+    generator: np.random.Generator,
+) -> list[SimulationResult]:
+    """파라미터 조합들을 한 번에 (조합 × 에이전트) 배열로 시뮬레이션한다."""
+
+    base = configs[0]
+    shape = (len(configs), base.agents)
+    table = _build_routine_table(routines)
+
+    def column(name: str, dtype) -> np.ndarray:
+        return np.array([getattr(cfg, name) for cfg in configs], dtype=dtype)[:, None]
+
+    alertness = column("boss_alertness", np.float64)
+    cooldown = column("boss_alertness_cooldown", np.float64)
+    rate = column("stress_increase_rate", np.float64)
+    max_stress = base.max_stress
+    max_alert = base.max_boss_alert
+
+    stress = np.full(shape, float(base.initial_stress))
+    alert = np.zeros(shape, dtype=np.int64)
+    delayed_calls = np.zeros(len(configs), dtype=np.int64)
+    reduction_total = np.zeros(len(configs), dtype=np.float64)
+    stress_running = np.zeros(len(configs), dtype=np.float64)
+
+    for _ in range(base.steps):
+        # perform_break가 끝날 때 두 기준 시각을 now로 맞추므로,
+        # 다음 호출까지의 경과 시간이 곧 drift/cooldown의 경과 시간이 된다.
+        if base.interval_mode == "exponential":
+            elapsed = generator.exponential(base.call_interval, size=shape)
+        else:
+            elapsed = np.full(shape, base.call_interval)
+        phase = elapsed.copy()
+        _apply_drift(stress, elapsed, rate, max_stress)
+        _apply_cooldown(alert, phase, cooldown)
+
+        delayed = alert >= max_alert
+        if delayed.any():
+            _apply_drift(
+                stress, np.where(delayed, MAX_ALERT_DELAY, 0.0), rate, max_stress
+            )
+            delayed_phase = phase + MAX_ALERT_DELAY
+            delayed_alert = alert.copy()
+            _apply_cooldown(delayed_alert, delayed_phase, cooldown)
+            alert = np.where(delayed, delayed_alert, alert)
+            delayed_calls += delayed.sum(axis=1)
+
+        routine_index = generator.integers(0, len(routines), size=shape)
+        scenario_index = np.floor(
+            generator.random(shape) * table.scenario_counts[routine_index]
+        ).astype(np.int64)
+        low = table.low[routine_index, scenario_index]
+        high = table.high[routine_index, scenario_index]
+        reduction = generator.integers(low, high + 1)
+        stress_before = stress.copy()
+        np.clip(stress - reduction, 0, max_stress, out=stress)
+
+        noticed = generator.random(shape) * 100 < alertness
+        alert = np.where(noticed, np.minimum(max_alert, alert + 1), alert)
+
+        for hook_index, hook in table.hooks:
+            hook(stress, alert, routine_index == hook_index, max_stress)
+
+        # 서버의 stress_reduction처럼 0 하한과 후처리 훅까지 반영된 변화량을 더한다.
+        reduction_total += (stress_before - stress).sum(axis=1)
+        stress_running += stress.mean(axis=1)
+
+    calls = base.agents * max(1, base.steps)
+    results: list[SimulationResult] = []
+    for row, cfg in enumerate(configs):
+        counts = np.bincount(alert[row], minlength=max_alert + 1)
+        p5, p50, p95 = np.percentile(stress[row], [5, 50, 95])
+        results.append(
+            SimulationResult(
+                config=cfg,
+                stress_mean=float(stress[row].mean()),
+                stress_std=float(stress[row].std()),
+                stress_percentiles={
+                    "p5": float(p5),
+                    "p50": float(p50),
+                    "p95": float(p95),
+                },
+                alert_distribution=tuple(float(c) / base.agents for c in counts),
+                delayed_call_ratio=float(delayed_calls[row]) / calls,
+                mean_reduction=float(reduction_total[row]) / calls,
+                trajectory_stress_mean=float(stress_running[row]) / max(1, base.steps),
+            )
+        )
+    return results
+
+
+def simulate(
+    config: SimulationConfig,
+    routines: Sequence[BreakRoutine] = ROUTINES,
+) -> SimulationResult:
+    """단일 파라미터 조합을 시뮬레이션한다."""
+
+    generator = np.random.default_rng(config.seed)
+    return _simulate_batch([config], routines, generator)[0]
+
+
+def sweep(
+    boss_alertness: Iterable[int],
+    boss_alertness_cooldown: Iterable[int],
+    stress_increase_rate: Iterable[int],
+    *,
+    base: SimulationConfig = SimulationConfig(),
+    routines: Sequence[BreakRoutine] = ROUTINES,
+    max_batch_elements: int = 20_000_000,
+) -> list[SimulationResult]:
+    """파라미터 격자의 모든 조합을 배치 단위로 묶어 시뮬레이션한다.
+
+    조합 수 × 에이전트 수가 ``max_batch_elements``를 넘지 않도록 나눠서 처리하므로
+    격자가 커져도 메모리 사용량은 일정하게 유지된다.
+    """
+
+    configs = [
+        replace(
+            base,
+            boss_alertness=alertness,
+            boss_alertness_cooldown=cooldown,
+            stress_increase_rate=rate,
+        )
+        for alertness, cooldown, rate in itertools.product(
+            boss_alertness, boss_alertness_cooldown, stress_increase_rate
+        )
+    ]
+    generator = np.random.default_rng(base.seed)
+    batch_size = max(1, max_batch_elements // max(1, base.agents))
+
+    results: list[SimulationResult] = []
+    for start in range(0, len(configs), batch_size):
+        results.extend(
+            _simulate_batch(configs[start : start + batch_size], routines, generator)
+        )
+    return results
+
+
+def _select_routines(names: Sequence[str] | None) -> Sequence[BreakRoutine]:
+    """이름 목록에 해당하는 루틴만 골라낸다."""
+
+    if not names:
+        return ROUTINES
+    by_name = {routine.name: routine for routine in ROUTINES}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise SystemExit(f"알 수 없는 루틴: {', '.join(unknown)}")
+    return tuple(by_name[name] for name in names)
+
+
+def _format_result(result: SimulationResult) -> str:
+    """결과 한 건을 표 형태의 한 줄로 요약한다."""
+
+    cfg = result.config
+    alerts = " ".join(f"{share:.2f}" for share in result.alert_distribution)
+    pct = result.stress_percentiles
+    return (
+        f"alertness={cfg.boss_alertness:>3} cooldown={cfg.boss_alertness_cooldown:>5} "
+        f"rate={cfg.stress_increase_rate:>3} | stress mean={result.stress_mean:6.2f} "
+        f"p5/p50/p95={pct['p5']:.0f}/{pct['p50']:.0f}/{pct['p95']:.0f} "
+        f"| delayed={result.delayed_call_ratio:.3f} | alert[0..]={alerts}"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """명령행에서 파라미터 격자를 시뮬레이션하고 결과를 출력한다."""
+
+    parser = argparse.ArgumentParser(description="ChillState 몬테카를로 시뮬레이터")
+    parser.add_argument("--boss-alertness", type=int, nargs="+", default=[50])
+    parser.add_argument("--cooldown", type=int, nargs="+", default=[300])
+    parser.add_argument("--stress-increase-rate", type=int, nargs="+", default=[10])
+    parser.add_argument("--agents", type=int, default=10_000)
+    parser.add_argument("--steps", type=int, default=60)
+    parser.add_argument("--call-interval", type=float, default=60.0)
+    parser.add_argument(
+        "--interval-mode", choices=("fixed", "exponential"), default="fixed"
+    )
+    parser.add_argument("--routines", nargs="*", default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--json", action="store_true", help="결과를 JSON으로 출력합니다."
+    )
+    args = parser.parse_args(argv)
+
+    base = SimulationConfig(
+        agents=args.agents,
+        steps=args.steps,
+        call_interval=args.call_interval,
+        interval_mode=args.interval_mode,
+        seed=args.seed,
+    )
+    results = sweep(
+        args.boss_alertness,
+        args.cooldown,
+        args.stress_increase_rate,
+        base=base,
+        routines=_select_routines(args.routines),
+    )
+
+    if args.json:
+        print(json.dumps([result.to_dict() for result in results], ensure_ascii=False))
+        return
+    for result in results:
+        print(_format_result(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,126 @@ import asyncio
 import logging
 import random
 import time
-from dataclasses import dataclass, field
-from typing import Awaitable, Callable, Sequence, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Awaitable, Callable, Iterator, Literal, Sequence, Tuple
+
+from .scheduler import DelayScheduler
 
 # 타입 힌트용 별칭 정의
 ExtraLineFactory = Callable[["ChillState"], Sequence[str]]
 PostHook = Callable[["ChillState"], None]
 AsyncSleepFn = Callable[[float], Awaitable[None]]
 
+# 응답 텍스트의 상세 수준. ``Stress Level``/``Boss Alert Level`` 줄은 모든
+# 프로필에서 동일하고, ``Break Summary``만 달라진다.
+#   full    - 헤드라인, 디테일 문장, 경보 상태 문장 전부
+#   compact - 헤드라인만 (경보가 올랐을 때는 짧은 표시 추가)
+#   numeric - ``Break Summary`` 줄 없이 수치 두 줄만
+OutputProfile = Literal["full", "compact", "numeric"]
+OUTPUT_PROFILES: Tuple[OutputProfile, ...] = ("full", "compact", "numeric")
+
+
+@dataclass(frozen=True, init=False)
+class Choice:
+    """렌더링할 때마다 후보 문장 중 하나를 무작위로 고르는 디테일 슬롯."""
+
+    options: Tuple[str, ...]
+
+    def __init__(self, *options: str) -> None:
+        if not options:
+            raise ValueError("Choice에는 최소 한 개의 후보가 필요합니다.")
+        object.__setattr__(self, "options", tuple(options))
+
+
+@dataclass(frozen=True)
+class RandInt:
+    """템플릿의 ``{}`` 자리에 ``[low, high]`` 범위의 난수를 채우는 디테일 슬롯."""
+
+    template: str
+    low: int
+    high: int
+
+
+DetailSlot = str | Choice | RandInt
+
+# 컴파일된 시나리오의 렌더링 명령 종류
+_OP_STATIC = 0
+_OP_CHOICE = 1
+_OP_RANDINT = 2
+
+
+def sanitize_line(line: str) -> str:
+    """응답 파서가 헷갈리지 않도록 콜론을 하이픈으로 바꾼다."""
+
+    return line.replace(":", " -")
+
+
+@dataclass(frozen=True)
+class CompiledScenario:
+    """정적 문장을 미리 정리해 둔 시나리오 렌더링 프로그램.
+
+    연속된 정적 문장은 헤드라인과 함께 미리 콜론을 치환하고 `` | ``로
+    이어 붙여 하나의 문자열로 합친다. 렌더링 시에는 난수 슬롯만 골라
+    채우면 되므로, 호출마다 목록을 새로 만들거나 문장을 치환하지 않는다.
+    """
+
+    ops: Tuple[Tuple[int, object], ...]
+
+    @classmethod
+    def build(cls, headline: str, slots: Sequence[DetailSlot]) -> "CompiledScenario":
+        """헤드라인과 디테일 슬롯을 렌더링 명령 목록으로 변환한다."""
+
+        ops: list[Tuple[int, object]] = []
+        pending: list[str] = []
+
+        def flush() -> None:
+            if pending:
+                ops.append((_OP_STATIC, " | ".join(pending)))
+                pending.clear()
+
+        for slot in (headline, *slots):
+            if isinstance(slot, str):
+                if slot:
+                    pending.append(sanitize_line(slot))
+            elif isinstance(slot, Choice):
+                flush()
+                ops.append(
+                    (_OP_CHOICE, tuple(sanitize_line(item) for item in slot.options))
+                )
+            elif isinstance(slot, RandInt):
+                flush()
+                ops.append(
+                    (_OP_RANDINT, (sanitize_line(slot.template), slot.low, slot.high))
+                )
+            else:
+                raise TypeError(f"지원하지 않는 디테일 슬롯입니다: {slot!r}")
+        flush()
+        return cls(ops=tuple(ops))
+
+    @property
+    def rng_draws(self) -> int:
+        """렌더링 한 번에 소비하는 난수 개수."""
+
+        return sum(1 for op, _ in self.ops if op != _OP_STATIC)
+
+    def render(self, rng: random.Random) -> list[str]:
+        """난수 슬롯을 채워 ``Break Summary`` 조각 목록을 만든다."""
+
+        parts: list[str] = []
+        for op, value in self.ops:
+            if op == _OP_STATIC:
+                parts.append(value)
+            elif op == _OP_CHOICE:
+                line = rng.choice(value)
+                if line:
+                    parts.append(line)
+            else:
+                template, low, high = value
+                parts.append(template.format(rng.randint(low, high)))
+        return parts
+
 
 @dataclass(frozen=True)
 class RoutineScenario:
@@ -21,7 +133,18 @@ class RoutineScenario:
 
     headline: str
     stress_reduction: Tuple[int, int]
-    detail_lines: ExtraLineFactory | Sequence[str] | None = None
+    detail_lines: ExtraLineFactory | Sequence[DetailSlot] | None = None
+
+    @cached_property
+    def compiled(self) -> CompiledScenario | None:
+        """슬롯 기반 시나리오를 처음 쓸 때 한 번만 컴파일한다.
+
+        임의의 팩토리 함수로 만든 시나리오는 컴파일할 수 없으므로 ``None``이다.
+        """
+
+        if callable(self.detail_lines):
+            return None
+        return CompiledScenario.build(self.headline, self.detail_lines or ())
 
     def render_details(self, state: "ChillState") -> Sequence[str]:
         """시나리오에 연결된 세부 문장을 생성한다."""
@@ -30,7 +153,32 @@ class RoutineScenario:
             return ()
         if callable(self.detail_lines):
             return tuple(self.detail_lines(state))
-        return tuple(self.detail_lines)
+        lines: list[str] = []
+        for slot in self.detail_lines:
+            if isinstance(slot, Choice):
+                lines.append(state.rng.choice(slot.options))
+            elif isinstance(slot, RandInt):
+                lines.append(
+                    slot.template.format(state.rng.randint(slot.low, slot.high))
+                )
+            else:
+                lines.append(slot)
+        return tuple(lines)
+
+    def render_summary_parts(self, state: "ChillState") -> list[str]:
+        """헤드라인과 세부 문장을 콜론이 치환된 요약 조각 목록으로 만든다."""
+
+        compiled = self.compiled
+        if compiled is not None:
+            return compiled.render(state.rng)
+        parts = [self.headline, *self.render_details(state)]
+        return [sanitize_line(part) for part in parts if part]
+
+
+def _round_seconds(seconds: float | None) -> float | None:
+    """응답에 싣는 초 단위 값을 밀리초 정밀도로 맞춘다."""
+
+    return round(seconds, 3) if seconds is not None else None
 
 
 def clamp(value: float, minimum: float, maximum: float) -> float:
@@ -75,17 +223,159 @@ class BreakRoutine:
     name: str
     scenarios: Sequence[RoutineScenario]
     post_hook: PostHook | None = None
+    description: str = ""
 
-    def select_scenario(self, state: "ChillState") -> RoutineScenario:
-        """상태 기반 랜덤 시나리오를 선택한다."""
+    def select_scenario_index(self, state: "ChillState") -> int:
+        """상태 기반 랜덤 시나리오의 인덱스를 선택한다."""
 
         if not self.scenarios:
             raise ValueError(f"Routine '{self.name}'에 등록된 시나리오가 없습니다.")
-        return state.rng.choice(self.scenarios)
+        # rng.choice와 동일하게 난수를 소비하므로 같은 시드에서 같은 시나리오가 나온다.
+        return state.rng.randrange(len(self.scenarios))
+
+    def select_scenario(self, state: "ChillState") -> RoutineScenario:
+        """상태 기반 랜덤 시나리오를 선택한다."""
+
+        return self.scenarios[self.select_scenario_index(state)]
+
+
+@dataclass(frozen=True)
+class BreakOutcome:
+    """커밋된 휴식 한 건의 결과와 응답 페이로드."""
+
+    routine: str
+    scenario_index: int
+    # 후처리 훅까지 적용한 뒤 실제로 줄어든 스트레스 (훅이 올리면 음수일 수 있다).
+    stress_reduction: int
+    stress_level: float
+    boss_alert_before: int
+    boss_alert_level: int
+    boss_noticed: bool
+    delay_seconds: float
+    commit_seq: int
+    summary: str
+    payload: dict[str, object]
+    # 커밋 시점 기준 다음 경보 감소와 경보 0단계까지 남은 시간(초).
+    seconds_until_alert_decrement: float | None = None
+    seconds_until_alert_zero: float | None = None
+
+    def structured_content(self) -> dict[str, object]:
+        """응답 텍스트와 같은 값을 타입이 있는 필드로 돌려준다.
+
+        ``stress_level``은 텍스트의 ``Stress Level:`` 줄과 같은 정수 값이다.
+        """
+
+        return {
+            "routine": self.routine,
+            "scenario_index": self.scenario_index,
+            "stress_level": int(self.stress_level),
+            "boss_alert_level": self.boss_alert_level,
+            "boss_alert_before": self.boss_alert_before,
+            "boss_noticed": self.boss_noticed,
+            "stress_reduction": self.stress_reduction,
+            "delay_seconds": self.delay_seconds,
+            "commit_seq": self.commit_seq,
+            "summary": self.summary,
+            "seconds_until_alert_decrement": self.seconds_until_alert_decrement,
+            "seconds_until_alert_zero": self.seconds_until_alert_zero,
+        }
+
+
+@dataclass(frozen=True)
+class BreakPlanOutcome:
+    """여러 루틴을 한 트랜잭션으로 실행한 결과와 응답 페이로드."""
+
+    steps: Tuple[BreakOutcome, ...]
+    stress_level: float
+    boss_alert_level: int
+    delay_seconds: float
+    commit_seq: int
+    payload: dict[str, object]
+    seconds_until_alert_decrement: float | None = None
+    seconds_until_alert_zero: float | None = None
+
+    def structured_content(self) -> dict[str, object]:
+        """최종 상태와 단계별 구조화 결과를 돌려준다."""
+
+        return {
+            "stress_level": int(self.stress_level),
+            "boss_alert_level": self.boss_alert_level,
+            "stress_reduction": sum(step.stress_reduction for step in self.steps),
+            "delay_seconds": self.delay_seconds,
+            "commit_seq": self.commit_seq,
+            "seconds_until_alert_decrement": self.seconds_until_alert_decrement,
+            "seconds_until_alert_zero": self.seconds_until_alert_zero,
+            "steps": [step.structured_content() for step in self.steps],
+        }
+
+
+class BreakDeferred(Exception):
+    """허용된 대기 시간 안에 보스 경보 지연을 마칠 수 없어 휴식을 미뤘다.
+
+    상태는 전혀 바뀌지 않았으며, ``retry_after_seconds`` 뒤에 다시 부르면 경보가
+    최고 단계 아래로 내려가 지연 없이 실행된다. 쿨다운이 꺼져 있어 경보가
+    내려가지 않으면 ``retry_after_seconds``는 None이다.
+    """
+
+    def __init__(
+        self,
+        *,
+        routine: str,
+        required_delay_seconds: float,
+        retry_after_seconds: float | None,
+        stress_level: float,
+        boss_alert_level: int,
+    ) -> None:
+        super().__init__(
+            f"{routine}: boss alert delay {required_delay_seconds:g}s exceeds the "
+            "caller's deadline"
+        )
+        self.routine = routine
+        self.required_delay_seconds = required_delay_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.stress_level = stress_level
+        self.boss_alert_level = boss_alert_level
+
+    def structured_content(self) -> dict[str, object]:
+        """미룬 이유와 재시도 시점을 타입이 있는 필드로 돌려준다."""
+
+        return {
+            "routine": self.routine,
+            "deferred": True,
+            "required_delay_seconds": self.required_delay_seconds,
+            "retry_after_seconds": _round_seconds(self.retry_after_seconds),
+            "stress_level": int(self.stress_level),
+            "boss_alert_level": self.boss_alert_level,
+        }
+
+    @property
+    def payload(self) -> dict[str, object]:
+        """일반 응답과 같은 수치 줄을 가진 텍스트 페이로드."""
+
+        summary = (
+            f"상사가 바로 뒤에 있어 휴식을 미뤘습니다 | "
+            f"필요한 지연 {self.required_delay_seconds:g}초"
+        )
+        if self.retry_after_seconds is not None:
+            summary += f" | {self.retry_after_seconds:.1f}초 후 재시도하면 지연 없음"
+        text = (
+            f"Break Deferred: {summary}\n"
+            f"Stress Level: {int(self.stress_level)}\n"
+            f"Boss Alert Level: {self.boss_alert_level}"
+        )
+        return {"content": [{"type": "text", "text": text}]}
 
 
 logger = logging.getLogger("ChillMCP")
 
+# 보스 경보가 최고 단계일 때 휴식 전에 기다리는 시간(초).
+BOSS_DELAY_SECONDS = 20.0
+
+# 경보 상태 문구는 콜론이 없는 고정 문자열이라 치환 없이 그대로 붙인다.
+_BOSS_NOTICED_LINE = "Boss Alert 상승 ⚠️ 상사가 휴식을 눈치채 경보가 한 단계 올랐습니다"
+_BOSS_STABLE_LINE = "Boss Alert 안정 ✅ 현재 경보는 0단계입니다"
+_BOSS_NOTICED_COMPACT = "Boss Alert 상승"
+
 
 @dataclass
 class ChillState:
@@ -101,9 +391,21 @@ class ChillState:
     rng_seed: int | None = None
     time_fn: Callable[[], float] = time.monotonic
     sleep_fn: AsyncSleepFn | None = None
+    delay_scheduler: DelayScheduler | None = None
+    # 커밋마다 호출되는 콜백 (리소스 구독 알림 등). 잠금 안에서 호출되므로 가벼워야 한다.
+    on_commit: Callable[[], None] | None = None
     rng: random.Random = field(default_factory=random.Random, init=False)
     last_update_time: float = field(default_factory=time.monotonic, init=False)
     last_boss_alert_decay: float = field(default_factory=time.monotonic, init=False)
+    commit_seq: int = field(default=0, init=False)
+    # 다음 커밋 때 완료되는 Future. wait_until_safe 대기자가 상태 변화에 깨어난다.
+    _changed: asyncio.Future | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # 같은 상태에 대한 커밋을 도착 순서(FIFO)대로 직렬화하는 잠금.
+    _lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """랜덤 시드를 초기화하고 타임스탬프를 맞춘다."""
@@ -154,20 +456,233 @@ class ChillState:
         self.boss_alert_level = max(0, self.boss_alert_level - steps)
         self.last_boss_alert_decay += steps * self.boss_alertness_cooldown
 
-    def _snapshot_state(self) -> dict[str, float | int]:
-        """스트레스와 보스 경보 상태를 간결한 딕셔너리로 반환한다."""
+    def projected_boss_alert_level(self, now: float | None = None) -> int:
+        """상태를 변경하지 않고 ``now`` 시점의 보스 경보 단계를 계산한다."""
+
+        if now is None:
+            now = self.time_fn()
+        if self.boss_alert_level <= 0 or self.boss_alertness_cooldown <= 0:
+            return self.boss_alert_level
+        elapsed_seconds = now - self.last_boss_alert_decay
+        if elapsed_seconds < self.boss_alertness_cooldown:
+            return self.boss_alert_level
+        steps = int(elapsed_seconds // self.boss_alertness_cooldown)
+        return max(0, self.boss_alert_level - steps)
+
+    def projected_stress_level(self, now: float | None = None) -> float:
+        """상태를 변경하지 않고 ``now`` 시점의 스트레스 수치를 계산한다."""
+
+        if now is None:
+            now = self.time_fn()
+        if now <= self.last_update_time:
+            return self.stress_level
+        elapsed_seconds = now - self.last_update_time
+        drifted = self.stress_level + elapsed_seconds * self.stress_increase_rate / 60
+        return clamp(drifted, 0, self.max_stress)
+
+    def seconds_until_boss_alert_below(
+        self, level: int, now: float | None = None
+    ) -> float | None:
+        """경보가 ``level`` 미만으로 내려가기까지 남은 시간(초)을 닫힌 식으로 구한다.
+
+        쿨다운마다 한 단계씩 내려가므로 필요한 단계 수 ``k``에 대해
+        ``last_boss_alert_decay + k * cooldown - now``이다. 이미 내려가 있으면 0,
+        쿨다운이 꺼져 있어 내려가지 않으면 None을 반환한다.
+        """
+
+        if now is None:
+            now = self.time_fn()
+        steps_needed = self.boss_alert_level - level + 1
+        if steps_needed <= 0:
+            return 0.0
+        if self.boss_alertness_cooldown <= 0:
+            return None
+        due = self.last_boss_alert_decay + steps_needed * self.boss_alertness_cooldown
+        return max(0.0, due - now)
+
+    def seconds_until_alert_decrement(self, now: float | None = None) -> float | None:
+        """다음 경보 감소까지 남은 시간(초). 경보가 0이거나 쿨다운이 꺼져 있으면 None."""
+
+        if now is None:
+            now = self.time_fn()
+        level = self.projected_boss_alert_level(now)
+        if level <= 0:
+            return None
+        return self.seconds_until_boss_alert_below(level, now)
+
+    def seconds_until_alert_zero(self, now: float | None = None) -> float | None:
+        """경보가 0단계가 되기까지 남은 시간(초). 쿨다운이 꺼져 있으면 None."""
+
+        return self.seconds_until_boss_alert_below(1, now)
 
+    def status(self, now: float | None = None) -> dict[str, object]:
+        """상태를 바꾸지 않고 현재 시점의 수치와 예측 시간을 돌려준다.
+
+        모든 값은 닫힌 식으로 계산하므로 O(1)이며, 클라이언트는 폴링 대신
+        ``seconds_until_alert_decrement``/``seconds_until_no_delay``만큼 한 번 잠들면 된다.
+        """
+
+        if now is None:
+            now = self.time_fn()
+        return {
+            "stress_level": int(self.projected_stress_level(now)),
+            "boss_alert_level": self.projected_boss_alert_level(now),
+            "seconds_until_alert_decrement": _round_seconds(
+                self.seconds_until_alert_decrement(now)
+            ),
+            "seconds_until_alert_zero": _round_seconds(
+                self.seconds_until_alert_zero(now)
+            ),
+            "seconds_until_no_delay": _round_seconds(
+                self.seconds_until_boss_alert_below(self.max_boss_alert, now)
+            ),
+            "commit_seq": self.commit_seq,
+        }
+
+    def checkpoint(self) -> dict[str, object]:
+        """재시작 후 이어서 쓸 수 있도록 상태를 JSON으로 직렬화할 수 있는 dict로 만든다.
+
+        시각은 이 상태의 ``time_fn`` 기준 값 그대로 저장한다. RNG 상태도 함께
+        저장하므로 복원 뒤의 시나리오 추첨이 재시작하지 않았을 때와 같다.
+        """
+
+        version, internal, gauss_next = self.rng.getstate()
         return {
             "stress_level": self.stress_level,
             "boss_alert_level": self.boss_alert_level,
+            "last_update_time": self.last_update_time,
+            "last_boss_alert_decay": self.last_boss_alert_decay,
+            "commit_seq": self.commit_seq,
+            "rng": [version, list(internal), gauss_next],
         }
 
-    def _format_state(self, snapshot: dict[str, float | int]) -> str:
-        """스냅샷을 사람 친화적인 로깅 문자열로 변환한다."""
+    def restore_checkpoint(self, data: dict, *, shift: float) -> None:
+        """``checkpoint`` 결과를 적용한다.
 
-        return (
-            f"stress={snapshot['stress_level']}, "
-            f"boss_alert={snapshot['boss_alert_level']}"
+        ``shift``는 저장 당시의 시각을 현재 ``time_fn`` 기준으로 옮기는 값이다.
+        미래로 밀린 시각(벽시계가 뒤로 간 경우 등)은 현재 시각으로 자른다.
+        """
+
+        now = self.time_fn()
+        version, internal, gauss_next = data["rng"]
+        rng_state = (int(version), tuple(int(word) for word in internal), gauss_next)
+        stress_level = max(
+            0.0, min(float(self.max_stress), float(data["stress_level"]))
+        )
+        boss_alert_level = max(
+            0, min(self.max_boss_alert, int(data["boss_alert_level"]))
+        )
+        last_update_time = min(now, float(data["last_update_time"]) + shift)
+        last_boss_alert_decay = min(now, float(data["last_boss_alert_decay"]) + shift)
+        commit_seq = int(data["commit_seq"])
+        # 검증이 모두 끝난 뒤에 적용해 잘못된 항목이 상태를 반쯤 바꾸지 않게 한다.
+        self.rng.setstate(rng_state)
+        self.stress_level = stress_level
+        self.boss_alert_level = boss_alert_level
+        self.last_update_time = last_update_time
+        self.last_boss_alert_decay = last_boss_alert_decay
+        self.commit_seq = commit_seq
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """블록 안의 변경을 한 번에 커밋하고, 예외가 나면 이전 값으로 되돌린다."""
+
+        saved = (
+            self.stress_level,
+            self.boss_alert_level,
+            self.last_update_time,
+            self.last_boss_alert_decay,
+        )
+        rng_state = self.rng.getstate()
+        try:
+            yield
+        except BaseException:
+            (
+                self.stress_level,
+                self.boss_alert_level,
+                self.last_update_time,
+                self.last_boss_alert_decay,
+            ) = saved
+            self.rng.setstate(rng_state)
+            raise
+        self.commit_seq += 1
+        self._notify_changed()
+
+    def _notify_changed(self) -> None:
+        changed, self._changed = self._changed, None
+        if changed is not None and not changed.done():
+            changed.set_result(self.commit_seq)
+        if self.on_commit is not None:
+            self.on_commit()
+
+    def _change_future(self) -> asyncio.Future:
+        """다음 커밋에 완료되는 Future를 (현재 이벤트 루프 기준으로) 돌려준다."""
+
+        loop = asyncio.get_running_loop()
+        if self._changed is None or self._changed.get_loop() is not loop:
+            self._changed = loop.create_future()
+        return self._changed
+
+    async def wait_until_alert_at_most(
+        self, max_level: int, timeout: float
+    ) -> tuple[bool, float]:
+        """경보가 ``max_level`` 이하가 될 때까지 최대 ``timeout``초 기다린다.
+
+        목표 시각은 닫힌 식으로 구해 공유 타이머 힙에 한 번만 걸고, 그 사이
+        다른 호출이 커밋하면(경보 상승·즉시 퇴근 등) 깨어나 다시 계산한다.
+        상태는 바꾸지 않는다. (도달 여부, 기다린 초)를 반환한다.
+        """
+
+        started = self.time_fn()
+        deadline = started + max(0.0, timeout)
+        while True:
+            now = self.time_fn()
+            if self.projected_boss_alert_level(now) <= max_level:
+                return True, now - started
+            remaining = deadline - now
+            if remaining <= 0:
+                return False, now - started
+            until = self.seconds_until_boss_alert_below(max_level + 1, now)
+            wait = remaining if until is None else min(until, remaining)
+            await self._sleep_or_change(wait)
+
+    async def _sleep_or_change(self, seconds: float) -> None:
+        changed = self._change_future()
+        if self.delay_scheduler is not None:
+            await self.delay_scheduler.sleep_or_wake(seconds, changed)
+            return
+        sleep_fn = self.sleep_fn or asyncio.sleep
+        sleeper = asyncio.ensure_future(sleep_fn(seconds))
+        try:
+            await asyncio.wait((sleeper, changed), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sleeper.cancel()
+
+    def _log_state(self, phase: str, tool_label: str) -> None:
+        """휴식 전후 상태를 로그로 남긴다.
+
+        메시지 포매팅은 핸들러에 맡기고 인자로는 불변 값만 넘기므로, 비동기
+        로깅 모드에서는 문자열 생성과 출력이 모두 백그라운드 스레드에서 일어난다.
+        """
+
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(
+            "[tool=%s] %s state: stress=%s, boss_alert=%s",
+            tool_label,
+            phase,
+            self.stress_level,
+            self.boss_alert_level,
+            extra={
+                "chill_event": f"state_{phase}",
+                "chill_fields": {
+                    "tool": tool_label,
+                    "phase": phase,
+                    "stress_level": self.stress_level,
+                    "boss_alert_level": self.boss_alert_level,
+                    "commit_seq": self.commit_seq + 1,
+                },
+            },
         )
 
     async def perform_break(
@@ -183,7 +698,6 @@ class ChillState:
 
         if isinstance(routine, BreakRoutine):
             selected_routine = routine
-            scenario = selected_routine.select_scenario(self)
             tool_label = selected_routine.name
         else:
             if stress_reduction is None:
@@ -206,20 +720,223 @@ class ChillState:
             )
             tool_label = scenario.headline
 
-        self.tick()
-        state_before = self._snapshot_state()
-        logger.info(
-            "[tool=%s] before state: %s",
-            tool_label,
-            self._format_state(state_before),
-        )
+        outcome = await self.run_break(selected_routine, label=tool_label)
+        return outcome.payload
+
+    async def run_break(
+        self,
+        routine: BreakRoutine,
+        *,
+        label: str | None = None,
+        profile: OutputProfile = "full",
+        max_wait: float | None = None,
+    ) -> BreakOutcome:
+        """지연 대기 후 휴식 한 건을 트랜잭션으로 커밋하고 결과를 반환한다.
+
+        20초 지연은 상태를 읽거나 쓰지 않은 채 잠금 밖에서 기다린다. 실제
+        읽기-수정-쓰기는 모두 잠금 안의 동기 구간에서 한 번에 일어나므로,
+        같은 상태에 대한 동시 호출은 잠금 획득 순서대로 하나씩 반영되고
+        서로 다른 상태는 서로를 전혀 기다리지 않는다.
+
+        ``max_wait``가 주어지고 필요한 지연이 그보다 길면 기다리지 않고
+        ``BreakDeferred``를 발생시킨다. 이 경우 지연 슬롯도 차지하지 않는다.
+        """
+
+        delay_seconds = await self._wait_out_boss(routine.name, max_wait)
+        async with self._lock:
+            with self._transaction():
+                return self._commit_break(
+                    routine, label or routine.name, delay_seconds, profile
+                )
+
+    async def _wait_out_boss(
+        self, routine: str = "", max_wait: float | None = None
+    ) -> float:
+        """경보가 최고 단계이면 상태를 건드리지 않고 지연 시간만큼 기다린다."""
+
+        now = self.time_fn()
+        if self.projected_boss_alert_level(now) < self.max_boss_alert:
+            return 0.0
+        if max_wait is not None and BOSS_DELAY_SECONDS > max_wait:
+            raise BreakDeferred(
+                routine=routine,
+                required_delay_seconds=BOSS_DELAY_SECONDS,
+                retry_after_seconds=self.seconds_until_boss_alert_below(
+                    self.max_boss_alert, now
+                ),
+                stress_level=self.projected_stress_level(now),
+                boss_alert_level=self.projected_boss_alert_level(now),
+            )
+        # 상사가 바로 뒤에 있는 것 같으니, 20초 동안 일하는 척한다.
+        return await self._boss_delay(BOSS_DELAY_SECONDS)
+
+    async def _boss_delay(self, seconds: float) -> float:
+        """공유 스케줄러(없으면 ``sleep_fn``)로 ``seconds``만큼 기다린다."""
 
-        if self.boss_alert_level >= self.max_boss_alert:
-            # 상사가 바로 뒤에 있는 것 같으니, 20초 동안 일하는 척한다.
+        if self.delay_scheduler is not None:
+            await self.delay_scheduler.delay(seconds)
+        else:
             sleep_fn = self.sleep_fn or asyncio.sleep
-            await sleep_fn(20)
-            self.tick()
+            await sleep_fn(seconds)
+        return seconds
+
+    async def run_break_plan(
+        self,
+        routines: Sequence[BreakRoutine],
+        *,
+        profile: OutputProfile = "full",
+        label: str = "plan",
+        max_wait: float | None = None,
+    ) -> BreakPlanOutcome:
+        """여러 루틴을 순서대로 하나의 트랜잭션에서 실행한다.
+
+        경보가 최고 단계에 닿은 단계마다 20초씩 붙는 지연은 호출 시점의
+        상태로 미리 합산해(``_project_plan_delays``) 단건 호출처럼 잠금 밖에서
+        한 번에 기다린다. 그 뒤 잠금 안의 동기 구간에서 모든 단계를
+        ``_commit_break``로 적용하므로 다른 호출은 중간 상태를 볼 수 없고,
+        중간에 실패하면 계획 전체가 (RNG 상태까지) 되돌려진다.
+
+        합산한 지연이 ``max_wait``보다 길면 기다리지 않고 ``label`` 이름으로
+        ``BreakDeferred``를 발생시킨다.
+        """
+
+        if not routines:
+            raise ValueError("실행할 루틴이 최소 한 개 필요합니다.")
+        now = self.time_fn()
+        step_delays = self._project_plan_delays(routines, now)
+        delay_seconds = sum(step_delays)
+        if max_wait is not None and delay_seconds > max_wait:
+            raise BreakDeferred(
+                routine=label,
+                required_delay_seconds=delay_seconds,
+                retry_after_seconds=self._plan_retry_after(routines, max_wait, now),
+                stress_level=self.projected_stress_level(now),
+                boss_alert_level=self.projected_boss_alert_level(now),
+            )
+        if delay_seconds:
+            await self._boss_delay(delay_seconds)
+        async with self._lock:
+            with self._transaction():
+                steps = [
+                    self._commit_break(routine, routine.name, step_delay, profile)
+                    for routine, step_delay in zip(routines, step_delays)
+                ]
+                return self._plan_outcome(steps, delay_seconds, profile)
+
+    def _plan_retry_after(
+        self, routines: Sequence[BreakRoutine], max_wait: float, now: float
+    ) -> float | None:
+        """계획의 지연이 ``max_wait`` 안에 드는 가장 이른 시각까지 남은 초.
+
+        경보가 한 단계씩 내려가는 시각마다 계획을 다시 예측한다. 경보 0단계에서
+        시작해도 맞지 않거나 쿨다운이 꺼져 있으면 None이다.
+        """
+
+        for level in range(self.projected_boss_alert_level(now), 0, -1):
+            wait = self.seconds_until_boss_alert_below(level, now)
+            if wait is None:
+                return None
+            if sum(self._project_plan_delays(routines, now + wait)) <= max_wait:
+                return wait
+        return None
+
+    def _project_plan_delays(
+        self, routines: Sequence[BreakRoutine], now: float | None = None
+    ) -> list[float]:
+        """``now`` 시점에 계획을 실행한다고 보고 단계별 보스 경보 지연을 구한다.
+
+        상태와 RNG를 복사하고 시계를 ``now``에 멈춘 임시 상태에 단계를 그대로
+        적용해 보므로, 그 사이 다른 커밋이 없으면 실제 실행과 같은 경보 변화를
+        따른다. 이 상태는 바뀌지 않는다.
+        """
+
+        if now is None:
+            now = self.time_fn()
+        scratch = replace(
+            self,
+            time_fn=lambda: now,
+            sleep_fn=None,
+            delay_scheduler=None,
+            on_commit=None,
+        )
+        scratch.rng.setstate(self.rng.getstate())
+        scratch.last_update_time = self.last_update_time
+        scratch.last_boss_alert_decay = self.last_boss_alert_decay
+        delays: list[float] = []
+        for routine in routines:
+            at_max = scratch.projected_boss_alert_level() >= scratch.max_boss_alert
+            delays.append(BOSS_DELAY_SECONDS if at_max else 0.0)
+            scratch._commit_break(routine, routine.name, 0.0, "numeric", log=False)
+        return delays
+
+    def _plan_outcome(
+        self,
+        steps: Sequence[BreakOutcome],
+        delay_seconds: float,
+        profile: OutputProfile = "full",
+    ) -> BreakPlanOutcome:
+        """단계별 결과를 모아 계획 응답을 만든다.
+
+        단계 줄에는 ``Stress Level:``/``Boss Alert Level:`` 키를 쓰지 않아,
+        마지막 세 줄만 기존 응답 파서가 읽는 최종 상태가 된다.
+        """
 
+        stress_value = int(self.stress_level)
+        step_lines = [
+            f"Step {number} - {step.routine} | "
+            + (f"{step.summary} | " if step.summary else "")
+            + f"stress {int(step.stress_level)} | alert {step.boss_alert_level}"
+            for number, step in enumerate(steps, start=1)
+        ]
+        total_reduction = sum(step.stress_reduction for step in steps)
+        summary_text = (
+            f"{len(steps)}개 루틴을 한 번에 실행 ({' → '.join(s.routine for s in steps)})"
+            f" | 총 스트레스 감소 {total_reduction}"
+        )
+        if delay_seconds:
+            summary_text += f" | 보스 경보 지연 {delay_seconds:g}초"
+        lines = [*step_lines]
+        if profile != "numeric":
+            lines.append(f"Break Summary: {summary_text}")
+        lines.append(f"Stress Level: {stress_value}")
+        lines.append(f"Boss Alert Level: {self.boss_alert_level}")
+        payload_text = "\n".join(lines)
+        return BreakPlanOutcome(
+            steps=tuple(steps),
+            stress_level=self.stress_level,
+            boss_alert_level=self.boss_alert_level,
+            delay_seconds=delay_seconds,
+            commit_seq=self.commit_seq + 1,
+            payload={"content": [{"type": "text", "text": payload_text}]},
+            seconds_until_alert_decrement=_round_seconds(
+                self.seconds_until_alert_decrement()
+            ),
+            seconds_until_alert_zero=_round_seconds(self.seconds_until_alert_zero()),
+        )
+
+    def _commit_break(
+        self,
+        routine: BreakRoutine,
+        tool_label: str,
+        delay_seconds: float,
+        profile: OutputProfile = "full",
+        *,
+        log: bool = True,
+    ) -> BreakOutcome:
+        """잠금을 쥔 상태에서 휴식 효과를 계산해 상태에 반영한다.
+
+        디테일 문장은 프로필과 관계없이 항상 렌더링한다. 그래야 난수 소비량이
+        같아져 같은 시드에서 프로필만 바꿔도 수치가 달라지지 않는다.
+        ``log``가 거짓이면(지연 예측용 임시 상태) 전후 상태 로그를 남기지 않는다.
+        """
+
+        self.tick()
+        if log:
+            self._log_state("before", tool_label)
+        stress_before = self.stress_level
+
+        scenario_index = routine.select_scenario_index(self)
+        scenario = routine.scenarios[scenario_index]
         reduction_amount = self.rng.randint(*scenario.stress_reduction)
         self.stress_level = clamp(
             self.stress_level - reduction_amount, 0, self.max_stress
@@ -235,37 +952,53 @@ class ChillState:
         self.last_update_time = now
         self.last_boss_alert_decay = now
 
-        if selected_routine.post_hook is not None:
-            selected_routine.post_hook(self)
+        if routine.post_hook is not None:
+            routine.post_hook(self)
 
         stress_value = int(self.stress_level)
-        summary_parts = [scenario.headline]
-        summary_parts.extend(scenario.render_details(self))
-        if boss_noticed:
-            summary_parts.append(
-                "Boss Alert 상승 ⚠️ 상사가 휴식을 눈치채 경보가 한 단계 올랐습니다"
-            )
+        # 뽑은 감소량이 아니라 0 하한과 후처리 훅까지 반영된 실제 변화량을 보고한다.
+        applied_reduction = round(stress_before - self.stress_level)
+        summary_parts = scenario.render_summary_parts(self)
+        if profile == "numeric":
+            summary_parts = []
+        elif profile == "compact":
+            summary_parts = [sanitize_line(scenario.headline)]
+            if boss_noticed:
+                summary_parts.append(_BOSS_NOTICED_COMPACT)
+        elif boss_noticed:
+            summary_parts.append(_BOSS_NOTICED_LINE)
         elif self.boss_alert_level == 0:
-            summary_parts.append("Boss Alert 안정 ✅ 현재 경보는 0단계입니다")
+            summary_parts.append(_BOSS_STABLE_LINE)
         else:
             summary_parts.append(
                 f"Boss Alert 주의 🟡 경보 {self.boss_alert_level}단계에서 유지 중입니다"
             )
-
-        sanitized_parts = [part.replace(":", " -") for part in summary_parts if part]
-        summary_text = " | ".join(sanitized_parts)
+        summary_text = " | ".join(summary_parts)
 
         payload_text = (
-            f"Break Summary: {summary_text}\n"
             f"Stress Level: {stress_value}\n"
             f"Boss Alert Level: {self.boss_alert_level}"
         )
-
-        state_after = self._snapshot_state()
-        logger.info(
-            "[tool=%s] after state: %s",
-            tool_label,
-            self._format_state(state_after),
+        if summary_text:
+            payload_text = f"Break Summary: {summary_text}\n{payload_text}"
+
+        if log:
+            self._log_state("after", tool_label)
+
+        return BreakOutcome(
+            routine=routine.name,
+            scenario_index=scenario_index,
+            stress_reduction=applied_reduction,
+            stress_level=self.stress_level,
+            boss_alert_before=boss_alert_before,
+            boss_alert_level=self.boss_alert_level,
+            boss_noticed=boss_noticed,
+            delay_seconds=delay_seconds,
+            commit_seq=self.commit_seq + 1,
+            summary=summary_text,
+            payload={"content": [{"type": "text", "text": payload_text}]},
+            seconds_until_alert_decrement=_round_seconds(
+                self.seconds_until_alert_decrement(now)
+            ),
+            seconds_until_alert_zero=_round_seconds(self.seconds_until_alert_zero(now)),
         )
-
-        return {"content": [{"type": "text", "text": payload_text}]}
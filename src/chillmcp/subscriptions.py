@@ -0,0 +1,142 @@
+"""리소스 구독자에게 상태 변경 알림을 묶어서 보내는 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Callable, Hashable, Protocol
+
+from mcp.server.subscriptions import ResourceUpdated, SubscriptionBus
+
+logger = logging.getLogger("ChillMCP")
+
+
+class ResourceSubscriber(Protocol):
+    """``resources/updated`` 알림을 받을 수 있는 연결 (MCP ``ServerSession``)."""
+
+    async def send_resource_updated(self, uri: str) -> None: ...
+
+
+class StateNotifier:
+    """상태 변경을 모아 구독자에게 ``resources/updated``를 보낸다.
+
+    커밋마다 바로 알리지 않고 URI별로 "바뀜" 표시만 남긴다. 플러시 태스크
+    하나가 ``min_interval``초에 최대 한 번 표시된 URI를 내보내므로, 그 사이
+    여러 번 바뀌어도 구독자마다 알림은 한 번이다. 첫 변경은 간격이 지났으면
+    바로 보낸다. 구독자는 알림을 받으면 ``resources/read``로 최신 값을 읽는다.
+
+    2026-07-28 이후 프로토콜의 ``subscriptions/listen`` 스트림은 ``bus``로 한 번
+    발행해 SDK가 스트림마다 나눠 주고, 이전 프로토콜의 ``resources/subscribe``
+    구독자는 연결마다 직접 보낸다. 전송에 실패한 구독자(끊어진 연결)는 뺀다.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = 1.0,
+        max_subscribers: int = 10000,
+        bus: SubscriptionBus | None = None,
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_subscribers < 1:
+            raise ValueError("max_subscribers는 1 이상이어야 합니다.")
+        self._min_interval = max(0.0, min_interval)
+        self._max_subscribers = max_subscribers
+        self._time_fn = time_fn
+        self._bus = bus
+        self._subscribers: dict[str, dict[Hashable, ResourceSubscriber]] = {}
+        self._pending: set[str] = set()
+        self._last_flush = float("-inf")
+        self._flusher: asyncio.Task[None] | None = None
+        self.marked = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.published = 0
+        self.sent = 0
+        self.failed = 0
+
+    def subscriber_count(self, uri: str | None = None) -> int:
+        if uri is not None:
+            return len(self._subscribers.get(uri, ()))
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def subscribe(
+        self, uri: str, key: Hashable, subscriber: ResourceSubscriber
+    ) -> None:
+        """``key``(연결 식별자)로 구독을 등록한다. 같은 키로 다시 구독하면 덮어쓴다."""
+
+        subscribers = self._subscribers.setdefault(uri, {})
+        if key not in subscribers and self.subscriber_count() >= self._max_subscribers:
+            raise ValueError(
+                f"구독자 수가 최대치({self._max_subscribers})에 도달했습니다."
+            )
+        subscribers[key] = subscriber
+
+    def unsubscribe(self, uri: str, key: Hashable) -> None:
+        subscribers = self._subscribers.get(uri)
+        if subscribers is None:
+            return
+        subscribers.pop(key, None)
+        if not subscribers:
+            del self._subscribers[uri]
+
+    def mark_changed(self, uri: str) -> None:
+        """``uri``가 바뀌었음을 기록하고 필요하면 플러시 태스크를 깨운다."""
+
+        self.marked += 1
+        if self._bus is None and uri not in self._subscribers:
+            return
+        if uri in self._pending:
+            self.coalesced += 1
+            return
+        self._pending.add(uri)
+        if self._flusher is None or self._flusher.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # 이벤트 루프 밖의 변경은 다음 변경 때 함께 보낸다.
+                return
+            self._flusher = loop.create_task(self._flush_loop())
+
+    def stats(self) -> dict[str, int]:
+        """구독과 알림 전송 현황을 요약한다."""
+
+        return {
+            "subscribers": self.subscriber_count(),
+            "pending": len(self._pending),
+            "marked": self.marked,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "published": self.published,
+            "sent": self.sent,
+            "failed": self.failed,
+        }
+
+    async def _flush_loop(self) -> None:
+        while self._pending:
+            wait = self._last_flush + self._min_interval - self._time_fn()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            uris, self._pending = self._pending, set()
+            self._last_flush = self._time_fn()
+            self.flushes += 1
+            for uri in uris:
+                await self._send(uri)
+
+    async def _send(self, uri: str) -> None:
+        if self._bus is not None:
+            await self._bus.publish(ResourceUpdated(uri=uri))
+            self.published += 1
+        subscribers = list(self._subscribers.get(uri, {}).items())
+        results = await asyncio.gather(
+            *(subscriber.send_resource_updated(uri) for _, subscriber in subscribers),
+            return_exceptions=True,
+        )
+        for (key, _), result in zip(subscribers, results):
+            if isinstance(result, BaseException):
+                self.failed += 1
+                logger.debug("Dropping subscriber of %s: %r", uri, result)
+                self.unsubscribe(uri, key)
+            else:
+                self.sent += 1
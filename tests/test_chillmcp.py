@@ -178,3 +178,1741 @@ def test_consecutive_tool_calls_raise_boss_alert(
 
     assert first_level >= 1
     assert final_level >= min(state.max_boss_alert, first_level + 1)
+
+
+def test_state_registry_expires_and_evicts_sessions() -> None:
+    from src.chillmcp.sessions import StateRegistry
+    from src.chillmcp.state import ChillState
+
+    now = {"value": 0.0}
+    registry = StateRegistry(
+        ChillState, ttl_seconds=10, max_sessions=2, time_fn=lambda: now["value"]
+    )
+
+    first = registry.get("a")
+    assert registry.get("a") is first
+    registry.get("b")
+    registry.get("c")  # 용량 초과로 가장 오래된 "a"가 축출된다.
+    assert "a" not in registry
+    assert registry.stats()["evicted"] == 1
+
+    now["value"] = 11
+    assert registry.prune() == 2
+    assert len(registry) == 0
+
+
+def test_session_isolation_keeps_agents_separate() -> None:
+    server = main.create_server(
+        boss_alertness=100, session_isolation=True, trust_client_id=True
+    )
+
+    async def scenario() -> tuple[str, str]:
+        async with Client(server.mcp) as client:
+            first = {"client_id": "agent-a"}
+            await client.call_tool("take_a_break", meta=first)
+            await client.call_tool("take_a_break", meta=first)
+            busy = await client.call_tool("show_meme", meta=first)
+            fresh = await client.call_tool("show_meme", meta={"client_id": "agent-b"})
+            return busy.content[0].text, fresh.content[0].text
+
+    busy_text, fresh_text = asyncio.run(scenario())
+
+    assert "Boss Alert Level: 3" in busy_text
+    assert "Boss Alert Level: 1" in fresh_text
+    assert server.sessions is not None and len(server.sessions) == 2
+    assert server.state.boss_alert_level == 0
+
+
+def test_session_isolation_keeps_state_per_connection_across_calls() -> None:
+    server = main.create_server(boss_alertness=100, session_isolation=True)
+
+    async def calls(client: Client, count: int) -> list[int]:
+        levels = []
+        for _ in range(count):
+            result = await client.call_tool("take_a_break")
+            levels.append(result.structured_content["boss_alert_level"])
+        return levels
+
+    async def scenario() -> tuple[list[int], list[int]]:
+        async with Client(server.mcp) as first, Client(server.mcp) as second:
+            return await calls(first, 3), await calls(second, 2)
+
+    first, second = asyncio.run(scenario())
+
+    # 요청마다 바뀌는 세션 ID가 아니라 연결 단위로 같은 상태가 이어진다.
+    assert first == [1, 2, 3]
+    assert second == [1, 2]
+    assert server.sessions is not None
+    assert server.sessions.stats()["created"] == 2
+    assert server.state.commit_seq == 0
+
+
+def test_client_id_cannot_select_another_agents_state_by_default() -> None:
+    server = main.create_server(boss_alertness=100, session_isolation=True)
+
+    async def scenario() -> str:
+        async with Client(server.mcp) as victim:
+            await victim.call_tool(
+                "take_a_break", meta={"client_id": "agent-a"}, raise_on_error=False
+            )
+        async with Client(server.mcp) as intruder:
+            result = await intruder.call_tool(
+                "show_meme", meta={"client_id": "agent-a"}
+            )
+            return result.content[0].text
+
+    text = asyncio.run(scenario())
+
+    # 세션 ID로 상태를 고르므로 같은 client_id를 보내도 새 상태에서 시작한다.
+    assert "Boss Alert Level: 1" in text
+    assert server.sessions is not None and len(server.sessions) == 2
+    assert not any(key.startswith("client:") for key in server.sessions)
+
+
+def test_virtual_clock_skips_wall_clock_waits() -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    clock = VirtualClock()
+    server = main.create_server(
+        boss_alertness=0, boss_alertness_cooldown=30, clock=clock
+    )
+    state = server.state
+    state.boss_alert_level = state.max_boss_alert
+
+    async def scenario() -> str:
+        async with Client(server.mcp) as client:
+            await client.call_tool("take_a_break")
+            await client.call_tool("advance_clock", {"seconds": 60})
+            result = await client.call_tool("coffee_mission")
+            return result.content[0].text
+
+    started = time.monotonic()
+    text = asyncio.run(scenario())
+
+    assert time.monotonic() - started < 5
+    # 20초 지연은 가상 시계로 처리되고, 이후 60초 전진으로 경보가 2단계 감소한다.
+    assert clock.time() == pytest.approx(80.0)
+    assert "Boss Alert Level: 3" in text
+
+
+def test_scaled_clock_accelerates_time() -> None:
+    from src.chillmcp.clock import ScaledClock
+
+    now = {"value": 100.0}
+    clock = ScaledClock(60, base_time_fn=lambda: now["value"])
+    now["value"] += 2
+
+    assert clock.time() == pytest.approx(220.0)
+
+
+def test_vectorized_simulation_matches_chill_state() -> None:
+    pytest.importorskip("numpy")
+    from src.chillmcp.clock import VirtualClock
+    from src.chillmcp.simulate import SimulationConfig, simulate, sweep
+    from src.chillmcp.state import BreakRoutine, ChillState, RoutineScenario
+
+    routine = BreakRoutine(
+        name="fixed", scenarios=(RoutineScenario("고정 휴식", (7, 7)),)
+    )
+    clock = VirtualClock()
+    state = ChillState(
+        boss_alertness=100,
+        boss_alertness_cooldown=90,
+        stress_increase_rate=12,
+        time_fn=clock.time,
+        sleep_fn=clock.sleep,
+    )
+
+    async def replay() -> None:
+        for _ in range(12):
+            clock.advance(60)
+            await state.perform_break(routine)
+
+    asyncio.run(replay())
+
+    config = SimulationConfig(
+        boss_alertness=100,
+        boss_alertness_cooldown=90,
+        stress_increase_rate=12,
+        agents=4,
+        steps=12,
+        seed=0,
+    )
+    result = simulate(config, routines=(routine,))
+
+    assert result.stress_mean == pytest.approx(state.stress_level)
+    assert result.alert_distribution[state.boss_alert_level] == 1.0
+    assert result.delayed_call_ratio > 0
+
+    grid = sweep([0, 100], [60], [5, 10], base=config)
+    assert len(grid) == 4
+
+
+def test_simulation_mean_reduction_counts_clamped_change() -> None:
+    pytest.importorskip("numpy")
+    from src.chillmcp.clock import VirtualClock
+    from src.chillmcp.simulate import SimulationConfig, simulate
+    from src.chillmcp.state import BreakRoutine, ChillState, RoutineScenario
+
+    routine = BreakRoutine(
+        name="big", scenarios=(RoutineScenario("푹 쉬기", (70, 70)),)
+    )
+    clock = VirtualClock()
+    state = ChillState(
+        boss_alertness=0,
+        stress_increase_rate=12,
+        time_fn=clock.time,
+        sleep_fn=clock.sleep,
+    )
+
+    async def replay() -> list[int]:
+        applied = []
+        for _ in range(6):
+            clock.advance(60)
+            outcome = await state.run_break(routine)
+            applied.append(outcome.stress_reduction)
+        return applied
+
+    applied = asyncio.run(replay())
+    config = SimulationConfig(
+        boss_alertness=0, stress_increase_rate=12, agents=3, steps=6, seed=0
+    )
+    result = simulate(config, routines=(routine,))
+
+    # 뽑은 70이 아니라 0 하한에서 잘린 실제 감소량의 평균이어야 한다.
+    assert result.mean_reduction == pytest.approx(sum(applied) / len(applied))
+    assert result.mean_reduction < 70
+
+
+def test_concurrent_breaks_commit_in_order_without_lost_updates() -> None:
+    from src.chillmcp.state import BreakRoutine, ChillState, RoutineScenario
+
+    async def short_sleep(seconds: float) -> None:
+        await asyncio.sleep(0.2)
+
+    routine = BreakRoutine(name="fixed", scenarios=(RoutineScenario("휴식", (5, 5)),))
+    busy, other = (
+        ChillState(boss_alertness=0, stress_increase_rate=1, sleep_fn=short_sleep)
+        for _ in range(2)
+    )
+    for state in (busy, other):
+        state.boss_alert_level = state.max_boss_alert
+
+    async def scenario() -> list:
+        return await asyncio.gather(
+            busy.run_break(routine),
+            busy.run_break(routine),
+            other.run_break(routine),
+        )
+
+    started = time.monotonic()
+    first, second, third = asyncio.run(scenario())
+    elapsed = time.monotonic() - started
+
+    # 서로 다른 상태와 같은 상태의 지연 모두 병렬로 진행된다.
+    assert elapsed < 0.35
+    assert [first.commit_seq, second.commit_seq] == [1, 2]
+    assert third.commit_seq == 1
+    assert busy.stress_level == pytest.approx(40, abs=0.1)
+    assert all(outcome.delay_seconds == 20 for outcome in (first, second, third))
+
+
+def test_failed_break_rolls_back_state() -> None:
+    from src.chillmcp.state import BreakRoutine, ChillState, RoutineScenario
+
+    def broken_hook(state: ChillState) -> None:
+        raise RuntimeError("hook failed")
+
+    state = ChillState(boss_alertness=100)
+    routine = BreakRoutine(
+        name="broken",
+        scenarios=(RoutineScenario("휴식", (10, 10)),),
+        post_hook=broken_hook,
+    )
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(state.run_break(routine))
+
+    assert state.stress_level == pytest.approx(50, abs=0.1)
+    assert state.boss_alert_level == 0
+    assert state.commit_seq == 0
+
+
+def test_delay_scheduler_queues_calls_beyond_limit() -> None:
+    from src.chillmcp.clock import VirtualClock
+    from src.chillmcp.scheduler import DelayScheduler
+
+    clock = VirtualClock()
+    scheduler = DelayScheduler(max_active=1, time_fn=clock.time, sleep_fn=clock.sleep)
+
+    async def scenario() -> None:
+        await asyncio.gather(*(scheduler.delay(20) for _ in range(3)))
+
+    asyncio.run(scenario())
+
+    stats = scheduler.stats()
+    assert clock.time() == pytest.approx(60.0)
+    assert stats["completed"] == 3
+    assert stats["peak_active"] == 1
+    assert stats["peak_queued"] == 2
+    assert stats["active"] == 0 and stats["pending_timers"] == 0
+
+
+def test_cancelled_queued_call_survives_slot_release_before_resuming() -> None:
+    from src.chillmcp.scheduler import DelayScheduler
+
+    scheduler = DelayScheduler(max_active=1)
+
+    async def scenario() -> None:
+        scheduler._take_slot()
+        queued = asyncio.ensure_future(scheduler.delay(20))
+        await asyncio.sleep(0)
+        assert scheduler.stats()["queued"] == 1
+        # 취소된 호출이 깨어나기 전에 앞선 호출이 슬롯을 반납한다.
+        queued.cancel()
+        scheduler._release_slot()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+    asyncio.run(scenario())
+
+    stats = scheduler.stats()
+    assert stats["active"] == 0 and stats["queued"] == 0
+    assert stats["cancelled"] == 1
+
+
+def test_delay_scheduler_rejects_when_full() -> None:
+    from src.chillmcp.clock import ScaledClock
+    from src.chillmcp.scheduler import DelayRejected
+
+    server = main.create_server(
+        boss_alertness=0,
+        max_delayed_calls=2,
+        delay_overflow="reject",
+        clock=ScaledClock(400),
+    )
+    state = server.state
+    state.boss_alert_level = state.max_boss_alert
+
+    async def scenario() -> list:
+        return await asyncio.gather(
+            *(state.run_break(_fixed_routine()) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    outcomes = asyncio.run(scenario())
+
+    rejected = [item for item in outcomes if isinstance(item, DelayRejected)]
+    assert len(rejected) == 1
+    assert state.commit_seq == 2
+    assert server.delay_scheduler.stats()["rejected"] == 1
+
+
+def _fixed_routine():
+    from src.chillmcp.state import BreakRoutine, RoutineScenario
+
+    return BreakRoutine(name="fixed", scenarios=(RoutineScenario("휴식", (5, 5)),))
+
+
+def test_cancelled_delayed_call_releases_slot_and_keeps_state() -> None:
+    server = main.create_server(boss_alertness=100)
+    state = server.state
+    state.boss_alert_level = state.max_boss_alert
+    stress_before = state.stress_level
+
+    async def scenario() -> None:
+        async with Client(server.mcp) as client:
+            with pytest.raises(Exception):
+                await client.call_tool("take_a_break", timeout=0.2)
+            for _ in range(50):
+                if server.cancelled_calls:
+                    break
+                await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+
+    stats = server.delay_scheduler.stats()
+    assert server.cancelled_calls == 1
+    assert stats["cancelled"] == 1
+    assert stats["active"] == 0 and stats["pending_timers"] == 0
+    assert state.commit_seq == 0
+    assert state.boss_alert_level == state.max_boss_alert
+    assert state.stress_level == stress_before
+
+
+def test_compiled_scenarios_match_slot_rendering() -> None:
+    from src.chillmcp.routines import ROUTINES
+    from src.chillmcp.state import ChillState
+
+    for routine in ROUTINES:
+        for scenario in routine.scenarios:
+            compiled_state = ChillState(rng_seed=7)
+            legacy_state = ChillState(rng_seed=7)
+            compiled = " | ".join(scenario.render_summary_parts(compiled_state))
+            legacy = " | ".join(
+                part.replace(":", " -")
+                for part in (scenario.headline, *scenario.render_details(legacy_state))
+            )
+            assert compiled == legacy
+            assert ":" not in compiled
+            assert compiled_state.rng.getstate() == legacy_state.rng.getstate()
+
+
+def _write_catalog(path, name: str, headline: str) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "routines": [
+                    {
+                        "name": name,
+                        "description": f"{name} 루틴",
+                        "scenarios": [
+                            {
+                                "headline": headline,
+                                "stress_reduction": [5, 5],
+                                "details": [
+                                    "Tea Log: 80℃",
+                                    {"choice": ["Snack: 양갱", "Snack: 약과"]},
+                                    {"template": "Refill: {}잔", "randint": [1, 3]},
+                                ],
+                            }
+                        ],
+                    }
+                ]
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_routine_catalog_hot_reload_swaps_tools_and_keeps_state(tmp_path) -> None:
+    catalog_path = tmp_path / "routines.json"
+    _write_catalog(catalog_path, "tea_time", "녹차를 우렸다.")
+    server = main.create_server(
+        boss_alertness=0, routine_catalog=catalog_path, catalog_reload_interval=0
+    )
+
+    async def scenario() -> tuple[set[str], str, set[str]]:
+        async with Client(server.mcp) as client:
+            before = {tool.name for tool in await client.list_tools()}
+            result = await client.call_tool("tea_time")
+            _write_catalog(catalog_path, "nap_time", "책상에서 10분 졸았다.")
+            after = {tool.name for tool in await client.list_tools()}
+            with pytest.raises(Exception):
+                await client.call_tool("tea_time")
+            await client.call_tool("nap_time")
+            return before, result.content[0].text, after
+
+    before, text, after = asyncio.run(scenario())
+
+    assert {"take_a_break", "tea_time"} <= before
+    assert "Snack - " in text and "Tea Log - 80℃" in text
+    assert "nap_time" in after and "tea_time" not in after
+    assert "take_a_break" in after
+    assert server.catalog.version == 1
+    assert server.state.commit_seq == 2
+
+
+def test_catalog_rejects_routines_named_after_builtin_tools(tmp_path) -> None:
+    from src.chillmcp.catalog import RESERVED_TOOL_NAMES, CatalogError
+    from src.chillmcp.clock import VirtualClock
+
+    catalog_path = tmp_path / "routines.json"
+    _write_catalog(catalog_path, "get_status", "상태를 훔쳐본다.")
+    with pytest.raises(CatalogError, match="get_status"):
+        main.create_server(routine_catalog=catalog_path)
+
+    server = main.create_server(
+        clock=VirtualClock(), history_path=tmp_path / "history.db"
+    )
+
+    async def tool_names() -> set[str]:
+        async with Client(server.mcp) as client:
+            return {tool.name for tool in await client.list_tools()}
+
+    builtin = asyncio.run(tool_names()) - set(server.catalog.snapshot())
+    server.history.close()
+    assert builtin == RESERVED_TOOL_NAMES
+
+
+def test_invalid_catalog_reload_keeps_previous_snapshot(tmp_path) -> None:
+    from src.chillmcp.catalog import CatalogError, RoutineCatalog
+
+    catalog_path = tmp_path / "routines.toml"
+    catalog_path.write_text(
+        '[[routines]]\nname = "tea_time"\n\n[[routines.scenarios]]\n'
+        'headline = "녹차"\nstress_reduction = [1, 2]\n',
+        encoding="utf-8",
+    )
+    catalog = RoutineCatalog(catalog_path, reload_interval=0)
+    assert catalog.get("tea_time") is not None
+
+    catalog_path.write_text('[[routines]]\nname = "broken"\n', encoding="utf-8")
+    assert catalog.maybe_reload() is False
+    assert catalog.reload_errors == 1
+    assert catalog.get("tea_time") is not None
+
+    with pytest.raises(CatalogError):
+        RoutineCatalog(catalog_path)
+
+
+def test_async_logging_never_blocks_and_counts_drops() -> None:
+    import io
+    import logging
+    import threading
+
+    from src.chillmcp.logging_pipeline import configure_logging
+    from src.chillmcp.state import ChillState
+
+    class BlockedStream(io.StringIO):
+        def __init__(self) -> None:
+            super().__init__()
+            self.released = threading.Event()
+
+        def write(self, text: str) -> int:
+            self.released.wait()
+            return super().write(text)
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    stream = BlockedStream()
+    pipeline = configure_logging(
+        mode="async", fmt="json", sample_rate=0.5, queue_size=4, stream=stream
+    )
+    try:
+        state = ChillState(boss_alertness=0, rng_seed=1)
+        started = time.perf_counter()
+        routine = _fixed_routine()
+
+        async def run_breaks() -> None:
+            for _ in range(20):
+                await state.perform_break(routine)
+
+        asyncio.run(run_breaks())
+        assert time.perf_counter() - started < 2.0
+        stats = pipeline.stats()
+        assert stats["dropped"] > 0
+        assert stats["sampled_out"] == 20
+    finally:
+        stream.released.set()
+        pipeline.stop()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    state_records = [r for r in records if r.get("event", "").startswith("state_")]
+    assert state_records
+    assert all(r["commit_seq"] % 2 == 0 for r in state_records)
+    assert {"tool", "stress_level", "boss_alert_level"} <= set(state_records[0])
+
+
+def test_metrics_cover_every_routine_and_export(tmp_path) -> None:
+    from fastmcp.exceptions import ToolError
+
+    from src.chillmcp.metrics import PrometheusFileExporter
+    from src.chillmcp.routines import ROUTINES
+
+    server = main.create_server(boss_alertness=100, rng_seed=3)
+
+    async def scenario() -> dict:
+        async with Client(server.mcp) as client:
+            await client.call_tool("take_a_break")
+            await client.call_tool("take_a_break")
+            await client.call_tool("show_meme")
+            resource = await client.read_resource("chillmcp://metrics")
+            prometheus = await client.call_tool(
+                "get_metrics", {"output_format": "prometheus"}
+            )
+            with pytest.raises(ToolError):
+                await client.call_tool("get_metrics", {"output_format": "xml"})
+            return json.loads(resource[0].text), prometheus.content[0].text
+
+    snapshot, prometheus = asyncio.run(scenario())
+
+    assert {routine.name for routine in ROUTINES} <= set(snapshot["tools"])
+    take = snapshot["tools"]["take_a_break"]
+    assert take["calls"] == 2
+    assert take["boss_noticed"] == 2
+    assert sum(take["scenarios"].values()) == 2
+    assert take["rng_draws"] >= 2 * 3
+    assert take["latency_seconds"]["count"] == 2
+    assert take["response_bytes"]["buckets"]["+Inf"] == 2
+    assert snapshot["tools"]["deep_thinking"]["calls"] == 0
+    assert snapshot["delay_scheduler"]["completed"] == 0
+    assert 'chillmcp_tool_calls_total{tool="take_a_break"} 2' in prometheus
+
+    path = tmp_path / "chillmcp.prom"
+    PrometheusFileExporter(server.metrics, path, interval=60).write_once()
+    text = path.read_text(encoding="utf-8")
+    assert 'chillmcp_tool_calls_total{tool="show_meme"} 1' in text
+    assert 'chillmcp_tool_latency_seconds_count{tool="take_a_break"} 2' in text
+    assert "chillmcp_delay_scheduler_active 0" in text
+
+
+def test_http_transport_serves_concurrent_clients_without_per_request_state() -> None:
+    import socket
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "main.py",
+            "--transport",
+            "http",
+            "--port",
+            str(port),
+            "--boss_alertness",
+            "100",
+            "--max-connections",
+            "64",
+            "--session-isolation",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.time() + 15
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.time() > deadline or process.poll() is not None:
+                    raise
+                time.sleep(0.1)
+
+        async def agent(name: str) -> list[str]:
+            async with Client(f"http://127.0.0.1:{port}/mcp") as client:
+                levels = []
+                for _ in range(2):
+                    result = await client.call_tool(
+                        "take_a_break", meta={"client_id": name}
+                    )
+                    text = json.loads(result.content[0].text)["content"][0]["text"]
+                    levels.append(text.splitlines()[-1])
+                return levels
+
+        async def scenario() -> list[list[str]]:
+            return await asyncio.gather(*(agent(f"agent-{i}") for i in range(2)))
+
+        results = asyncio.run(scenario())
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+    # 무상태 HTTP 요청에는 연결 식별자가 없고 client_id도 믿지 않으므로, 요청마다
+    # 새 상태가 생기지 않고 모든 호출이 기본 상태 하나에 차례로 커밋된다.
+    levels = sorted(level for agent_levels in results for level in agent_levels)
+    assert levels == [f"Boss Alert Level: {level}" for level in (1, 2, 3, 4)]
+
+
+def test_run_break_plan_applies_steps_in_one_request() -> None:
+    server = main.create_server(boss_alertness=100, rng_seed=5)
+    plan = ["take_a_break", "show_meme", "coffee_mission"]
+
+    async def scenario() -> str:
+        async with Client(server.mcp) as client:
+            with pytest.raises(Exception):
+                await client.call_tool(
+                    "run_break_plan", {"routines": ["take_a_break", "nope"]}
+                )
+            result = await client.call_tool("run_break_plan", {"routines": plan})
+            return json.loads(result.content[0].text)["content"][0]["text"]
+
+    text = asyncio.run(scenario())
+    lines = text.splitlines()
+
+    assert [line.split(" | ")[0] for line in lines[:3]] == [
+        f"Step {index} - {name}" for index, name in enumerate(plan, start=1)
+    ]
+    assert lines[3].startswith("Break Summary: 3개 루틴")
+    assert sum(line.startswith("Stress Level:") for line in lines) == 1
+    assert lines[-1] == "Boss Alert Level: 3"
+    assert server.state.boss_alert_level == 3
+    assert server.state.commit_seq == 1
+    assert server.metrics.tool("run_break_plan").calls == 1
+    assert server.metrics.tool("show_meme").boss_noticed == 1
+
+
+def test_run_break_plan_rolls_back_every_step_on_failure() -> None:
+    from src.chillmcp.state import BreakRoutine, ChillState, RoutineScenario
+
+    def explode(target) -> None:
+        # 지연 예측용 임시 상태에서는 통과시켜 실제 커밋 도중에 실패하게 한다.
+        if target is state:
+            raise RuntimeError("boom")
+
+    state = ChillState(boss_alertness=100, rng_seed=1)
+    failing = BreakRoutine(
+        name="failing",
+        scenarios=(RoutineScenario("실패", (1, 1)),),
+        post_hook=explode,
+    )
+    before = (state.stress_level, state.boss_alert_level, state.commit_seq)
+    rng_before = state.rng.getstate()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(state.run_break_plan([_fixed_routine(), failing]))
+
+    assert (state.stress_level, state.boss_alert_level, state.commit_seq) == before
+    assert state.rng.getstate() == rng_before
+
+
+def test_run_break_plan_waits_before_locking_without_exposing_steps() -> None:
+    from src.chillmcp.state import ChillState
+
+    sleeps: list[float] = []
+
+    async def scenario() -> tuple:
+        gate = asyncio.Event()
+
+        async def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            await gate.wait()
+
+        state = ChillState(boss_alertness=100, rng_seed=1, sleep_fn=sleep)
+        state.boss_alert_level = state.max_boss_alert - 1
+        plan = asyncio.ensure_future(state.run_break_plan([_fixed_routine()] * 3))
+        await asyncio.sleep(0)
+        # 계획이 지연을 기다리는 동안 상태는 그대로이고 잠금도 비어 있다.
+        mid_plan = state.status()
+        single = await asyncio.wait_for(state.run_break(_fixed_routine()), 1)
+        gate.set()
+        return mid_plan, single, await plan, state
+
+    mid_plan, single, plan, state = asyncio.run(scenario())
+
+    # 1단계 뒤 경보가 최고 단계가 되어 2·3단계에 20초씩, 잠금 밖에서 한 번에 기다린다.
+    assert sleeps == [40.0]
+    assert mid_plan["commit_seq"] == 0
+    assert mid_plan["boss_alert_level"] == state.max_boss_alert - 1
+    assert single.commit_seq == 1 and single.delay_seconds == 0
+    assert [step.delay_seconds for step in plan.steps] == [0.0, 20.0, 20.0]
+    assert plan.delay_seconds == 40.0
+    assert state.commit_seq == 2
+
+
+def test_cli_parsing_does_not_import_fastmcp() -> None:
+    code = (
+        "import sys, main\n"
+        "args = main.parse_args(['--boss_alertness', '10'])\n"
+        "assert args.boss_alertness == 10\n"
+        "from src.chillmcp.routines import ROUTINES\n"
+        "assert 'compiled' not in vars(ROUTINES[0].scenarios[0])\n"
+        "print('fastmcp' in sys.modules)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == "False"
+
+
+def test_evaluator_client_is_ready_after_initialize_without_sleeping() -> None:
+    from evaluation import chillmcp_evaluator as evaluator
+
+    started = time.monotonic()
+    with evaluator.MCPClient(boss_alertness=0, rng_seed=1) as client:
+        client.initialize()
+        text = client.call_tool("coffee_mission")
+    assert time.monotonic() - started < evaluator.READY_TIMEOUT
+    assert "\nStress Level: " in text
+    assert text.endswith("Boss Alert Level: 0")
+
+
+def test_evaluator_runs_checks_concurrently_in_declared_order(monkeypatch) -> None:
+    from evaluation import chillmcp_evaluator as evaluator
+
+    def make_check(name: str, delay: float) -> evaluator.Check:
+        def run() -> evaluator.EvaluationResult:
+            time.sleep(delay)
+            if name == "boom":
+                raise RuntimeError("kaboom")
+            return evaluator.EvaluationResult(name=name, passed=True, detail="")
+
+        return evaluator.Check(name, run, expected_seconds=delay)
+
+    checks = [
+        make_check("fast", 0.05),
+        make_check("slow", 0.3),
+        make_check("boom", 0.3),
+    ]
+    monkeypatch.setattr(evaluator, "CHECKS", checks)
+
+    started = time.monotonic()
+    results = evaluator.evaluate(max_workers=3)
+    assert time.monotonic() - started < 0.6
+    assert [res.name for res in results] == ["fast", "slow", "boom"]
+    assert [res.passed for res in results] == [True, True, False]
+    assert "kaboom" in results[2].detail
+
+
+def test_async_evaluator_client_pipelines_requests_and_bounds_stderr() -> None:
+    from evaluation import chillmcp_evaluator as evaluator
+
+    async def scenario() -> None:
+        client = await evaluator.AsyncMCPClient.start(
+            boss_alertness=100,
+            boss_alertness_cooldown=9999,
+            rng_seed=3,
+            stderr_lines=4,
+        )
+        async with client:
+            await client.initialize()
+            texts = await asyncio.gather(
+                *(client.call_tool("take_a_break") for _ in range(5))
+            )
+            alerts = sorted(
+                int(text.rsplit("Boss Alert Level: ", 1)[1]) for text in texts
+            )
+            assert alerts == [1, 2, 3, 4, 5]
+            assert len(client.stderr_tail) == 4
+
+            # 최고 경보에서 20초 지연되는 호출은 마감 시간에 걸려야 한다.
+            with pytest.raises(TimeoutError):
+                await client.call_tool("coffee_mission", timeout=0.5)
+            tools = await client.list_tools()
+            assert tools["result"]["tools"]
+
+    asyncio.run(asyncio.wait_for(scenario(), 30))
+
+
+def test_tool_benchmark_measures_in_process_and_flags_regressions() -> None:
+    from benchmarks import bench_tools
+
+    result = asyncio.run(
+        bench_tools.measure("inprocess", calls=40, warmup=1, concurrency=2, seed=1)
+    )
+    assert result["calls"] == 40
+    assert result["calls_per_sec"] > 0
+    assert result["p50_ms"] <= result["p99_ms"] <= result["p999_ms"] <= result["max_ms"]
+    assert result["sessions"] is None
+
+    isolated = asyncio.run(
+        bench_tools.measure(
+            "inprocess",
+            calls=20,
+            warmup=1,
+            concurrency=2,
+            seed=1,
+            session_isolation=True,
+        )
+    )
+    # 연결 하나의 호출은 세션 하나에 모여야 RSS 증가량이 누수를 재지 않는다.
+    assert isolated["sessions"] == 1
+
+    baseline = {"inprocess": {**result, "calls_per_sec": result["calls_per_sec"] * 2}}
+    assert bench_tools.compare({"inprocess": result}, baseline, 0.2) == [
+        f"inprocess.calls_per_sec: {result['calls_per_sec'] * 2:.2f} -> "
+        f"{result['calls_per_sec']:.2f} (-50.0%)"
+    ]
+    assert bench_tools.compare({"inprocess": result}, {"inprocess": result}, 0.2) == []
+
+
+def test_routine_tools_return_structured_content_matching_text() -> None:
+    from src.chillmcp.server import BREAK_RESULT_SCHEMA
+
+    server = main.create_server(boss_alertness=100, rng_seed=11)
+
+    async def scenario() -> None:
+        async with Client(server.mcp) as client:
+            tools = {tool.name: tool for tool in await client.list_tools()}
+            assert tools["coffee_mission"].output_schema == BREAK_RESULT_SCHEMA
+            assert tools["run_break_plan"].output_schema["properties"]["steps"]
+
+            for name in ("take_a_break", "coffee_mission", "emergency_clockout"):
+                result = await client.call_tool(name)
+                text = json.loads(result.content[0].text)["content"][0]["text"]
+                data = result.structured_content
+                assert data["routine"] == name
+                assert text == (
+                    f"Break Summary: {data['summary']}\n"
+                    f"Stress Level: {data['stress_level']}\n"
+                    f"Boss Alert Level: {data['boss_alert_level']}"
+                )
+                assert data["delay_seconds"] == 0
+
+            plan = await client.call_tool(
+                "run_break_plan", {"routines": ["show_meme", "watch_netflix"]}
+            )
+            steps = plan.structured_content["steps"]
+            assert [step["routine"] for step in steps] == ["show_meme", "watch_netflix"]
+            assert plan.structured_content["stress_reduction"] == sum(
+                step["stress_reduction"] for step in steps
+            )
+
+    asyncio.run(scenario())
+
+
+def test_stress_reduction_reports_change_applied_after_clamp_and_hooks() -> None:
+    from src.chillmcp.clock import VirtualClock
+    from src.chillmcp.routines import ROUTINES
+    from src.chillmcp.state import ChillState
+
+    routines = {routine.name: routine for routine in ROUTINES}
+    clock = VirtualClock()
+    state = ChillState(
+        boss_alertness=0, rng_seed=1, time_fn=clock.time, sleep_fn=clock.sleep
+    )
+
+    async def run(name: str, stress: float) -> dict:
+        state.stress_level = stress
+        outcome = await state.run_break(routines[name])
+        return outcome.structured_content()
+
+    low = asyncio.run(run("take_a_break", 3))
+    clockout = asyncio.run(run("emergency_clockout", 90))
+    dinner = asyncio.run(run("company_dinner", 1))
+
+    # 뽑은 감소량이 아니라 0 하한과 후처리 훅을 거친 실제 변화량이다.
+    assert (low["stress_level"], low["stress_reduction"]) == (0, 3)
+    assert (clockout["stress_level"], clockout["stress_reduction"]) == (0, 90)
+    assert (dinner["stress_level"], dinner["stress_reduction"]) == (3, -2)
+
+
+def test_output_profiles_trim_summary_but_keep_numbers_identical() -> None:
+    async def run(profile: str, override: str | None = None) -> list[str]:
+        server = main.create_server(
+            boss_alertness=60, rng_seed=21, output_profile=profile
+        )
+        arguments = {"output_profile": override} if override else {}
+        texts = []
+        async with Client(server.mcp) as client:
+            for name in ("coffee_mission", "show_meme", "take_a_break"):
+                result = await client.call_tool(name, arguments)
+                texts.append(json.loads(result.content[0].text)["content"][0]["text"])
+            plan = await client.call_tool(
+                "run_break_plan", {"routines": ["show_meme"], **arguments}
+            )
+            texts.append(json.loads(plan.content[0].text)["content"][0]["text"])
+        return texts
+
+    full = asyncio.run(run("full"))
+    compact = asyncio.run(run("compact"))
+    numeric = asyncio.run(run("full", override="numeric"))
+
+    for full_text, compact_text, numeric_text in zip(full, compact, numeric):
+        numbers = full_text.splitlines()[-2:]
+        assert compact_text.splitlines()[-2:] == numbers
+        assert numeric_text.splitlines()[-2:] == numbers
+        assert len(compact_text) < len(full_text)
+        assert "Break Summary" not in numeric_text
+    assert numeric[0] == "\n".join(full[0].splitlines()[-2:])
+    assert compact[0].startswith("Break Summary: ")
+    assert compact[0].count(" | ") <= 1
+
+    with pytest.raises(ValueError):
+        main.create_server(output_profile="verbose")
+
+
+def test_idempotency_key_replays_result_without_touching_state() -> None:
+    from fastmcp.exceptions import ToolError
+
+    server = main.create_server(boss_alertness=0, rng_seed=5)
+    state = server.state
+    state.boss_alert_level = state.max_boss_alert
+    gate = asyncio.Event()
+    sleeps: list[float] = []
+
+    async def gated_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        await gate.wait()
+
+    state.delay_scheduler = None
+    state.sleep_fn = gated_sleep
+
+    async def scenario() -> tuple[list[str], str, str]:
+        async with Client(server.mcp) as client:
+            first = asyncio.create_task(
+                client.call_tool("take_a_break", {"idempotency_key": "retry-1"})
+            )
+            while not sleeps:
+                await asyncio.sleep(0.01)
+            # 원래 호출이 20초 지연 중일 때 들어온 재시도는 같은 결과를 기다린다.
+            retry = asyncio.create_task(
+                client.call_tool("take_a_break", {"idempotency_key": "retry-1"})
+            )
+            await asyncio.sleep(0.05)
+            gate.set()
+            results = await asyncio.gather(first, retry)
+            later = await client.call_tool(
+                "take_a_break", {"idempotency_key": "retry-1"}
+            )
+            with pytest.raises(ToolError, match="idempotency_key"):
+                await client.call_tool("show_meme", {"idempotency_key": "retry-1"})
+            fresh = await client.call_tool("take_a_break")
+            return (
+                [result.content[0].text for result in results],
+                later.content[0].text,
+                fresh.content[0].text,
+            )
+
+    (first_text, retry_text), later_text, fresh_text = asyncio.run(scenario())
+
+    assert first_text == retry_text == later_text
+    assert fresh_text != first_text
+    # 원래 호출과 키 없는 새 호출만 지연을 기다리고, 재시도는 기다리지 않는다.
+    assert sleeps == [20.0, 20.0]
+    assert state.commit_seq == 2
+    stats = server.idempotency.stats()
+    assert (stats["stored"], stats["joined"], stats["hits"], stats["conflicts"]) == (
+        1,
+        1,
+        1,
+        1,
+    )
+
+
+def test_idempotency_key_is_scoped_to_connection_under_isolation() -> None:
+    from fastmcp.exceptions import ToolError
+
+    server = main.create_server(boss_alertness=0, rng_seed=5, session_isolation=True)
+
+    async def scenario() -> tuple[list[str], str]:
+        async with Client(server.mcp) as client, Client(server.mcp) as other:
+            texts = []
+            for _ in range(2):
+                result = await client.call_tool(
+                    "take_a_break",
+                    {"idempotency_key": "retry-1", "deadline_seconds": 30},
+                )
+                texts.append(result.content[0].text)
+            with pytest.raises(ToolError, match="다른 도구나 인자"):
+                await client.call_tool(
+                    "take_a_break",
+                    {"idempotency_key": "retry-1", "deadline_seconds": 5},
+                )
+            await client.call_tool(
+                "run_break_plan",
+                {"routines": ["show_meme"], "idempotency_key": "plan-1"},
+            )
+            with pytest.raises(ToolError, match="다른 도구나 인자"):
+                await client.call_tool(
+                    "run_break_plan",
+                    {
+                        "routines": ["show_meme"],
+                        "idempotency_key": "plan-1",
+                        "no_wait": True,
+                    },
+                )
+            # 다른 연결은 같은 키를 써도 자기 상태에 새로 커밋한다.
+            fresh = await other.call_tool(
+                "take_a_break", {"idempotency_key": "retry-1"}
+            )
+            return texts, fresh.content[0].text
+
+    texts, fresh = asyncio.run(scenario())
+
+    assert texts[0] == texts[1]
+    assert "Boss Alert Level" in fresh
+    assert server.state.commit_seq == 0
+    assert sorted(state.commit_seq for _, state in server._states()) == [0, 1, 2]
+    stats = server.idempotency.stats()
+    assert (stats["stored"], stats["hits"], stats["conflicts"]) == (3, 1, 2)
+
+
+def test_idempotency_cache_expires_and_evicts_entries() -> None:
+    from src.chillmcp.idempotency import IdempotencyCache
+
+    now = {"value": 0.0}
+    cache: IdempotencyCache[int] = IdempotencyCache(
+        ttl_seconds=10, max_entries=2, time_fn=lambda: now["value"]
+    )
+    calls: list[str] = []
+
+    async def call(key: str) -> tuple[int, bool]:
+        async def work() -> int:
+            calls.append(key)
+            return len(calls)
+
+        return await cache.run(key, "fp", work)
+
+    async def scenario() -> None:
+        assert await call("a") == (1, False)
+        assert await call("a") == (1, True)
+        await call("b")
+        await call("c")  # 용량 2를 넘으므로 LRU인 "a"가 축출된다.
+        assert await call("a") == (4, False)
+        now["value"] = 11
+        assert await call("c") == (5, False)
+
+    asyncio.run(scenario())
+    assert cache.stats()["evicted"] == 2
+    assert cache.stats()["expired"] == 2
+
+
+def test_deadline_aware_calls_return_retry_after_instead_of_sleeping() -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    clock = VirtualClock()
+    server = main.create_server(
+        boss_alertness=0, boss_alertness_cooldown=30, clock=clock, rng_seed=2
+    )
+    state = server.state
+    state.boss_alert_level = state.max_boss_alert
+
+    async def scenario() -> list:
+        async with Client(server.mcp) as client:
+            clock.advance(12)
+            deferred = await client.call_tool(
+                "take_a_break", {"no_wait": True}, raise_on_error=False
+            )
+            short = await client.call_tool(
+                "take_a_break", {"deadline_seconds": 19.5}, raise_on_error=False
+            )
+            roomy = await client.call_tool("take_a_break", {"deadline_seconds": 25})
+            clock.advance(30)
+            after = await client.call_tool("show_meme", {"no_wait": True})
+            return [deferred, short, roomy, after]
+
+    deferred, short, roomy, after = asyncio.run(scenario())
+
+    assert deferred.is_error and short.is_error
+    assert deferred.structured_content == {
+        "routine": "take_a_break",
+        "deferred": True,
+        "required_delay_seconds": 20.0,
+        "retry_after_seconds": 18.0,
+        "stress_level": 52,
+        "boss_alert_level": 5,
+    }
+    text = json.loads(deferred.content[0].text)["content"][0]["text"]
+    assert text.splitlines()[1:] == ["Stress Level: 52", "Boss Alert Level: 5"]
+    # 미룬 호출은 상태를 바꾸지 않고, 여유 있는 호출만 20초 지연 후 커밋된다.
+    assert roomy.structured_content["delay_seconds"] == 20.0
+    assert after.structured_content["delay_seconds"] == 0.0
+    assert state.commit_seq == 2
+    assert server.metrics.snapshot()["tools"]["take_a_break"]["errors"] == {
+        "deferred": 2
+    }
+
+
+def test_run_break_plan_defers_when_total_delay_misses_deadline() -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    clock = VirtualClock()
+    server = main.create_server(
+        boss_alertness=100, boss_alertness_cooldown=30, clock=clock, rng_seed=2
+    )
+    state = server.state
+    state.boss_alert_level = state.max_boss_alert - 1
+    plan = {"routines": ["take_a_break", "show_meme", "coffee_mission"]}
+
+    async def scenario() -> list:
+        async with Client(server.mcp) as client:
+            clock.advance(12)
+            deferred = await client.call_tool(
+                "run_break_plan", {**plan, "deadline_seconds": 30}, raise_on_error=False
+            )
+            waiting = await client.call_tool(
+                "run_break_plan", {**plan, "no_wait": True}, raise_on_error=False
+            )
+            roomy = await client.call_tool(
+                "run_break_plan", {**plan, "deadline_seconds": 40}
+            )
+            return [deferred, waiting, roomy]
+
+    deferred, waiting, roomy = asyncio.run(scenario())
+
+    # 1단계 뒤 경보가 최고 단계가 되어 2·3단계에 20초씩 모두 40초가 필요하다.
+    assert deferred.is_error and waiting.is_error
+    assert deferred.structured_content["routine"] == "run_break_plan"
+    assert deferred.structured_content["required_delay_seconds"] == 40.0
+    # 경보가 4→3으로 내려가면(18초 뒤) 3단계째에서야 최고 단계라 20초로 충분하다.
+    assert deferred.structured_content["retry_after_seconds"] == 18.0
+    # 지연 없이 끝나려면 경보가 2단계 이하여야 한다 (48초 뒤).
+    assert waiting.structured_content["retry_after_seconds"] == 48.0
+    assert roomy.structured_content["delay_seconds"] == 40.0
+    assert state.commit_seq == 1
+    assert server.metrics.snapshot()["tools"]["run_break_plan"]["errors"] == {
+        "deferred": 2
+    }
+
+
+def test_get_status_predicts_alert_decay_without_mutating_state() -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    clock = VirtualClock()
+    server = main.create_server(
+        boss_alertness=100, boss_alertness_cooldown=30, clock=clock, rng_seed=1
+    )
+    state = server.state
+
+    async def scenario() -> tuple[dict, list[dict]]:
+        async with Client(server.mcp) as client:
+            for _ in range(3):
+                last = await client.call_tool("take_a_break")
+            statuses = []
+            for advance in (40, 0, 60):
+                clock.advance(advance)
+                result = await client.call_tool("get_status")
+                statuses.append(result.structured_content)
+            return last.structured_content, statuses
+
+    last, statuses = asyncio.run(scenario())
+
+    assert last["boss_alert_level"] == 3
+    assert last["seconds_until_alert_decrement"] == 30.0
+    assert last["seconds_until_alert_zero"] == 90.0
+    assert statuses[0] == statuses[1]
+    assert statuses[0]["boss_alert_level"] == 2
+    assert statuses[0]["seconds_until_alert_decrement"] == 20.0
+    assert statuses[0]["seconds_until_alert_zero"] == 50.0
+    assert statuses[2]["boss_alert_level"] == 0
+    assert statuses[2]["seconds_until_alert_decrement"] is None
+    assert statuses[2]["seconds_until_alert_zero"] == 0.0
+    # get_status는 tick을 호출하지 않으므로 저장된 상태는 그대로다.
+    assert (state.boss_alert_level, state.commit_seq) == (3, 3)
+
+
+def test_get_status_reports_the_callers_isolated_state() -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    clock = VirtualClock()
+    server = main.create_server(
+        boss_alertness=100,
+        boss_alertness_cooldown=30,
+        clock=clock,
+        rng_seed=1,
+        session_isolation=True,
+    )
+
+    async def scenario() -> tuple[list[int], dict, dict]:
+        async with Client(server.mcp) as busy, Client(server.mcp) as idle:
+            levels = []
+            for _ in range(5):
+                await busy.call_tool("take_a_break")
+                status = await busy.call_tool("get_status")
+                levels.append(status.structured_content["boss_alert_level"])
+            mine = (await busy.call_tool("get_status")).structured_content
+            other = (await idle.call_tool("get_status")).structured_content
+            return levels, mine, other
+
+    levels, mine, other = asyncio.run(scenario())
+
+    # 호출마다 새 상태가 아니라 같은 연결의 상태를 보고하므로 경보가 쌓인다.
+    assert levels == [1, 2, 3, 4, 5]
+    assert mine["seconds_until_no_delay"] == 30.0
+    assert other["boss_alert_level"] == 0
+    assert other["seconds_until_no_delay"] == 0.0
+    assert server.state.commit_seq == 0
+
+
+def test_wait_until_safe_parks_waiters_on_shared_timer_heap() -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    clock = VirtualClock()
+    server = main.create_server(
+        boss_alertness=100, boss_alertness_cooldown=30, clock=clock, rng_seed=1
+    )
+    state = server.state
+
+    async def advance(client: Client, seconds: float) -> None:
+        await client.call_tool("advance_clock", {"seconds": seconds})
+
+    async def scenario() -> tuple[list, dict, dict, dict, float]:
+        async with Client(server.mcp) as client:
+            for _ in range(3):
+                await client.call_tool("take_a_break")
+            started = clock.time()
+            scheduled = server.delay_scheduler.scheduled
+            waits = asyncio.ensure_future(
+                asyncio.gather(
+                    *(
+                        state.wait_until_alert_at_most(level % 3, 120)
+                        for level in range(900)
+                    )
+                )
+            )
+            for _ in range(5):
+                await asyncio.sleep(0)
+            # 대기자는 공유 가상 시계를 스스로 빨리 감지 않는다.
+            parked_at = clock.time() - started
+            assert not waits.done()
+            await advance(client, 90)
+            outcomes = await waits
+            stats = server.delay_scheduler.stats()
+            stats["scheduled"] -= scheduled
+            assert clock.time() - started == 90
+
+            # 커밋이 일어나면 대기자는 예정보다 일찍 깨어나 다시 계산한다.
+            for _ in range(2):
+                await client.call_tool("take_a_break")
+            waiter = asyncio.ensure_future(
+                client.call_tool("wait_until_safe", {"max_level": 1, "timeout": 300})
+            )
+            await asyncio.sleep(0)
+            await client.call_tool("take_a_break")
+            for _ in range(2):
+                await asyncio.sleep(0.05)
+                assert not waiter.done()
+                await advance(client, 30)
+            waited = (await waiter).structured_content
+            timed_out = asyncio.ensure_future(
+                client.call_tool("wait_until_safe", {"max_level": 0, "timeout": 5})
+            )
+            await asyncio.sleep(0.05)
+            await advance(client, 5)
+            timed_out = await timed_out
+            return outcomes, stats, waited, timed_out.structured_content, parked_at
+
+    outcomes, stats, waited, timed_out, parked_at = asyncio.run(scenario())
+
+    assert parked_at == 0
+    assert all(reached for reached, _ in outcomes)
+    # 대기자마다 공유 힙의 타이머 항목 하나만 쓰고, 재무장은 없다.
+    assert stats["scheduled"] == 900
+    assert stats["pending_timers"] == 0
+    assert waited["reached"] is True
+    assert waited["boss_alert_level"] <= 1
+    assert timed_out["reached"] is False
+    assert timed_out["waited_seconds"] == 5.0
+    assert server.safe_waiters == 0
+
+
+def test_wait_until_safe_watches_the_callers_isolated_state() -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    clock = VirtualClock()
+    server = main.create_server(
+        boss_alertness=100,
+        boss_alertness_cooldown=30,
+        clock=clock,
+        rng_seed=1,
+        session_isolation=True,
+    )
+
+    async def scenario() -> tuple[dict, dict, dict]:
+        async with Client(server.mcp) as busy, Client(server.mcp) as idle:
+            for _ in range(3):
+                await busy.call_tool("take_a_break")
+            already = (
+                await idle.call_tool("wait_until_safe", {"max_level": 0, "timeout": 5})
+            ).structured_content
+            waiter = asyncio.ensure_future(
+                busy.call_tool("wait_until_safe", {"max_level": 1, "timeout": 120})
+            )
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            await busy.call_tool("advance_clock", {"seconds": 30})
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            await busy.call_tool("advance_clock", {"seconds": 30})
+            waited = (await waiter).structured_content
+            timed_out = asyncio.ensure_future(
+                busy.call_tool("wait_until_safe", {"max_level": 0, "timeout": 5})
+            )
+            await asyncio.sleep(0.05)
+            await busy.call_tool("advance_clock", {"seconds": 5})
+            return already, waited, (await timed_out).structured_content
+
+    already, waited, timed_out = asyncio.run(scenario())
+
+    assert (already["reached"], already["waited_seconds"]) == (True, 0.0)
+    assert waited["reached"] is True
+    assert (waited["boss_alert_level"], waited["waited_seconds"]) == (1, 60.0)
+    assert (timed_out["reached"], timed_out["boss_alert_level"]) == (False, 1)
+    assert server.safe_waiters == 0
+
+
+def test_state_resource_listen_stream_coalesces_updates() -> None:
+    from mcp.client.subscriptions import listen
+
+    server = main.create_server(boss_alertness=0, rng_seed=1, state_notify_interval=0.3)
+
+    async def scenario() -> tuple[list, dict]:
+        async with Client(server.mcp) as client:
+            async with listen(
+                client.session, resource_subscriptions=["chillmcp://state"]
+            ) as subscription:
+                for _ in range(10):
+                    await client.call_tool("take_a_break")
+                events = []
+
+                async def drain() -> None:
+                    async for event in subscription:
+                        events.append(event)
+
+                drainer = asyncio.ensure_future(drain())
+                await asyncio.sleep(0.8)
+                drainer.cancel()
+            contents = await client.read_resource("chillmcp://state")
+            return events, json.loads(contents[0].text)
+
+    events, state = asyncio.run(scenario())
+
+    stats = server.notifier.stats()
+    assert {event.uri for event in events} == {"chillmcp://state"}
+    # 10번의 커밋이 앞(leading)·뒤(trailing) 알림 몇 개로 묶인다.
+    assert 1 <= len(events) <= 3
+    assert stats["marked"] == 10
+    assert stats["coalesced"] >= 10 - 3
+    assert state["commit_seq"] == 10
+
+
+def test_state_resource_tracks_only_the_default_state_under_isolation() -> None:
+    from mcp.client.subscriptions import listen
+
+    from src.chillmcp.routines import ROUTINES
+
+    server = main.create_server(
+        boss_alertness=100,
+        rng_seed=1,
+        state_notify_interval=0.05,
+        session_isolation=True,
+    )
+
+    async def scenario() -> tuple[list, dict, dict]:
+        async with Client(server.mcp) as client:
+            async with listen(
+                client.session, resource_subscriptions=["chillmcp://state"]
+            ) as subscription:
+                for _ in range(3):
+                    await client.call_tool("take_a_break")
+                isolated = json.loads(
+                    (await client.read_resource("chillmcp://state"))[0].text
+                )
+                await server.state.run_break(ROUTINES[0])
+                events = []
+
+                async def drain() -> None:
+                    async for event in subscription:
+                        events.append(event)
+
+                drainer = asyncio.ensure_future(drain())
+                await asyncio.sleep(0.3)
+                drainer.cancel()
+            shared = json.loads(
+                (await client.read_resource("chillmcp://state"))[0].text
+            )
+            return events, isolated, shared
+
+    events, isolated, shared = asyncio.run(scenario())
+
+    # 세션 상태의 커밋은 알리지 않고, 기본 상태의 커밋만 알림과 읽기에 나타난다.
+    assert server.notifier.stats()["marked"] == 1
+    assert len(events) == 1
+    assert isolated["commit_seq"] == 0
+    assert (shared["commit_seq"], shared["boss_alert_level"]) == (1, 1)
+
+
+def test_state_notifier_fans_out_to_legacy_subscribers_once_per_flush() -> None:
+    from src.chillmcp.subscriptions import StateNotifier
+
+    class Observer:
+        def __init__(self, broken: bool = False) -> None:
+            self.broken = broken
+            self.updates: list[str] = []
+
+        async def send_resource_updated(self, uri: str) -> None:
+            if self.broken:
+                raise ConnectionError("closed")
+            self.updates.append(uri)
+
+    notifier = StateNotifier(min_interval=0.05)
+    observers = [Observer() for _ in range(200)]
+    broken = Observer(broken=True)
+    for index, observer in enumerate([*observers, broken]):
+        notifier.subscribe("chillmcp://state", index, observer)
+
+    async def scenario() -> None:
+        for _ in range(50):
+            notifier.mark_changed("chillmcp://state")
+        await asyncio.sleep(0.2)
+
+    asyncio.run(scenario())
+
+    assert {len(observer.updates) for observer in observers} == {1}
+    assert notifier.stats() == {
+        "subscribers": 200,
+        "pending": 0,
+        "marked": 50,
+        "coalesced": 49,
+        "flushes": 1,
+        "published": 0,
+        "sent": 200,
+        "failed": 1,
+    }
+
+
+def test_checkpoint_restores_state_and_rng_across_restart(tmp_path) -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    path = tmp_path / "state.json"
+    clock = VirtualClock()
+    server = main.create_server(
+        boss_alertness=100,
+        boss_alertness_cooldown=30,
+        clock=clock,
+        rng_seed=3,
+        checkpoint_path=path,
+    )
+
+    async def breaks(target) -> list[dict]:
+        async with Client(target.mcp) as client:
+            results = []
+            for _ in range(2):
+                result = await client.call_tool("take_a_break")
+                results.append(result.structured_content)
+            return results
+
+    asyncio.run(breaks(server))
+    clock.advance(10)
+    server.checkpointer.close()
+    before = server.state.status()
+
+    restarted_clock = VirtualClock()
+    restarted_clock.advance(500)
+    restarted = main.create_server(
+        boss_alertness=100,
+        boss_alertness_cooldown=30,
+        clock=restarted_clock,
+        rng_seed=3,
+        checkpoint_path=path,
+    )
+
+    # 가상 시계에서는 저장 당시의 경과 시간이 그대로 유지된다.
+    assert restarted.state.status() == before
+    assert before["boss_alert_level"] == 2
+    assert restarted.state.rng.getstate() == server.state.rng.getstate()
+    assert asyncio.run(breaks(restarted)) == asyncio.run(breaks(server))
+
+
+def test_checkpoint_keeps_only_client_states_a_restart_can_find(tmp_path) -> None:
+    from src.chillmcp.clock import VirtualClock
+
+    path = tmp_path / "state.json"
+
+    def make(clock: VirtualClock):
+        return main.create_server(
+            boss_alertness=100,
+            boss_alertness_cooldown=300,
+            clock=clock,
+            rng_seed=3,
+            checkpoint_path=path,
+            session_isolation=True,
+            trust_client_id=True,
+        )
+
+    server = make(VirtualClock())
+
+    async def before_restart() -> None:
+        async with Client(server.mcp) as agent, Client(server.mcp) as anonymous:
+            for _ in range(2):
+                await agent.call_tool("take_a_break", meta={"client_id": "agent-a"})
+            await anonymous.call_tool("take_a_break")
+
+    asyncio.run(before_restart())
+    server.checkpointer.close()
+    saved = json.loads(path.read_text(encoding="utf-8"))
+
+    restarted = make(VirtualClock())
+
+    async def after_restart() -> tuple[dict, dict]:
+        async with Client(restarted.mcp) as agent, Client(restarted.mcp) as fresh:
+            mine = await agent.call_tool("get_status", meta={"client_id": "agent-a"})
+            other = await fresh.call_tool("get_status")
+            return mine.structured_content, other.structured_content
+
+    mine, other = asyncio.run(after_restart())
+
+    # 연결 키 상태는 재시작 뒤 다시 찾을 수 없으므로 저장하지 않는다.
+    assert set(saved["states"]) == {"default", "client:agent-a"}
+    assert (mine["boss_alert_level"], mine["commit_seq"]) == (2, 2)
+    assert (other["boss_alert_level"], other["commit_seq"]) == (0, 0)
+
+
+def test_checkpoint_batches_commits_into_background_writes(tmp_path) -> None:
+    path = tmp_path / "state.json"
+    server = main.create_server(
+        boss_alertness=0,
+        rng_seed=1,
+        checkpoint_path=path,
+        checkpoint_interval=0.2,
+    )
+
+    async def scenario() -> None:
+        async with Client(server.mcp) as client:
+            for _ in range(20):
+                await client.call_tool("take_a_break")
+            await asyncio.sleep(0.5)
+
+    asyncio.run(scenario())
+    stats = server.checkpointer.stats()
+    document = json.loads(path.read_text(encoding="utf-8"))
+    server.checkpointer.close()
+
+    # 20번의 커밋이 간격당 한 번의 수집·쓰기로 묶인다.
+    assert stats["writes"] == stats["collected"]
+    assert 1 <= stats["writes"] <= 4
+    assert document["states"]["default"]["commit_seq"] == 20
+    assert document["clock_offset"] is not None
+    assert server.checkpointer.stats()["writes"] == stats["writes"] + 1
+
+
+def test_sigterm_writes_shutdown_checkpoint_and_history(tmp_path) -> None:
+    import signal
+    import sqlite3
+
+    checkpoint = tmp_path / "state.json"
+    history = tmp_path / "history.db"
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "main.py",
+            "--boss_alertness",
+            "0",
+            "--checkpoint-file",
+            str(checkpoint),
+            "--checkpoint-interval",
+            "600",
+            "--history-db",
+            str(history),
+            "--history-flush-interval",
+            "600",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+    def request(message: dict) -> dict | None:
+        process.stdin.write(json.dumps(message).encode() + b"\n")
+        process.stdin.flush()
+        if "id" not in message:
+            return None
+        ready, _, _ = select.select([process.stdout], [], [], 15)
+        assert ready, "server did not answer"
+        return json.loads(process.stdout.readline())
+
+    try:
+        request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2025-06-18",
+                    "capabilities": {},
+                    "clientInfo": {"name": "test", "version": "1"},
+                },
+            }
+        )
+        request({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        for call_id in (2, 3):
+            reply = request(
+                {
+                    "jsonrpc": "2.0",
+                    "id": call_id,
+                    "method": "tools/call",
+                    "params": {"name": "take_a_break", "arguments": {}},
+                }
+            )
+            assert reply["result"]["structuredContent"]["commit_seq"] == call_id - 1
+        # 주기 쓰기와 배치 커밋을 10분 뒤로 미뤄, 종료 시 기록만 남게 한다.
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=15) == 128 + signal.SIGTERM
+    finally:
+        if process.poll() is None:
+            process.kill()
+
+    document = json.loads(checkpoint.read_text(encoding="utf-8"))
+    assert document["states"]["default"]["commit_seq"] == 2
+    with sqlite3.connect(history) as connection:
+        (events,) = connection.execute("SELECT COUNT(*) FROM break_events").fetchone()
+    assert events == 2
+
+
+def test_checkpoint_without_clock_fields_is_ignored_at_startup(tmp_path) -> None:
+    path = tmp_path / "state.json"
+    path.write_text(
+        json.dumps({"version": 1, "states": {"default": {"commit_seq": 7}}}),
+        encoding="utf-8",
+    )
+
+    server = main.create_server(rng_seed=1, checkpoint_path=path)
+    server.checkpointer.close()
+
+    assert server.state.commit_seq == 0
+    assert json.loads(path.read_text(encoding="utf-8"))["clock_time"] is not None
+
+
+def test_break_history_records_events_and_serves_indexed_aggregates(tmp_path) -> None:
+    import sqlite3
+
+    path = tmp_path / "history.db"
+    server = main.create_server(boss_alertness=0, rng_seed=5, history_path=path)
+
+    async def scenario() -> tuple[list[dict], dict]:
+        async with Client(server.mcp) as client:
+            outcomes = []
+            for name in ("take_a_break", "coffee_mission", "take_a_break"):
+                result = await client.call_tool(name)
+                outcomes.append(result.structured_content)
+            plan = await client.call_tool(
+                "run_break_plan", {"routines": ["watch_netflix", "take_a_break"]}
+            )
+            outcomes.extend(plan.structured_content["steps"])
+            server.history.flush(timeout=5)
+            result = await client.call_tool(
+                "break_history_query", {"group_by": "routine", "order_by": "count"}
+            )
+            return outcomes, result.structured_content
+
+    outcomes, result = asyncio.run(scenario())
+
+    breaks = [outcome for outcome in outcomes if outcome["routine"] == "take_a_break"]
+    top = result["rows"][0]
+    assert (top["routine"], top["count"]) == ("take_a_break", 3)
+    assert top["total_reduction"] == sum(o["stress_reduction"] for o in breaks)
+    assert sum(row["count"] for row in result["rows"]) == 5
+    assert result["pending_events"] == 0
+    assert server.history.stats()["written"] == 5
+
+    # 집계는 롤업 기본 키나 시각 인덱스 범위 조회만 쓰고 테이블 전체를 훑지 않는다.
+    for group_by in ("routine", "day", "scenario", "session"):
+        plan = server.history.explain(group_by=group_by)
+        assert not any(step.startswith("SCAN") for step in plan), plan
+    server.history.close()
+
+    with sqlite3.connect(path) as connection:
+        with pytest.raises(sqlite3.IntegrityError):
+            connection.execute("DELETE FROM break_events")
+
+
+def test_break_history_rollup_keeps_max_of_negative_reductions(tmp_path) -> None:
+    from types import SimpleNamespace
+
+    from src.chillmcp.history import BreakHistory
+
+    history = BreakHistory(tmp_path / "history.db", wall_fn=lambda: 86400.0 * 20000)
+
+    def outcome(reduction: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            routine="hook_raises_stress",
+            scenario_index=0,
+            stress_reduction=reduction,
+            stress_level=60.0,
+            boss_alert_before=0,
+            boss_alert_level=0,
+            delay_seconds=0.0,
+            commit_seq=1,
+        )
+
+    # 첫 배치는 새 롤업 행을, 두 번째 배치는 기존 행 갱신(upsert)을 거친다.
+    for batch in ([-5, -3], [-4]):
+        history.record("default", [outcome(value) for value in batch])
+        assert history.flush(timeout=5)
+    try:
+        (row,) = history.query(group_by="routine", days=1)
+    finally:
+        history.close()
+
+    assert (row["count"], row["total_reduction"]) == (3, -12)
+    assert row["max_reduction"] == -3